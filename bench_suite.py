@@ -0,0 +1,373 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+BASELINE = os.path.join(ROOT, "bench_baseline.json")
+for exercise in ("ex0", "ex1", "ex2"):
+    sys.path.insert(0, os.path.join(ROOT, exercise))
+
+from data_stream import (  # noqa: E402
+    EventStream, SensorStream, StreamProcessor, TransactionStream,
+    record_key, record_value
+)
+from nexus_pipeline import (  # noqa: E402
+    CSVAdapter, InputStage, JSONAdapter, NexusManager, OutputStage,
+    StreamAdapter, TransformStage
+)
+from stream_processor import (  # noqa: E402
+    LogProcessor, NumericProcessor, TextProcessor
+)
+
+SCALES = {"small": 10_000, "medium": 100_000, "large": 1_000_000}
+Workload = Tuple[Callable[[], Any], int, Optional[Callable[[int], Any]]]
+
+
+class Generators():
+    def __init__(self, seed: int = 42) -> None:
+        self.random = random.Random(seed)
+        self.words = ["nexus", "stream", "sensor", "data", "pipeline",
+                      "quantum", "matrix", "signal", "vector", "code"]
+
+    def numbers(self, size: int) -> List[int]:
+        return ([self.random.randint(-1000, 1000) for _ in range(size)])
+
+    def text(self, size: int) -> List[str]:
+        choice = self.random.choice
+        return ([" ".join(choice(self.words) for _ in range(12))
+                 for _ in range(size)])
+
+    def log_lines(self, size: int) -> List[str]:
+        choice = self.random.choice
+        return ([f"{choice(['ERROR', 'INFO'])}: {choice(self.words)} "
+                 f"event {index}" for index in range(size)])
+
+    def sensor_records(self, size: int) -> List[str]:
+        keys = ["temp", "humidity", "pressure", "wind"]
+        uniform = self.random.uniform
+        choice = self.random.choice
+        return ([f"{choice(keys)}:{uniform(0, 100):.2f}"
+                 for _ in range(size)])
+
+    def transaction_records(self, size: int) -> List[str]:
+        choice = self.random.choice
+        randint = self.random.randint
+        return ([f"{choice(['buy', 'sell'])}:{randint(1, 500)}"
+                 for _ in range(size)])
+
+    def event_records(self, size: int) -> List[str]:
+        choice = self.random.choice
+        return ([choice(["login", "logout", "error"]) for _ in range(size)])
+
+    def json_inputs(self, size: int) -> List[str]:
+        randint = self.random.randint
+        return ([f'{{"sensor": "temp{index % 64}", '
+                 f'"value": {randint(0, 50)}.5, "unit": "C"}}'
+                 for index in range(size)])
+
+    def csv_inputs(self, size: int) -> List[str]:
+        return ([f"user{index % 64},action,timestamp,action"
+                 for index in range(size)])
+
+    def stream_inputs(self, size: int) -> List[List[int]]:
+        randint = self.random.randint
+        return ([[randint(0, 100) for _ in range(6)] for _ in range(size)])
+
+
+def pipeline(adapter: Any) -> NexusManager:
+    manager = NexusManager()
+    stages = manager.add_pipeline(adapter("bench"))
+    for stage in (InputStage(), TransformStage(), OutputStage()):
+        stages.add_stage(stage)
+    return (manager)
+
+
+def per_record(processor: Any, records: List[Any]) -> Workload:
+    process = processor.process
+
+    def run() -> None:
+        for data in records:
+            process(data)
+    return (run, len(records), lambda index: process(records[index]))
+
+
+def stream_batch(stream_class: Any, records: List[str]) -> Workload:
+    def run() -> None:
+        stream_class("BENCH").process_batch(records)
+    return (run, len(records), None)
+
+
+def processor_all(batches: List[List[str]]) -> Workload:
+    processor = StreamProcessor(["001", "002", "003"])
+
+    def run() -> None:
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor.process_all(batches)
+    return (run, sum(len(batch) for batch in batches), None)
+
+
+def stream_filters(records: List[str]) -> Workload:
+    stream = SensorStream("BENCH")
+    criteria = {f"alert{index}": (record_key == "temp")
+                & (record_value >= index * 3) for index in range(16)}
+    criteria["high"] = "High"
+
+    def run() -> None:
+        stream.count_many(records, criteria)
+    return (run, len(records), None)
+
+
+def manager_batch(manager: NexusManager, records: List[Any]) -> Workload:
+    def run() -> None:
+        manager.process_batch(records)
+    pipelines = manager.pipelines
+
+    def single(index: int) -> None:
+        data = records[index]
+        for stages in pipelines:
+            data = stages.process(data)
+    return (run, len(records), single)
+
+
+def compiled_batch(manager: NexusManager, records: List[Any]) -> Workload:
+    graph = manager.compile()
+    return (lambda: graph.process_many(records), len(records),
+            lambda index: graph.process(records[index]))
+
+
+def cases(size: int, seed: int) -> Dict[str, Callable[[], Workload]]:
+    data = Generators(seed)
+    numbers = data.numbers(size)
+    packed = array('q', numbers)
+    sensors = data.sensor_records(size)
+    transactions = data.transaction_records(size)
+    events = data.event_records(size)
+    json_inputs = data.json_inputs(size)
+    small = max(size // 10, 1)
+    return ({
+        "ex0.numeric.list": lambda: (
+            lambda: NumericProcessor().process(numbers), size, None),
+        "ex0.numeric.array": lambda: (
+            lambda: NumericProcessor().process(packed), size, None),
+        "ex0.text": lambda: per_record(TextProcessor(), data.text(small)),
+        "ex0.log": lambda: per_record(LogProcessor(),
+                                      data.log_lines(small)),
+        "ex1.sensor": lambda: stream_batch(SensorStream, sensors),
+        "ex1.transaction": lambda: stream_batch(TransactionStream,
+                                                transactions),
+        "ex1.event": lambda: stream_batch(EventStream, events),
+        "ex1.processor": lambda: processor_all(
+            [sensors, transactions, events]),
+        "ex1.filters": lambda: stream_filters(sensors),
+        "ex2.json": lambda: manager_batch(pipeline(JSONAdapter),
+                                          json_inputs),
+        "ex2.json.compiled": lambda: compiled_batch(pipeline(JSONAdapter),
+                                                    json_inputs),
+        "ex2.csv": lambda: manager_batch(pipeline(CSVAdapter),
+                                         data.csv_inputs(size)),
+        "ex2.stream": lambda: manager_batch(pipeline(StreamAdapter),
+                                            data.stream_inputs(small)),
+        })
+
+
+def latencies(single: Callable[[int], Any], count: int,
+              samples: int = 2000) -> Dict[str, float]:
+    timings = []
+    clock = time.perf_counter_ns
+    for index in range(min(samples, count)):
+        start = clock()
+        single(index)
+        timings.append(clock() - start)
+    timings.sort()
+    return ({
+        f"p{int(q * 100)}_us": timings[int(q * (len(timings) - 1))] / 1000
+        for q in (0.5, 0.9, 0.99)
+        })
+
+
+def sample(run: Callable[[], Any], repeat: int,
+           min_time: float) -> List[float]:
+    start = time.perf_counter()
+    run()
+    loops = max(1, math.ceil(min_time / (time.perf_counter() - start)))
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(loops):
+            run()
+        durations.append((time.perf_counter() - start) / loops)
+    return (durations)
+
+
+def calibrate(repeat: int = 5) -> float:
+    def loop() -> int:
+        total = 0
+        for index in range(200_000):
+            total += index * index % 7
+        return (total)
+    return (1 / statistics.median(sample(loop, repeat, 0.05)))
+
+
+def measure(workload: Callable[[], Workload], repeat: int,
+            min_time: float = 0.1) -> Dict[str, Any]:
+    run, records, single = workload()
+    speed = calibrate(3)
+    durations = sample(run, repeat, min_time)
+    seconds = min(durations)
+    tracemalloc.start()
+    try:
+        run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    result: Dict[str, Any] = {
+        "records": records,
+        "seconds": seconds,
+        "throughput": records / seconds if seconds else 0.0,
+        "median_seconds": statistics.median(durations),
+        "spread": (max(durations) - min(durations)) / seconds
+        if seconds else 0.0,
+        "peak_bytes": peak,
+        "calibration": speed,
+        }
+    if single is not None:
+        result.update(latencies(single, records))
+    return (result)
+
+
+def median_throughput(result: Dict[str, Any]) -> float:
+    seconds = result.get("median_seconds", result["seconds"])
+    return (result["records"] / seconds if seconds else 0.0)
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any],
+            tolerance: float, normalize: bool = True) -> List[str]:
+    failures = []
+    speed = 1.0
+    if normalize and baseline["meta"].get("calibration"):
+        speed = (results["meta"]["calibration"]
+                 / baseline["meta"]["calibration"])
+        print(f"  machine speed vs baseline: x{speed:.2f} "
+              "(throughput ratios are normalized by it, per case when "
+              "both runs recorded one)")
+    for name, current in results["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            print(f"  {name:20} new case, no baseline")
+            continue
+        ratio = median_throughput(current) / median_throughput(previous)
+        if normalize and previous.get("calibration"):
+            ratio /= current["calibration"] / previous["calibration"]
+        else:
+            ratio /= speed
+        noise = current.get("spread", 0.0) + previous.get("spread", 0.0)
+        threshold = max(tolerance, noise)
+        memory = current["peak_bytes"] / max(previous["peak_bytes"], 1)
+        status = "ok"
+        if ratio < 1 - threshold:
+            status = "SLOWER"
+            failures.append(f"{name}: median throughput x{ratio:.2f} "
+                            f"(allowed -{threshold:.0%})")
+        if memory > 1 + tolerance:
+            status = "MORE MEMORY" if status == "ok" else status + "+MEMORY"
+            failures.append(f"{name}: peak memory x{memory:.2f}")
+        allowed = f"(allowed -{threshold:.0%})"
+        print(f"  {name:20} throughput x{ratio:5.2f} {allowed:16} "
+              f"memory x{memory:5.2f}  {status}")
+    return (failures)
+
+
+def parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark ex0/ex1/ex2 and check for regressions.")
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--only", default="",
+                        help="run cases whose name starts with this prefix")
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--baseline",
+                        help="compare against a previous results file "
+                        "(default: bench_baseline.json at its scale)")
+    parser.add_argument("--no-baseline", action="store_true",
+                        help="skip the comparison with the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="minimum allowed relative slowdown (raised to "
+                        "the recorded spread of both runs) / memory growth")
+    parser.add_argument("--min-time", type=float, default=0.1,
+                        help="minimum seconds per timing sample")
+    parser.add_argument("--no-normalize", action="store_true",
+                        help="don't scale ratios by the machine speed")
+    return (parser.parse_args(argv))
+
+
+def main(argv: List[str]) -> int:
+    args = parse_args(argv)
+    size = SCALES[args.scale]
+    results: Dict[str, Any] = {
+        "meta": {
+            "scale": args.scale,
+            "size": size,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "calibration": calibrate(),
+            },
+        "results": {},
+        }
+    print(f"=== Nexus benchmark suite ({args.scale}: {size} records) ===")
+    for name, workload in cases(size, args.seed).items():
+        if not name.startswith(args.only):
+            continue
+        result = measure(workload, args.repeat, args.min_time)
+        results["results"][name] = result
+        latency = ""
+        if "p50_us" in result:
+            latency = (f"  p50 {result['p50_us']:8.2f}us "
+                       f"p99 {result['p99_us']:8.2f}us")
+        print(f"{name:20} {result['throughput']:12.0f} rec/s  "
+              f"peak {result['peak_bytes'] / 1e6:8.2f} MB{latency}")
+    with open(args.output, "w", encoding="utf-8") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+    print(f"Results saved to {args.output}")
+    path = args.baseline
+    if args.no_baseline or (path is None and not os.path.exists(BASELINE)):
+        return (0)
+    with open(path or BASELINE, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    if baseline.get("meta", {}).get("scale") != args.scale:
+        if path is None:
+            print(f"No baseline recorded at the {args.scale} scale.")
+            return (0)
+        print("Baseline was recorded at another scale!", file=sys.stderr)
+        return (2)
+    args.baseline = path or BASELINE
+    print(f"--- Comparison with {args.baseline} "
+          f"(minimum tolerance {args.tolerance:.0%}) ---")
+    failures = compare(results, baseline, args.tolerance,
+                       not args.no_normalize)
+    if failures:
+        print("!!! PERFORMANCE REGRESSION !!!", file=sys.stderr)
+        for failure in failures:
+            print(f"  {failure}", file=sys.stderr)
+        return (1)
+    print("No regression detected.")
+    return (0)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from stream_processor import LogProcessor
+
+
+def write_log(path: str, size: int) -> None:
+    levels = (["INFO"] * 60 + ["DEBUG"] * 25 + ["WARN"] * 8
+              + ["ERROR"] * 5 + ["CRITICAL", "AUDIT"])
+    choice = random.choice
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(size):
+            file.write(f"{choice(levels)}: request {index} handled by "
+                       f"worker {index % 17} in {index % 997}ms\n")
+
+
+def per_line(path: str) -> int:
+    processor = LogProcessor()
+    process = processor.process
+    count = 0
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            process(line.rstrip("\n"))
+            count += 1
+    return (count)
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "app.log")
+        write_log(path, size)
+        megabytes = os.path.getsize(path) / 1e6
+        print(f"=== LogProcessor bulk scan ({size} lines, "
+              f"{megabytes:.0f} MB) ===")
+        base = timed(lambda: per_line(path))
+        print(f"per-line process      : {megabytes / base:8.1f} MB/s")
+        processor = LogProcessor()
+        elapsed = timed(lambda: processor.scan_file(path))
+        print(f"scan_file default     : {megabytes / elapsed:8.1f} MB/s "
+              f"x{base / elapsed:.2f}")
+        reference = processor.index.counts
+        counts = sorted({2, 4, os.cpu_count() or 1} - {1})
+        for workers in counts:
+            processor = LogProcessor()
+            elapsed = timed(lambda: processor.scan_file(path, workers,
+                                                        part_size=1))
+            print(f"scan_file x{workers:<3} forced : "
+                  f"{megabytes / elapsed:8.1f} MB/s x{base / elapsed:.2f}")
+            if processor.index.counts != reference:
+                raise SystemExit(f"x{workers} scan counted other levels!")
+        processor = LogProcessor()
+        elapsed = timed(
+            lambda: processor.scan_file(path, index_levels=None))
+        print(f"scan_file all levels  : {megabytes / elapsed:8.1f} MB/s "
+              f"x{base / elapsed:.2f}")
+        alerts = processor.index.counts['ERROR'] \
+            + processor.index.counts['CRITICAL']
+        elapsed = timed(lambda: processor.alerts())
+        print(f"fetch {alerts} alerts     : {elapsed:8.3f} s")
+        print(processor.index.stats())
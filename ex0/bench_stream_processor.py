@@ -0,0 +1,65 @@
+import sys
+import time
+from array import array
+from typing import Any, Callable, List
+
+from stream_processor import NumericProcessor, np
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return (best)
+
+
+def baseline_process(data: Any) -> float:
+    for num in data:
+        if type(num) is not int:
+            raise TypeError()
+    return (sum(data) / len(data))
+
+
+def bench_size(size: int) -> List[str]:
+    values = list(range(size))
+    results = []
+    base = timed(lambda: baseline_process(values))
+    results.append(f"baseline       {base:10.4f}s")
+    list_proc = NumericProcessor()
+    elapsed = timed(lambda: list_proc.process(values))
+    results.append(f"list/list      {elapsed:10.4f}s x{base / elapsed:.1f}")
+    summary_proc = NumericProcessor(summary=True)
+    elapsed = timed(lambda: summary_proc.process(values))
+    results.append(f"list/summary   {elapsed:10.4f}s x{base / elapsed:.1f}")
+    packed = array("q", values)
+    elapsed = timed(lambda: list_proc.process(packed))
+    results.append(f"list/array     {elapsed:10.4f}s x{base / elapsed:.1f}")
+    if np is not None:
+        np_proc = NumericProcessor("numpy")
+        elapsed = timed(lambda: np_proc.process(values))
+        results.append(
+            f"numpy/list     {elapsed:10.4f}s x{base / elapsed:.1f}"
+            )
+        arr = np.arange(size, dtype=np.int64)
+        elapsed = timed(lambda: np_proc.process(arr))
+        results.append(
+            f"numpy/ndarray  {elapsed:10.4f}s x{base / elapsed:.1f}"
+            )
+        elapsed = timed(lambda: np_proc.process(packed))
+        results.append(
+            f"numpy/array    {elapsed:10.4f}s x{base / elapsed:.1f}"
+            )
+    else:
+        results.append("numpy          skipped (numpy is not installed)")
+    return (results)
+
+
+if __name__ == "__main__":
+    max_exp = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    print("=== NumericProcessor backend benchmark ===")
+    for exp in range(4, max_exp + 1):
+        print(f"\n10^{exp} elements:")
+        for line in bench_size(10 ** exp):
+            print(f"  {line}")
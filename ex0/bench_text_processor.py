@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from stream_processor import TextProcessor
+
+
+def write_text(path: str, size: int) -> None:
+    words = ["nexus", "stream", "sensor", "data", "pipeline", "quantum",
+             "matrix", "signal", "vector", "code", "données", "流"]
+    choice = random.choice
+    with open(path, "w", encoding="utf-8") as file:
+        for _ in range(size):
+            file.write(" ".join(choice(words) for _ in range(12)) + "\n")
+
+
+def whole(path: str) -> str:
+    with open(path, "r", encoding="utf-8") as file:
+        return (TextProcessor().process(file.read()))
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start)
+
+
+def peak_memory(func: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        func()
+        return (tracemalloc.get_traced_memory()[1] / 1e6)
+    finally:
+        tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.txt")
+        write_text(path, size)
+        megabytes = os.path.getsize(path) / 1e6
+        print(f"=== TextProcessor streaming ({size} lines, "
+              f"{megabytes:.0f} MB) ===")
+        base = timed(lambda: whole(path))
+        peak = peak_memory(lambda: whole(path))
+        print(f"read + process        : {megabytes / base:8.1f} MB/s  "
+              f"peak {peak:8.1f} MB")
+        variants = [("process_file", False, 1),
+                    ("process_file + top-K", True, 1)]
+        for workers in sorted({2, 4, os.cpu_count() or 1} - {1}):
+            variants.append((f"process_file x{workers}", False, workers))
+        for label, frequencies, workers in variants:
+            processor = TextProcessor()
+            elapsed = timed(lambda: processor.process_file(
+                path, frequencies=frequencies, workers=workers))
+            peak = "  (not traced)"
+            if not frequencies:
+                traced = peak_memory(
+                    lambda: processor.process_file(path, workers=workers))
+                peak = f"{traced:8.1f} MB"
+            print(f"{label:22}: {megabytes / elapsed:8.1f} MB/s  "
+                  f"peak {peak}  x{base / elapsed:.2f}")
+        print(processor.get_stats())
@@ -1,8 +1,221 @@
+import heapq
+import itertools
+import math
+import mmap
+import operator
+import os
+import re
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple,
+    Union
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+_MISSING = object()
+
+
+class ResultCache():
+    policies = ("lru", "lfu")
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None,
+                 policy: str = "lru", max_key_length: int = 4096,
+                 min_hit_rate: float = 0.05, probe: int = 4096,
+                 sample: int = 8) -> None:
+        if policy not in self.policies:
+            raise ValueError("Policy should be lru or lfu!")
+        if max_entries <= 0 or probe <= 0 or sample <= 0:
+            raise ValueError("Cache sizes should be positive!")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL should be positive!")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.policy = policy
+        self.max_key_length = max_key_length
+        self.min_hit_rate = min_hit_rate
+        self.probe = probe
+        self.sample = sample
+        self.entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self.counts: Dict[Any, int] = {}
+        self.checked = 0
+        self.skip = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+        self.bypassed = 0
+
+    def __len__(self) -> int:
+        return (len(self.entries))
+
+    def cacheable(self, key: Any) -> bool:
+        if type(key) in (str, bytes):
+            return (len(key) <= self.max_key_length)
+        try:
+            hash(key)
+        except TypeError:
+            return (False)
+        return (True)
+
+    def _remove(self, key: Any) -> None:
+        del self.entries[key]
+        self.counts.pop(key, None)
+
+    def _evict(self) -> None:
+        entries = self.entries
+        if self.policy == "lru":
+            entries.popitem(last=False)
+        else:
+            counts = self.counts
+            oldest = list(itertools.islice(entries, self.sample))
+            victim = min(oldest, key=counts.__getitem__)
+            for key in oldest:
+                if key is not victim:
+                    entries.move_to_end(key)
+                    counts[key] >>= 1
+            self._remove(victim)
+        self.evictions += 1
+
+    def _missed(self) -> None:
+        self.misses += 1
+        if not self.misses % self.probe:
+            hits = self.hits - self.checked
+            if hits < (hits + self.probe) * self.min_hit_rate:
+                self.skip = self.probe * 64
+                self.bypassed += self.skip
+            self.checked = self.hits
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self.entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self._missed()
+            return (default)
+        if self.ttl is not None:
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                self.expired += 1
+                self._missed()
+                return (default)
+            entry = entry[0]
+        if self.policy == "lru":
+            self.entries.move_to_end(key)
+        else:
+            self.counts[key] += 1
+        self.hits += 1
+        return (entry)
+
+    def put(self, key: Any, value: Any) -> None:
+        if key in self.entries:
+            self._remove(key)
+        elif len(self.entries) >= self.max_entries:
+            self._evict()
+        if self.ttl is not None:
+            value = (value, time.monotonic() + self.ttl)
+        self.entries[key] = value
+        if self.policy == "lfu":
+            self.counts[key] = 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.counts.clear()
+        self.checked = self.hits
+        self.bypassed -= self.skip
+        self.skip = 0
+
+    def wrap(self, func: Callable[[Any], Any],
+             copier: Optional[Callable[[Any], Any]] = None
+             ) -> Callable[[Any], Any]:
+        if self.ttl is None:
+            return (self._wrap_fast(func, copier))
+        get = self.get
+        put = self.put
+        cacheable = self.cacheable
+
+        def cached(data: Any) -> Any:
+            if self.skip:
+                self.skip -= 1
+                return (func(data))
+            if not cacheable(data):
+                self.bypassed += 1
+                return (func(data))
+            result = get(data, _MISSING)
+            if result is _MISSING:
+                result = func(data)
+                put(data, result)
+            elif copier is not None:
+                result = copier(result)
+            return (result)
+        cached.cache = self
+        return (cached)
+
+    def _wrap_fast(self, func: Callable[[Any], Any],
+                   copier: Optional[Callable[[Any], Any]]
+                   ) -> Callable[[Any], Any]:
+        entries = self.entries
+        counts = self.counts
+        lookup = entries.get
+        move_to_end = entries.move_to_end
+        missed = self._missed
+        evict = self._evict
+        lru = self.policy == "lru"
+        limit = self.max_key_length
+
+        def cached(data: Any) -> Any:
+            if self.skip:
+                self.skip -= 1
+                return (func(data))
+            try:
+                kind = type(data)
+                if (kind is str or kind is bytes) and len(data) > limit:
+                    raise TypeError
+                result = lookup(data, _MISSING)
+            except TypeError:
+                self.bypassed += 1
+                return (func(data))
+            if result is not _MISSING:
+                if lru:
+                    move_to_end(data)
+                else:
+                    counts[data] += 1
+                self.hits += 1
+                return (result if copier is None else copier(result))
+            missed()
+            result = func(data)
+            if len(entries) >= self.max_entries:
+                evict()
+            entries[data] = result
+            if not lru:
+                counts[data] = 1
+            return (result)
+        cached.cache = self
+        return (cached)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        lookups = self.hits + self.misses
+        return ({
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expired': self.expired,
+            'bypassed': self.bypassed - self.skip,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            })
 
 
 class DataProcessor(ABC):
+    cacheable = False
+    cache_state: Tuple[str, ...] = ()
+
     @abstractmethod
     def process(self, data: Any) -> str:
         pass
@@ -14,20 +227,347 @@ class DataProcessor(ABC):
     def format_output(self, result: str) -> str:
         return (f"Output: {result}")
 
+    def enable_cache(self, **options: Any) -> ResultCache:
+        if not self.cacheable:
+            raise ValueError(f"{type(self).__name__} is not cacheable!")
+        cache = ResultCache(**options)
+        process = type(self).process.__get__(self)
+        state = self.cache_state
+        if not state:
+            self.process = cache.wrap(process)
+            return (cache)
+
+        def snapshot(data: Any) -> Tuple[Any, Tuple[Any, ...]]:
+            result = process(data)
+            return (result, tuple(getattr(self, name) for name in state))
+        cached = cache.wrap(snapshot)
+
+        def restore(data: Any) -> Any:
+            if type(data) is not str:
+                return (process(data))
+            result, values = cached(data)
+            for name, value in zip(state, values):
+                setattr(self, name, value)
+            return (result)
+        restore.cache = cache
+        self.process = restore
+        return (cache)
+
+    def disable_cache(self) -> None:
+        self.__dict__.pop("process", None)
+
+
+class QuantileSketch():
+    def __init__(self, accuracy: float = 0.01) -> None:
+        if not 0 < accuracy < 1:
+            raise ValueError("Accuracy should be between 0 and 1!")
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+
+    def _value(self, index: int) -> float:
+        return (2 * self.gamma ** index / (self.gamma + 1))
+
+    def update(self, value: float) -> None:
+        self.update_batch((value,))
+
+    def update_batch(self, values: Any) -> None:
+        if np is not None and isinstance(values, np.ndarray):
+            values = values.astype(np.float64)
+            values = values[np.isfinite(values)]
+            for sign, buckets in ((1, self.positive), (-1, self.negative)):
+                part = values[values * sign > 0] * sign
+                if part.size == 0:
+                    continue
+                indexes = np.ceil(np.log(part) / self._log_gamma).astype(
+                    np.int64)
+                low = int(indexes.min())
+                counts = np.bincount(indexes - low)
+                for offset in np.flatnonzero(counts).tolist():
+                    index = low + offset
+                    buckets[index] = buckets.get(index, 0) + int(
+                        counts[offset])
+            self.zero += int(np.count_nonzero(values == 0))
+            self.count += int(values.size)
+            return
+        log = math.log
+        ceil = math.ceil
+        log_gamma = self._log_gamma
+        positive = self.positive
+        negative = self.negative
+        for value in values:
+            try:
+                if value > 0:
+                    index = ceil(log(value) / log_gamma)
+                    positive[index] = positive.get(index, 0) + 1
+                elif value < 0:
+                    index = ceil(log(-value) / log_gamma)
+                    negative[index] = negative.get(index, 0) + 1
+                elif value == 0:
+                    self.zero += 1
+                else:
+                    continue
+            except OverflowError:
+                continue
+            self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.accuracy != self.accuracy:
+            raise ValueError("Sketches with different accuracy can't merge!")
+        for mine, theirs in ((self.positive, other.positive),
+                             (self.negative, other.negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+        self.zero += other.zero
+        self.count += other.count
+        return (self)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.accuracy, self.zero, self.count,
+                 array('q', self.positive).tobytes(),
+                 array('q', self.positive.values()).tobytes(),
+                 array('q', self.negative).tobytes(),
+                 array('q', self.negative.values()).tobytes()))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "QuantileSketch":
+        sketch = cls(state[0])
+        sketch.zero = state[1]
+        sketch.count = state[2]
+        sketch.positive = dict(zip(array('q', state[3]),
+                                   array('q', state[4])))
+        sketch.negative = dict(zip(array('q', state[5]),
+                                   array('q', state[6])))
+        return (sketch)
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile should be between 0 and 1!")
+        if self.count == 0:
+            return (0.0)
+        rank = round(q * (self.count - 1))
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return (-self._value(index))
+        seen += self.zero
+        if seen > rank:
+            return (0.0)
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return (self._value(index))
+        return (self._value(max(self.positive)))
+
+
+class RunningStats():
+    def __init__(self, accuracy: float = 0.01,
+                 quantiles: bool = False) -> None:
+        self.count = 0
+        self.sum: Union[int, float] = 0
+        self.mean = 0.0
+        self.min: Optional[Union[int, float]] = None
+        self.max: Optional[Union[int, float]] = None
+        self._m2 = 0.0
+        self.sketch: Optional[QuantileSketch] = None
+        if quantiles:
+            self.sketch = QuantileSketch(accuracy)
+
+    @property
+    def variance(self) -> float:
+        return (self._m2 / self.count if self.count else 0.0)
+
+    def update(self, value: Union[int, float]) -> None:
+        self.count += 1
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.sketch is not None:
+            self.sketch.update(value)
+
+    def merge_summary(self, count: int, total: Union[int, float], m2: float,
+                      low: Union[int, float],
+                      high: Union[int, float]) -> None:
+        if count == 0:
+            return
+        mean = total / count
+        merged = self.count + count
+        delta = mean - self.mean
+        self._m2 += m2 + delta * delta * self.count * count / merged
+        self.mean += delta * count / merged
+        self.count = merged
+        self.sum += total
+        if self.min is None or low < self.min:
+            self.min = low
+        if self.max is None or high > self.max:
+            self.max = high
+
+    def update_batch(self, values: Any) -> None:
+        if len(values) == 0:
+            return
+        if np is not None and isinstance(values, np.ndarray):
+            total = values.sum(dtype=np.float64)
+            m2 = float(values.var(dtype=np.float64)) * values.size
+            self.merge_summary(int(values.size), float(total), m2,
+                               values.min().item(), values.max().item())
+        else:
+            total = sum(values)
+            mean = total / len(values)
+            m2 = sum((value - mean) * (value - mean) for value in values)
+            self.merge_summary(len(values), total, m2,
+                               min(values), max(values))
+        if self.sketch is not None:
+            self.sketch.update_batch(values)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        if self.sketch is not None and other.sketch is None:
+            raise ValueError("Stats without quantiles can't merge in!")
+        self.merge_summary(other.count, other.sum, other._m2,
+                           other.min, other.max)
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return (self)
+
+    def quantile(self, q: float) -> float:
+        if self.sketch is None:
+            raise ValueError("Quantiles are off, use quantiles=True!")
+        return (self.sketch.quantile(q))
+
+    def get_state(self) -> Tuple[Any, ...]:
+        sketch = None if self.sketch is None else self.sketch.get_state()
+        return ((self.count, self.sum, self.mean, self.min, self.max,
+                 self._m2, sketch))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "RunningStats":
+        stats = cls()
+        (stats.count, stats.sum, stats.mean, stats.min, stats.max,
+         stats._m2) = state[:6]
+        if state[6] is not None:
+            stats.sketch = QuantileSketch.from_state(state[6])
+        return (stats)
+
+    def as_dict(self) -> Dict[str, Union[int, float, None]]:
+        stats: Dict[str, Union[int, float, None]] = {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.mean,
+            'variance': self.variance,
+            'min': self.min,
+            'max': self.max,
+            }
+        if self.sketch is not None:
+            for q in (0.5, 0.9, 0.99):
+                stats[f'p{int(q * 100)}'] = self.quantile(q)
+        return (stats)
+
 
 class NumericProcessor(DataProcessor):
-    def __init__(self) -> None:
+    INT_CODES = "bBhHiIlLqQ"
+
+    def __init__(self, backend: str = "list", quantiles: bool = False,
+                 summary: bool = False) -> None:
+        if backend not in ("list", "numpy"):
+            raise ValueError("Backend should be 'list' or 'numpy'!")
+        if backend == "numpy" and np is None:
+            raise ValueError("NumPy backend requested but numpy is missing!")
+        self.backend = backend
         self.length = 0
         self.sum = 0
         self.avg = 0
+        self.min = 0
+        self.max = 0
+        self.variance = 0
+        self.count = 0
+        self.total = 0
+        self.stats: Optional[RunningStats] = None
+        if summary or quantiles or backend == "numpy":
+            self.stats = RunningStats(quantiles=quantiles)
+        self._values = None
+
+    def _as_buffer(self, data: Any) -> Any:
+        if isinstance(data, (bytes, bytearray)):
+            return (memoryview(data))
+        if isinstance(data, memoryview):
+            code = data.format.lstrip("@=")
+            if len(code) != 1 or code not in self.INT_CODES:
+                return (None)
+            if data.ndim != 1 and data.c_contiguous:
+                return (data.cast("B").cast(code))
+            return (data if data.ndim == 1 else None)
+        if isinstance(data, array):
+            if data.typecode not in self.INT_CODES:
+                return (None)
+            return (data)
+        return (None)
+
+    def _as_ndarray(self, data: Any) -> Any:
+        if isinstance(data, (bytes, bytearray, memoryview, array)):
+            data = self._as_buffer(data)
+            return (None if data is None else np.asarray(data))
+        if type(data) in (list, tuple):
+            if not self._validate_list(data):
+                return (None)
+            try:
+                return (np.fromiter(data, np.int64, len(data)))
+            except OverflowError:
+                return (data)
+        try:
+            values = np.asarray(data)
+        except (TypeError, ValueError):
+            return (None)
+        if values.dtype.kind not in "iu":
+            return (None)
+        return (values.ravel())
+
+    def _validate_list(self, data: Any) -> bool:
+        return (len(data) != 0
+                and operator.countOf(map(type, data), int) == len(data))
 
     def validate(self, data: Any) -> bool:
-        if type(data) is not list or len(data) == 0:
-            return (False)
-        for num in data:
-            if type(num) is not int:
-                return (False)
-        return (True)
+        if self.backend == "numpy":
+            self._values = self._as_ndarray(data)
+        elif type(data) is list:
+            self._values = data if self._validate_list(data) else None
+        else:
+            self._values = self._as_buffer(data)
+        return (self._values is not None and len(self._values) != 0)
+
+    def _process_python(self, values: Any) -> None:
+        self.length = len(values)
+        self.sum = sum(values)
+        self.avg = self.sum / self.length
+        if self.stats is None:
+            return
+        self.min = min(values)
+        self.max = max(values)
+        squares = sum(map(operator.mul, values, values))
+        self.variance = (
+            (self.length * squares - self.sum * self.sum)
+            / (self.length * self.length)
+            )
+
+    def _process_numpy(self, values: Any) -> None:
+        self.length = int(values.size)
+        acc = np.uint64 if values.dtype.kind == "u" else np.int64
+        self.sum = int(values.sum(dtype=acc))
+        if values.dtype.itemsize == 8 and abs(
+                float(values.sum(dtype=np.float64))) >= 2 ** 62:
+            self.sum = sum(values.tolist())
+        self.min = int(values.min())
+        self.max = int(values.max())
+        self.avg = self.sum / self.length
+        self.variance = float(values.var(dtype=np.float64))
 
     def process(self, data: Any) -> str:
         try:
@@ -35,24 +575,179 @@ class NumericProcessor(DataProcessor):
                 raise TypeError(
                     "Processing Failed, list of numeric values is required!"
                     )
-            self.length = len(data)
-            self.sum = sum(data)
-            self.avg = self.sum / self.length
+            values = self._values
+            if np is not None and isinstance(values, np.ndarray):
+                self._process_numpy(values)
+            else:
+                self._process_python(values)
+            self.count += self.length
+            self.total += self.sum
+            if self.stats is not None:
+                self.stats.merge_summary(self.length, self.sum,
+                                         self.variance * self.length,
+                                         self.min, self.max)
+                if self.stats.sketch is not None:
+                    self.stats.sketch.update_batch(values)
             return (
                 f"Processed {self.length} numeric values, sum = {self.sum}, "
                 f"avg ={self.avg}"
                 )
         except TypeError as e:
             return (e)
+        finally:
+            self._values = None
+
+    def get_stats(self) -> Dict[str, Union[int, float, None]]:
+        if self.stats is not None:
+            return (self.stats.as_dict())
+        return ({'count': self.count, 'sum': self.total,
+                 'mean': self.total / self.count if self.count else 0.0})
 
     def format_output(self, result: str) -> str:
         return super().format_output(result)
 
 
+WHITESPACE = b" \t\n\r\x0b\x0c"
+WORD_TABLE = bytes(32 if byte in WHITESPACE else 120 for byte in range(256))
+CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
+
+
+class TextCounts():
+    def __init__(self, frequencies: bool = False) -> None:
+        self.bytes = 0
+        self.chars = 0
+        self.words = 0
+        self.newlines = 0
+        self.starts_word = False
+        self.ends_word = False
+        self.ends_newline = False
+        self.solid = False
+        self.head = b""
+        self.tail = b""
+        self.frequencies: Optional[Counter] = (
+            Counter() if frequencies else None
+            )
+
+    @property
+    def lines(self) -> int:
+        if self.bytes and not self.ends_newline:
+            return (self.newlines + 1)
+        return (self.newlines)
+
+    @classmethod
+    def of_chunk(cls, data: Union[str, bytes],
+                 frequencies: bool = False) -> "TextCounts":
+        if type(data) is str:
+            data = data.encode(errors="surrogatepass")
+        counts = cls(frequencies)
+        if not data:
+            return (counts)
+        mask = data.translate(WORD_TABLE)
+        counts.bytes = len(data)
+        counts.chars = len(data.translate(None, CONTINUATION_BYTES))
+        counts.newlines = data.count(b"\n")
+        counts.starts_word = mask.startswith(b"x")
+        counts.ends_word = mask.endswith(b"x")
+        counts.ends_newline = data.endswith(b"\n")
+        counts.words = mask.count(b" x") + (1 if counts.starts_word else 0)
+        if frequencies:
+            counts.solid = b" " not in mask
+            if counts.solid:
+                counts.head = data
+                return (counts)
+            tokens = data.split()
+            first = 0
+            last = len(tokens)
+            if counts.starts_word:
+                counts.head = tokens[0]
+                first = 1
+            if counts.ends_word:
+                counts.tail = tokens[-1]
+                last -= 1
+            counts.frequencies.update(itertools.islice(tokens, first, last))
+        return (counts)
+
+    def update(self, data: Union[str, bytes]) -> "TextCounts":
+        return (self.merge(self.of_chunk(data,
+                                         self.frequencies is not None)))
+
+    def merge(self, other: "TextCounts") -> "TextCounts":
+        if not other.bytes:
+            return (self)
+        if not self.bytes:
+            self.__dict__.update(other.__dict__)
+            return (self)
+        joined = self.ends_word and other.starts_word
+        self.bytes += other.bytes
+        self.chars += other.chars
+        self.words += other.words - (1 if joined else 0)
+        self.newlines += other.newlines
+        self.ends_word = other.ends_word
+        self.ends_newline = other.ends_newline
+        if self.frequencies is not None and other.frequencies is not None:
+            self.frequencies.update(other.frequencies)
+            if self.solid:
+                self.head += other.head
+                self.tail = other.tail
+            elif other.solid:
+                self.tail += other.head
+            else:
+                middle = self.tail + other.head
+                if middle:
+                    self.frequencies[middle] += 1
+                self.tail = other.tail
+            self.solid = self.solid and other.solid
+        return (self)
+
+    def top(self, k: int = 10) -> List[Tuple[str, int]]:
+        if self.frequencies is None:
+            raise ValueError("Word frequencies were not counted!")
+        counter = self.frequencies.copy()
+        for token in (self.head, self.tail):
+            if token:
+                counter[token] += 1
+        return ([(word.decode(errors="replace"), count)
+                 for word, count in counter.most_common(k)])
+
+    def as_dict(self) -> Dict[str, int]:
+        return ({
+            'bytes': self.bytes,
+            'characters': self.chars,
+            'words': self.words,
+            'lines': self.lines,
+            })
+
+
+def read_chunks(file: Any, chunk_size: int,
+                limit: Optional[int] = None) -> Iterator[Any]:
+    while limit is None or limit > 0:
+        size = chunk_size if limit is None else min(chunk_size, limit)
+        data = file.read(size)
+        if not data:
+            return
+        if limit is not None:
+            limit -= len(data)
+        yield (data)
+
+
+def count_file_range(path: str, start: int, end: int, chunk_size: int,
+                     frequencies: bool = False) -> TextCounts:
+    counts = TextCounts(frequencies)
+    with open(path, "rb", buffering=0) as file:
+        file.seek(start)
+        for data in read_chunks(file, chunk_size, end - start):
+            counts.update(data)
+    return (counts)
+
+
 class TextProcessor(DataProcessor):
+    cacheable = True
+    cache_state = ("length", "words")
+
     def __init__(self) -> None:
         self.length = 0
         self.words = 0
+        self.counts: Optional[TextCounts] = None
 
     def validate(self, data: Any) -> bool:
         if (type(data) is not str):
@@ -64,20 +759,239 @@ class TextProcessor(DataProcessor):
             if (self.validate(data) is False):
                 raise TypeError("Processing Failed, string is required!")
             self.length = len(data)
-            self.words = len(data.split(' '))
+            mask = data.encode(errors="surrogatepass").translate(WORD_TABLE)
+            self.words = mask.count(b" x") + (
+                1 if mask.startswith(b"x") else 0)
             return (
                 f"Processed text: {self.length} characters, {self.words} words"
                 )
         except TypeError as e:
             return (e)
 
+    def _summary(self, counts: TextCounts) -> str:
+        self.counts = counts
+        self.length = counts.chars
+        self.words = counts.words
+        return (f"Processed text: {counts.chars} characters, "
+                f"{counts.words} words, {counts.lines} lines")
+
+    def process_chunks(self, source: Any, chunk_size: int = 1 << 20,
+                       frequencies: bool = False) -> str:
+        if hasattr(source, "read"):
+            source = read_chunks(source, chunk_size)
+        counts = TextCounts(frequencies)
+        for data in source:
+            if type(data) is not str and type(data) is not bytes:
+                raise TypeError("Processing Failed, text chunks required!")
+            counts.update(data)
+        return (self._summary(counts))
+
+    def process_file(self, path: str, chunk_size: int = 1 << 20,
+                     frequencies: bool = False,
+                     workers: Optional[int] = 1) -> str:
+        workers = workers or os.cpu_count() or 1
+        size = os.path.getsize(path)
+        parts = max(1, min(workers, size // chunk_size))
+        if parts == 1:
+            return (self._summary(count_file_range(path, 0, size, chunk_size,
+                                                   frequencies)))
+        bounds = [size * part // parts for part in range(parts + 1)]
+        counts = TextCounts(frequencies)
+        with ProcessPoolExecutor(parts) as pool:
+            for part in pool.map(count_file_range, itertools.repeat(path),
+                                 bounds[:-1], bounds[1:],
+                                 itertools.repeat(chunk_size, parts),
+                                 itertools.repeat(frequencies, parts)):
+                counts.merge(part)
+        return (self._summary(counts))
+
+    def top_words(self, k: int = 10) -> List[Tuple[str, int]]:
+        if self.counts is None:
+            raise ValueError("No text streamed yet!")
+        return (self.counts.top(k))
+
+    def get_stats(self) -> Dict[str, int]:
+        if self.counts is None:
+            return ({'characters': self.length, 'words': self.words})
+        return (self.counts.as_dict())
+
     def format_output(self, result: str) -> str:
         return (super().format_output(result))
 
 
+LOG_LEVELS = (b"DEBUG", b"INFO", b"WARN", b"WARNING", b"ERROR", b"CRITICAL")
+ALERT_LEVELS = ("ERROR", "CRITICAL")
+INDEX_LEVELS = ("WARN", "WARNING", "ERROR", "CRITICAL")
+LEVEL_PATTERN = re.compile(rb"\n([A-Za-z][A-Za-z0-9_]*): ")
+_level_patterns: Dict[bytes, Any] = {}
+
+
+def level_pattern(level: bytes) -> Any:
+    pattern = _level_patterns.get(level)
+    if pattern is None:
+        pattern = _level_patterns[level] = re.compile(
+            b"\n" + re.escape(level) + b": ")
+    return (pattern)
+
+
+def read_log_chunks(file: Any, start: int, end: int,
+                    chunk_size: int) -> Iterator[Tuple[int, bytes]]:
+    file.seek(start)
+    position = start
+    tail = b"\n"
+    remaining = end - start
+    while remaining > 0:
+        block = file.read(min(chunk_size, remaining))
+        if not block:
+            break
+        remaining -= len(block)
+        data = tail + block
+        if remaining > 0:
+            cut = data.rfind(b"\n", 1) + 1
+            if cut == 0:
+                tail = data
+                continue
+            tail = data[cut - 1:]
+            data = data[:cut]
+        yield (position, data)
+        position += len(data) - 1
+    if remaining <= 0 or len(tail) <= 1:
+        return
+    yield (position, tail)
+
+
+def log_ranges(path: str, parts: int) -> List[Tuple[int, int]]:
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as file:
+        for part in range(1, parts):
+            file.seek(max(size * part // parts - 1, bounds[-1]))
+            file.readline()
+            bounds.append(max(min(file.tell(), size), bounds[-1]))
+    bounds.append(size)
+    return ([(start, end) for start, end in zip(bounds, bounds[1:])
+             if end > start])
+
+
+class LogIndex():
+    def __init__(self, path: Optional[str] = None,
+                 index_levels: Optional[Iterable[str]] = INDEX_LEVELS
+                 ) -> None:
+        self.path = path
+        self.index_levels = (
+            None if index_levels is None
+            else frozenset(level.encode() for level in index_levels)
+            )
+        self.counts: Dict[str, int] = {}
+        self.offsets: Dict[str, array] = {}
+        self.levels: Set[bytes] = set(LOG_LEVELS)
+        self.lines = 0
+        self.bytes = 0
+        self.malformed = 0
+
+    def indexed(self, level: str) -> bool:
+        return (self.index_levels is None
+                or level.encode() in self.index_levels)
+
+    def _scan_level(self, data: bytes, position: int, level: bytes) -> int:
+        if self.index_levels is not None and level not in self.index_levels:
+            return (data.count(b"\n" + level + b": "))
+        found = array('q', map(position.__add__, map(
+            re.Match.start, level_pattern(level).finditer(data))))
+        if found:
+            name = level.decode()
+            offsets = self.offsets.get(name)
+            if offsets is None:
+                self.offsets[name] = found
+            else:
+                offsets.extend(found)
+        return (len(found))
+
+    def scan_chunk(self, position: int, data: bytes) -> None:
+        lines = data.count(b"\n") - (1 if data.endswith(b"\n") else 0)
+        counts = self.counts
+        classified = 0
+        for level in sorted(self.levels,
+                            key=lambda level: -counts.get(level.decode(), 0)):
+            if classified == lines:
+                break
+            found = self._scan_level(data, position, level)
+            if found:
+                name = level.decode()
+                counts[name] = counts.get(name, 0) + found
+                classified += found
+        if classified < lines:
+            for level in set(LEVEL_PATTERN.findall(data)) - self.levels:
+                self.levels.add(level)
+                found = self._scan_level(data, position, level)
+                counts[level.decode()] = counts.get(level.decode(), 0) + found
+                classified += found
+        self.lines += lines
+        self.malformed += lines - classified
+        self.bytes += len(data) - 1
+
+    def merge(self, other: "LogIndex") -> "LogIndex":
+        for name, count in other.counts.items():
+            self.counts[name] = self.counts.get(name, 0) + count
+        for name, offsets in other.offsets.items():
+            if name in self.offsets:
+                self.offsets[name].extend(offsets)
+            else:
+                self.offsets[name] = offsets
+        self.levels |= other.levels
+        self.lines += other.lines
+        self.bytes += other.bytes
+        self.malformed += other.malformed
+        return (self)
+
+    def line_offsets(self, *levels: str) -> Iterator[int]:
+        for level in levels:
+            if not self.indexed(level):
+                raise ValueError(f"Level {level} is not indexed!")
+        return (heapq.merge(*(self.offsets.get(level, ())
+                              for level in levels)))
+
+    def fetch(self, *levels: str, limit: Optional[int] = None) -> List[str]:
+        if self.path is None:
+            raise ValueError("Index has no file to fetch lines from!")
+        offsets = itertools.islice(self.line_offsets(*levels), limit)
+        lines = []
+        with open(self.path, "rb") as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            find = view.find
+            for offset in offsets:
+                end = find(b"\n", offset)
+                line = view[offset:end if end >= 0 else len(view)]
+                lines.append(line.decode(errors="replace").rstrip("\r"))
+        return (lines)
+
+    def stats(self) -> Dict[str, Any]:
+        return ({
+            'lines': self.lines,
+            'bytes': self.bytes,
+            'malformed': self.malformed,
+            'levels': dict(sorted(self.counts.items(),
+                                  key=lambda item: -item[1])),
+            })
+
+
+def scan_log_range(path: str, start: int, end: int, chunk_size: int,
+                   index_levels: Optional[Iterable[str]] = INDEX_LEVELS
+                   ) -> LogIndex:
+    index = LogIndex(path, index_levels)
+    with open(path, "rb", buffering=0) as file:
+        for position, data in read_log_chunks(file, start, end, chunk_size):
+            index.scan_chunk(position, data)
+    return (index)
+
+
 class LogProcessor(DataProcessor):
+    cacheable = True
+    cache_state = ("log",)
+
     def __init__(self) -> None:
         self.log = []
+        self.index: Optional[LogIndex] = None
 
     def validate(self, data: Any) -> bool:
         if (type(data) is not str):
@@ -91,10 +1005,48 @@ class LogProcessor(DataProcessor):
         if self.validate(data) is False:
             return ("Processing Failed")
         else:
-            if self.log[0] == "ERROR":
+            if self.log[0] in ALERT_LEVELS:
                 return (f"[ALERT] {self.log[0]} level detected: {self.log[1]}")
-            elif self.log[0] == "INFO":
-                return (f"[INFO] {self.log[0]} level detected: {self.log[1]}")
+            return (
+                f"[{self.log[0]}] {self.log[0]} level detected: {self.log[1]}"
+                )
+
+    def scan_file(self, path: str, workers: Optional[int] = None,
+                  chunk_size: int = 1 << 24,
+                  index_levels: Optional[Iterable[str]] = INDEX_LEVELS,
+                  part_size: int = 1 << 27) -> LogIndex:
+        workers = workers or os.cpu_count() or 1
+        if index_levels is not None:
+            index_levels = tuple(index_levels)
+        size = os.path.getsize(path)
+        parts = max(1, min(workers, size // part_size))
+        if parts == 1:
+            self.index = scan_log_range(path, 0, size, chunk_size,
+                                        index_levels)
+            return (self.index)
+        ranges = log_ranges(path, parts)
+        index = LogIndex(path, index_levels)
+        count = len(ranges)
+        with ProcessPoolExecutor(count) as pool:
+            for part in pool.map(scan_log_range, itertools.repeat(path),
+                                 [start for start, _ in ranges],
+                                 [end for _, end in ranges],
+                                 itertools.repeat(chunk_size, count),
+                                 itertools.repeat(index_levels, count)):
+                index.merge(part)
+        self.index = index
+        return (index)
+
+    def alerts(self, limit: Optional[int] = None) -> List[str]:
+        if self.index is None:
+            raise ValueError("No log file scanned yet!")
+        levels = [level for level in ALERT_LEVELS
+                  if level in self.index.counts and self.index.indexed(level)]
+        alerts = []
+        for line in self.index.fetch(*levels, limit=limit):
+            level, _, message = line.partition(": ")
+            alerts.append(f"[ALERT] {level} level detected: {message}")
+        return (alerts)
 
     def format_output(self, result: str) -> str:
         return (super().format_output(result))
@@ -0,0 +1,80 @@
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+
+from data_stream import StreamCheckpoint, StreamProcessor
+
+
+class Payload():
+    def __reduce__(self) -> tuple:
+        return ((print, ("checkpoint payload executed!",)))
+
+
+def check_untrusted(path: str) -> None:
+    blob = pickle.dumps((False, "x", "sensor", Payload()))
+    with open(path, "wb") as file:
+        file.write(StreamCheckpoint.HEADER.pack(
+            StreamCheckpoint.MAGIC, StreamCheckpoint.VERSION, 1, 0))
+        file.write(StreamCheckpoint.LENGTH.pack(len(blob)))
+        file.write(blob)
+    try:
+        StreamProcessor([]).restore(path)
+    except ValueError:
+        return
+    raise SystemExit("a checkpoint referencing globals was restored!")
+
+
+def populate(processor: StreamProcessor, streams: int, records: int) -> None:
+    keys = ["temp", "humidity", "pressure", "wind"]
+    for index in range(streams):
+        kind = ("sensor", "transaction", "event")[index % 3]
+        if kind == "sensor":
+            data = [f"{random.choice(keys)}:{random.uniform(0, 100):.2f}"
+                    for _ in range(records)]
+        elif kind == "transaction":
+            data = [f"{random.choice(['buy', 'sell'])}:"
+                    f"{random.randint(1, 500)}" for _ in range(records)]
+        else:
+            data = [random.choice(["login", "logout", "error"])
+                    for _ in range(records)]
+        processor.route(f"{kind}-{index}", data, kind)
+
+
+if __name__ == "__main__":
+    streams = int(sys.argv[1]) if len(sys.argv) > 1 else 30_000
+    records = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    random.seed(42)
+    processor = StreamProcessor([], capacity=streams)
+    populate(processor, streams, records)
+    print(f"=== Stream checkpoint ({streams} streams, "
+          f"{records} records each) ===")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "streams.ckpt")
+        checkpoint = processor.enable_checkpoint(path)
+        start = time.perf_counter()
+        size = checkpoint.save()
+        full = time.perf_counter() - start
+        print(f"full save       : {full * 1000:8.1f} ms  "
+              f"{size / 1e6:.2f} MB ({size / streams:.0f} B/stream)")
+        for index in random.sample(range(streams), streams // 100):
+            kind = ("sensor", "transaction", "event")[index % 3]
+            processor.registry.get(f"{kind}-{index}")
+        start = time.perf_counter()
+        checkpoint.save()
+        incremental = time.perf_counter() - start
+        print(f"save, 1% dirty  : {incremental * 1000:8.1f} ms  "
+              f"x{full / incremental:.2f}")
+        restarted = StreamProcessor([], capacity=streams)
+        start = time.perf_counter()
+        restored = restarted.restore(path)
+        elapsed = time.perf_counter() - start
+        print(f"restore         : {elapsed * 1000:8.1f} ms  "
+              f"({restored} streams)")
+        sample = "sensor-0"
+        if (restarted.registry.get(sample).get_stats()
+                != processor.registry.get(sample).get_stats()):
+            raise SystemExit("restored stats differ!")
+        check_untrusted(os.path.join(directory, "untrusted.ckpt"))
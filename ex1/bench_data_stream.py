@@ -0,0 +1,59 @@
+import random
+import sys
+import time
+from typing import Any, Callable, List
+
+from data_stream import SensorStream
+
+
+def legacy_sensor(data_batch: List[str]) -> None:
+    for data in data_batch:
+        if len(data.split(':')) < 2:
+            raise ValueError()
+    splitted = [element.split(':') for element in data_batch]
+    for element in splitted:
+        float(element[1])
+    for criteria in ("High", "Medium", "Low"):
+        if criteria == "High":
+            [d for d in data_batch if float(d.split(":")[1]) >= 50]
+        elif criteria == "Medium":
+            [d for d in data_batch if float(d.split(":")[1]) == 25]
+        else:
+            [d for d in data_batch if float(d.split(":")[1]) < 25]
+
+
+def columnar_sensor(data_batch: List[str]) -> None:
+    stream = SensorStream("BENCH")
+    batch = stream.freeze(data_batch)
+    stream.process_batch(batch)
+    for criteria in ("High", "Medium", "Low"):
+        stream.filter_data(batch, criteria)
+    stream.get_stats()
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return (best)
+
+
+def sensor_batch(size: int) -> List[str]:
+    keys = ["temp", "humidity", "pressure", "wind"]
+    return ([
+        f"{random.choice(keys)}:{random.uniform(0, 100):.2f}"
+        for _ in range(size)
+        ])
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(42)
+    batch = sensor_batch(size)
+    print(f"=== Sensor batch parsing benchmark ({size} records) ===")
+    legacy = timed(lambda: legacy_sensor(batch))
+    columnar = timed(lambda: columnar_sensor(batch))
+    print(f"legacy split path : {legacy:.4f}s")
+    print(f"columnar parse    : {columnar:.4f}s x{legacy / columnar:.2f}")
@@ -0,0 +1,72 @@
+import random
+import sys
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from data_stream import (
+    EventStream, SensorReading, SensorStream, TransactionStream,
+    parse_records
+)
+
+
+def measure(func: Callable[[], Any]) -> Tuple[int, Any]:
+    tracemalloc.start()
+    try:
+        kept = func()
+        return (tracemalloc.get_traced_memory()[1], kept)
+    finally:
+        tracemalloc.stop()
+
+
+def split_records(data_batch: List[str]) -> List[List[str]]:
+    return ([data.split(':') for data in data_batch])
+
+
+def reading_objects(data_batch: List[str]) -> List[SensorReading]:
+    return (list(SensorStream("BENCH").records(data_batch)))
+
+
+def streamed(data_batch: List[str]) -> int:
+    stream = SensorStream("BENCH")
+    stream.chunk_size = 4096
+    stream.process_batch(iter(data_batch))
+    return (stream.data_length)
+
+
+def batches(size: int) -> List[Tuple[str, Any, List[Any]]]:
+    keys = ["temp", "humidity", "pressure", "wind"]
+    sensor = [f"{random.choice(keys)}:{random.uniform(0, 100):.2f}"
+              for _ in range(size)]
+    transaction = [f"{random.choice(['buy', 'sell'])}:{random.randint(1, 500)}"
+                   for _ in range(size)]
+    event = [random.choice(["login", "logout", "error"]) for _ in range(size)]
+    return ([("sensor", SensorStream("BENCH"), sensor),
+             ("transaction", TransactionStream("BENCH"), transaction),
+             ("event", EventStream("BENCH"), event)])
+
+
+def report(label: str, peak: int, size: int, base: int) -> None:
+    print(f"{label:26}: peak {peak / 1e6:8.2f} MB  "
+          f"{peak / size:7.1f} B/record  x{base / max(peak, 1):.2f}")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    random.seed(42)
+    print(f"=== Record memory footprint ({size} records) ===")
+    for name, stream, data_batch in batches(size):
+        print(f"--- {name} ---")
+        base = measure(lambda: split_records(data_batch))[0]
+        report("list of split lists", base, size, base)
+        if name == "event":
+            peak = measure(lambda: list(stream.records(data_batch)))[0]
+            report("pooled Event records", peak, size, base)
+            continue
+        peak = measure(lambda: list(stream.records(data_batch)))[0]
+        report("__slots__ records", peak, size, base)
+        typecode = stream.value_typecode
+        peak = measure(lambda: parse_records(data_batch, typecode))[0]
+        report("columnar ParsedBatch", peak, size, base)
+        if name == "sensor":
+            peak = measure(lambda: streamed(data_batch))[0]
+            report("streamed, reused buffer", peak, size, base)
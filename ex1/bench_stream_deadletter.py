@@ -0,0 +1,65 @@
+import contextlib
+import io
+import random
+import sys
+import time
+from typing import Any, List, Tuple
+
+from data_stream import StreamProcessor
+
+BAD = ["temp", "temp:x", 42, "buy:-5", "sell:x"]
+
+
+def make_batches(size: int, rate: float) -> Tuple[List[List[Any]], int]:
+    rng = random.Random(42)
+    keys = ["temp", "humidity", "pressure", "wind"]
+    sensor: List[Any] = []
+    transaction: List[Any] = []
+    bad = 0
+    for index in range(size):
+        if rng.random() < rate:
+            sensor.append(BAD[index % 3])
+            transaction.append(BAD[2 + index % 3])
+            bad += 2
+            continue
+        sensor.append(f"{rng.choice(keys)}:{rng.uniform(0, 100):.2f}")
+        transaction.append(f"{rng.choice(['buy', 'sell'])}:"
+                           f"{rng.randint(1, 500)}")
+    event = [rng.choice(["login", "logout", "error"]) for _ in range(size)]
+    return ([sensor, transaction, event], bad)
+
+
+def run(batches: List[List[Any]], chunk_size: int,
+        dead_letters: bool, repeat: int = 3) -> Tuple[float, int, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        processor = StreamProcessor(["001", "002", "003"],
+                                    chunk_size=chunk_size)
+        queue = processor.enable_dead_letters() if dead_letters else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            merged = processor.process_all(batches)
+            best = min(best, time.perf_counter() - start)
+    accepted = sum(stream.data_length for stream in merged.values())
+    return (best, accepted, queue.failures if queue is not None else 0)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    total = size * 3
+    print(f"=== StreamProcessor dead letters ({total} records, "
+          f"chunks of {chunk_size}) ===")
+    clean, _ = make_batches(size, 0.0)
+    base, _, _ = run(clean, chunk_size, False)
+    print(f"no isolation, 0% bad  : {total / base:12.0f} records/s")
+    for rate in (0.0, 0.01, 0.10):
+        batches, bad = make_batches(size, rate)
+        elapsed, accepted, letters = run(batches, chunk_size, True)
+        _, rejected, _ = run(batches, chunk_size, False, 1)
+        if accepted != total - bad or letters != bad:
+            raise SystemExit(f"{rate:.0%}: accepted {accepted}, "
+                             f"{letters} dead letters for {bad} bad records!")
+        print(f"isolated, {rate:4.0%} bad : {total / elapsed:12.0f} "
+              f"records/s (x{base / elapsed:.2f})  accepted {accepted}, "
+              f"without isolation {rejected}")
@@ -0,0 +1,55 @@
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+from typing import Any, List
+
+from data_stream import StreamProcessor
+
+
+def make_batches(size: int) -> List[List[Any]]:
+    keys = ["temp", "humidity", "pressure", "wind"]
+    sensor = [
+        f"{random.choice(keys)}:{random.uniform(0, 100):.2f}"
+        for _ in range(size)
+        ]
+    transaction = [
+        f"{random.choice(['buy', 'sell'])}:{random.randint(1, 500)}"
+        for _ in range(size)
+        ]
+    event = [random.choice(["login", "logout", "error"]) for _ in range(size)]
+    return ([sensor, transaction, event])
+
+
+def run(executor: str, workers: int, batches: List[List[Any]],
+        chunk_size: int) -> float:
+    processor = StreamProcessor(["001", "002", "003"], executor, workers,
+                                chunk_size)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            processor.process_all(batches)
+            start = time.perf_counter()
+            processor.process_all(batches)
+            return (time.perf_counter() - start)
+    finally:
+        processor.shutdown()
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    chunk_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    random.seed(42)
+    batches = make_batches(size)
+    total = size * len(batches)
+    counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"=== StreamProcessor scaling ({total} records, "
+          f"chunks of {chunk_size}) ===")
+    serial = run("serial", 1, batches, chunk_size)
+    print(f"serial        : {total / serial:12.0f} records/s")
+    for executor in ("thread", "process"):
+        for workers in counts:
+            elapsed = run(executor, workers, batches, chunk_size)
+            print(f"{executor:7} x{workers:<4} : {total / elapsed:12.0f} "
+                  f"records/s (x{serial / elapsed:.2f})")
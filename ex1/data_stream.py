@@ -1,41 +1,1369 @@
+import gc
+import hashlib
+import io
+import math
+import os
+import pickle
+import struct
+import sys
+import time
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional, Union, Dict
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, OrderedDict, deque
+from collections.abc import Sequence
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+)
+from itertools import islice, repeat
+from typing import (
+    Any, Callable, Deque, Iterable, Iterator, List, Optional, Set, Tuple,
+    Type, Union, Dict
+)
+
+Bound = Optional[Union[int, float]]
+Rejected = List[Tuple[Any, Exception]]
+
+
+class QuantileSketch():
+    def __init__(self, accuracy: float = 0.01) -> None:
+        if not 0 < accuracy < 1:
+            raise ValueError("Accuracy should be between 0 and 1!")
+        self.accuracy = accuracy
+        self.gamma = (1 + accuracy) / (1 - accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.positive: Dict[int, int] = {}
+        self.negative: Dict[int, int] = {}
+        self.zero = 0
+        self.count = 0
+
+    def _value(self, index: int) -> float:
+        return (2 * self.gamma ** index / (self.gamma + 1))
+
+    def update(self, value: float) -> None:
+        self.update_batch((value,))
+
+    def update_batch(self, values: Any) -> None:
+        log = math.log
+        ceil = math.ceil
+        log_gamma = self._log_gamma
+        positive = self.positive
+        negative = self.negative
+        for value in values:
+            try:
+                if value > 0:
+                    index = ceil(log(value) / log_gamma)
+                    positive[index] = positive.get(index, 0) + 1
+                elif value < 0:
+                    index = ceil(log(-value) / log_gamma)
+                    negative[index] = negative.get(index, 0) + 1
+                elif value == 0:
+                    self.zero += 1
+                else:
+                    continue
+            except OverflowError:
+                continue
+            self.count += 1
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        if other.accuracy != self.accuracy:
+            raise ValueError("Sketches with different accuracy can't merge!")
+        for mine, theirs in ((self.positive, other.positive),
+                             (self.negative, other.negative)):
+            for index, count in theirs.items():
+                mine[index] = mine.get(index, 0) + count
+        self.zero += other.zero
+        self.count += other.count
+        return (self)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.accuracy, self.zero, self.count,
+                 array('q', self.positive).tobytes(),
+                 array('q', self.positive.values()).tobytes(),
+                 array('q', self.negative).tobytes(),
+                 array('q', self.negative.values()).tobytes()))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "QuantileSketch":
+        sketch = cls(state[0])
+        sketch.zero = state[1]
+        sketch.count = state[2]
+        sketch.positive = dict(zip(array('q', state[3]),
+                                   array('q', state[4])))
+        sketch.negative = dict(zip(array('q', state[5]),
+                                   array('q', state[6])))
+        return (sketch)
+
+    def quantile(self, q: float) -> float:
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile should be between 0 and 1!")
+        if self.count == 0:
+            return (0.0)
+        rank = round(q * (self.count - 1))
+        seen = 0
+        for index in sorted(self.negative, reverse=True):
+            seen += self.negative[index]
+            if seen > rank:
+                return (-self._value(index))
+        seen += self.zero
+        if seen > rank:
+            return (0.0)
+        for index in sorted(self.positive):
+            seen += self.positive[index]
+            if seen > rank:
+                return (self._value(index))
+        return (self._value(max(self.positive)))
+
+
+class RunningStats():
+    def __init__(self, accuracy: float = 0.01,
+                 quantiles: bool = False) -> None:
+        self.count = 0
+        self.sum: Union[int, float] = 0
+        self.mean = 0.0
+        self.min: Optional[Union[int, float]] = None
+        self.max: Optional[Union[int, float]] = None
+        self._m2 = 0.0
+        self.sketch: Optional[QuantileSketch] = None
+        if quantiles:
+            self.sketch = QuantileSketch(accuracy)
+
+    @property
+    def variance(self) -> float:
+        return (self._m2 / self.count if self.count else 0.0)
+
+    def update(self, value: Union[int, float]) -> None:
+        self.count += 1
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        if self.sketch is not None:
+            self.sketch.update(value)
+
+    def merge_summary(self, count: int, total: Union[int, float], m2: float,
+                      low: Union[int, float],
+                      high: Union[int, float]) -> None:
+        if count == 0:
+            return
+        mean = total / count
+        merged = self.count + count
+        delta = mean - self.mean
+        self._m2 += m2 + delta * delta * self.count * count / merged
+        self.mean += delta * count / merged
+        self.count = merged
+        self.sum += total
+        if self.min is None or low < self.min:
+            self.min = low
+        if self.max is None or high > self.max:
+            self.max = high
+
+    def update_batch(self, values: Any) -> None:
+        if len(values) == 0:
+            return
+        total = sum(values)
+        mean = total / len(values)
+        m2 = sum((value - mean) * (value - mean) for value in values)
+        self.merge_summary(len(values), total, m2, min(values), max(values))
+        if self.sketch is not None:
+            self.sketch.update_batch(values)
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        if self.sketch is not None and other.sketch is None:
+            raise ValueError("Stats without quantiles can't merge in!")
+        self.merge_summary(other.count, other.sum, other._m2,
+                           other.min, other.max)
+        if self.sketch is not None:
+            self.sketch.merge(other.sketch)
+        return (self)
+
+    def quantile(self, q: float) -> float:
+        if self.sketch is None:
+            raise ValueError("Quantiles are off, use quantiles=True!")
+        return (self.sketch.quantile(q))
+
+    def get_state(self) -> Tuple[Any, ...]:
+        sketch = None if self.sketch is None else self.sketch.get_state()
+        return ((self.count, self.sum, self.mean, self.min, self.max,
+                 self._m2, sketch))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "RunningStats":
+        stats = cls()
+        (stats.count, stats.sum, stats.mean, stats.min, stats.max,
+         stats._m2) = state[:6]
+        if state[6] is not None:
+            stats.sketch = QuantileSketch.from_state(state[6])
+        return (stats)
+
+    def as_dict(self) -> Dict[str, Union[int, float, None]]:
+        stats: Dict[str, Union[int, float, None]] = {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.mean,
+            'variance': self.variance,
+            'min': self.min,
+            'max': self.max,
+            }
+        if self.sketch is not None:
+            for q in (0.5, 0.9, 0.99):
+                stats[f'p{int(q * 100)}'] = self.quantile(q)
+        return (stats)
+
+
+def stable_hash(key: Any) -> int:
+    data = key.encode() if isinstance(key, str) else repr(key).encode()
+    return (int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(),
+                           'little'))
+
+
+class CountMinSketch():
+    def __init__(self, epsilon: float = 0.01, delta: float = 0.01) -> None:
+        if not 0 < epsilon < 1 or not 0 < delta < 1:
+            raise ValueError("Epsilon and delta should be between 0 and 1!")
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = math.ceil(math.e / epsilon)
+        self.depth = math.ceil(math.log(1 / delta))
+        self.table = array('q', bytes(8 * self.width * self.depth))
+        self.count = 0
+
+    def _cells(self, key: Any) -> Iterator[int]:
+        value = stable_hash(key)
+        first = value & 0xFFFFFFFF
+        second = (value >> 32) | 1
+        width = self.width
+        for row in range(self.depth):
+            yield (row * width + (first + row * second) % width)
+
+    def add(self, key: Any, count: int = 1) -> None:
+        table = self.table
+        for cell in self._cells(key):
+            table[cell] += count
+        self.count += count
+
+    def estimate(self, key: Any) -> int:
+        table = self.table
+        return (min(table[cell] for cell in self._cells(key)))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        if (other.width, other.depth) != (self.width, self.depth):
+            raise ValueError("Sketches with different sizes can't merge!")
+        self.table = array('q', map(sum, zip(self.table, other.table)))
+        self.count += other.count
+        return (self)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.epsilon, self.delta, self.count, self.table.tobytes()))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "CountMinSketch":
+        sketch = cls(state[0], state[1])
+        sketch.count = state[2]
+        sketch.table = array('q', state[3])
+        return (sketch)
+
+
+class HyperLogLog():
+    def __init__(self, precision: int = 12) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("Precision should be between 4 and 18!")
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(self.size)
+
+    def add(self, key: Any) -> None:
+        value = stable_hash(key)
+        bits = 64 - self.precision
+        index = value >> bits
+        rank = bits - (value & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def estimate(self) -> int:
+        size = self.size
+        alpha = 0.7213 / (1 + 1.079 / size)
+        estimate = alpha * size * size / sum(
+            2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * size and zeros:
+            estimate = size * math.log(size / zeros)
+        return (round(estimate))
+
+    @property
+    def error(self) -> float:
+        return (1.04 / math.sqrt(self.size))
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        if other.precision != self.precision:
+            raise ValueError("Sketches with different precision can't merge!")
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return (self)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.precision, bytes(self.registers)))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "HyperLogLog":
+        sketch = cls(state[0])
+        sketch.registers = bytearray(state[1])
+        return (sketch)
+
+
+class TopK():
+    def __init__(self, k: int = 10, capacity: Optional[int] = None) -> None:
+        if k <= 0:
+            raise ValueError("K should be positive!")
+        self.k = k
+        self.capacity = max(capacity or 4 * k, k)
+        self.counts: Dict[Any, int] = {}
+        self.errors: Dict[Any, int] = {}
+
+    def add(self, key: Any, count: int = 1) -> None:
+        counts = self.counts
+        if key in counts:
+            counts[key] += count
+            return
+        if len(counts) < self.capacity:
+            counts[key] = count
+            self.errors[key] = 0
+            return
+        smallest = min(counts, key=counts.__getitem__)
+        floor = counts.pop(smallest)
+        del self.errors[smallest]
+        counts[key] = floor + count
+        self.errors[key] = floor
+
+    def _trim(self) -> None:
+        if len(self.counts) <= self.capacity:
+            return
+        kept = sorted(self.counts, key=self.counts.__getitem__,
+                      reverse=True)[:self.capacity]
+        self.counts = {key: self.counts[key] for key in kept}
+        self.errors = {key: self.errors[key] for key in kept}
+
+    def top(self) -> List[Tuple[Any, int]]:
+        ranked = sorted(self.counts.items(), key=lambda item: item[1],
+                        reverse=True)
+        return (ranked[:self.k])
+
+    def merge(self, other: "TopK") -> "TopK":
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+            self.errors[key] = self.errors.get(key, 0) + other.errors[key]
+        self._trim()
+        return (self)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.k, self.capacity, tuple(self.counts.items()),
+                 tuple(self.errors.items())))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "TopK":
+        sketch = cls(state[0], state[1])
+        sketch.counts = dict(state[2])
+        sketch.errors = dict(state[3])
+        return (sketch)
+
+
+class StreamSketches():
+    def __init__(self, epsilon: float = 0.01, delta: float = 0.01,
+                 precision: int = 12, k: int = 10,
+                 accuracy: float = 0.01) -> None:
+        self.frequencies = CountMinSketch(epsilon, delta)
+        self.distinct = HyperLogLog(precision)
+        self.top = TopK(k)
+        self.quantiles = QuantileSketch(accuracy)
+
+    def update(self, keys: Iterable[Any], values: Any = None) -> None:
+        frequencies = self.frequencies
+        distinct = self.distinct
+        top = self.top
+        for key, count in Counter(keys).items():
+            frequencies.add(key, count)
+            distinct.add(key)
+            top.add(key, count)
+        if values is not None:
+            self.quantiles.update_batch(values)
+
+    def spawn(self) -> "StreamSketches":
+        return (StreamSketches(self.frequencies.epsilon,
+                               self.frequencies.delta,
+                               self.distinct.precision, self.top.k,
+                               self.quantiles.accuracy))
+
+    def merge(self, other: "StreamSketches") -> "StreamSketches":
+        self.frequencies.merge(other.frequencies)
+        self.distinct.merge(other.distinct)
+        self.top.merge(other.top)
+        self.quantiles.merge(other.quantiles)
+        return (self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            'distinct': self.distinct.estimate(),
+            'distinct_error': self.distinct.error,
+            'top': [[key, count, self.frequencies.estimate(key)]
+                    for key, count in self.top.top()],
+            'frequency_error': self.frequencies.epsilon
+            * self.frequencies.count,
+            }
+        if self.quantiles.count:
+            result['quantiles'] = {
+                f'p{int(q * 100)}': self.quantiles.quantile(q)
+                for q in (0.5, 0.9, 0.99)
+                }
+        return (result)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.frequencies.get_state(), self.distinct.get_state(),
+                 self.top.get_state(), self.quantiles.get_state()))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "StreamSketches":
+        sketches = cls.__new__(cls)
+        sketches.frequencies = CountMinSketch.from_state(state[0])
+        sketches.distinct = HyperLogLog.from_state(state[1])
+        sketches.top = TopK.from_state(state[2])
+        sketches.quantiles = QuantileSketch.from_state(state[3])
+        return (sketches)
+
+
+class SensorReading():
+    __slots__ = ('key', 'value')
+
+    def __init__(self, key: str, value: float) -> None:
+        self.key = key
+        self.value = value
+
+    def __iter__(self) -> Iterator[Any]:
+        yield self.key
+        yield self.value
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return (NotImplemented)
+        return (tuple(self) == tuple(other))
+
+    def __repr__(self) -> str:
+        return (f"{self.key}:{self.value}")
+
+
+class Transaction(SensorReading):
+    __slots__ = ()
+
+    @property
+    def kind(self) -> str:
+        return (self.key)
+
+    @property
+    def amount(self) -> int:
+        return (self.value)
+
+
+class Event():
+    __slots__ = ('name',)
+    pool_size = 4096
+    _pool: Dict[str, "Event"] = {}
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    @classmethod
+    def of(cls, name: str) -> "Event":
+        event = cls._pool.get(name)
+        if event is None:
+            event = cls(name)
+            if len(cls._pool) < cls.pool_size:
+                cls._pool[name] = event
+        return (event)
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not Event:
+            return (NotImplemented)
+        return (self.name == other.name)
+
+    def __hash__(self) -> int:
+        return (hash(self.name))
+
+    def __repr__(self) -> str:
+        return (self.name)
+
+
+class ParsedBatch():
+    __slots__ = ('keys', 'values')
+
+    def __init__(self, keys: List[str], values: array) -> None:
+        self.keys = keys
+        self.values = values
+
+    def __len__(self) -> int:
+        return (len(self.values))
+
+    def group_by_key(self) -> Dict[str, Any]:
+        groups: Dict[str, Any] = {}
+        typecode = getattr(self.values, 'typecode', None)
+        for key, value in zip(self.keys, self.values):
+            column = groups.get(key)
+            if column is None:
+                column = groups[key] = array(typecode) if typecode else []
+            column.append(value)
+        return (groups)
+
+
+def parse_fields(data_batch: Iterable[Any], typecode: str) -> ParsedBatch:
+    cast = float if typecode == 'd' else int
+    intern = sys.intern
+    keys: List[str] = []
+    values: List[Union[int, float]] = []
+    for record in data_batch:
+        if type(record) is not str:
+            raise ValueError()
+        fields = record.split(':')
+        if len(fields) < 2:
+            raise ValueError()
+        keys.append(intern(fields[0]))
+        values.append(cast(fields[1]))
+    try:
+        return (ParsedBatch(keys, array(typecode, values)))
+    except OverflowError:
+        return (ParsedBatch(keys, values))
+
+
+def parse_records(data_batch: Iterable[Any], typecode: str = 'd',
+                  out: Optional[ParsedBatch] = None) -> ParsedBatch:
+    cast = float if typecode == 'd' else int
+    intern = sys.intern
+    if out is not None and getattr(out.values, 'typecode', None) == typecode:
+        keys = out.keys
+        values = out.values
+        keys.clear()
+        del values[:]
+    else:
+        out = ParsedBatch([], array(typecode))
+        keys = out.keys
+        values = out.values
+    append_key = keys.append
+    append_value = values.append
+    try:
+        for record in data_batch:
+            if type(record) is not str:
+                raise ValueError()
+            key, sep, value = record.partition(':')
+            if not sep:
+                raise ValueError()
+            append_key(intern(key))
+            append_value(cast(value))
+    except (ValueError, OverflowError):
+        if iter(data_batch) is data_batch:
+            raise ValueError()
+        return (parse_fields(data_batch, typecode))
+    return (out)
+
+
+class BatchView(Sequence):
+    def __init__(self, data_batch: List[Any], positions: Any,
+                 ordered: bool = True) -> None:
+        self.data_batch = data_batch
+        self.positions = positions
+        self.ordered = ordered
+
+    def _ordered_positions(self) -> Any:
+        if not self.ordered:
+            self.positions = sorted(self.positions)
+            self.ordered = True
+        return (self.positions)
+
+    def __len__(self) -> int:
+        return (len(self.positions))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        positions = self._ordered_positions()
+        if isinstance(index, slice):
+            return (BatchView(self.data_batch, positions[index]))
+        return (self.data_batch[positions[index]])
+
+    def __iter__(self) -> Iterator[Any]:
+        data_batch = self.data_batch
+        for position in self._ordered_positions():
+            yield data_batch[position]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, BatchView)):
+            return (list(self) == list(other))
+        return (NotImplemented)
+
+    def __repr__(self) -> str:
+        return (repr(list(self)))
+
+
+class ValueIndex():
+    __slots__ = ('order', 'values')
+
+    def __init__(self, parsed: ParsedBatch) -> None:
+        values = parsed.values
+        order = sorted(
+            (position for position, value in enumerate(values)
+             if value == value),
+            key=values.__getitem__)
+        self.order = memoryview(array('q', order))
+        self.values = [values[i] for i in order]
+        if isinstance(values, array):
+            self.values = array(values.typecode, self.values)
+
+    def span(self, low: Bound = None, high: Bound = None,
+             closed: bool = False) -> Tuple[int, int]:
+        start = 0 if low is None else bisect_left(self.values, low)
+        if high is None:
+            end = len(self.values)
+        elif closed:
+            end = bisect_right(self.values, high)
+        else:
+            end = bisect_left(self.values, high)
+        return (start, max(start, end))
+
+    def count(self, low: Bound = None, high: Bound = None,
+              closed: bool = False) -> int:
+        start, end = self.span(low, high, closed)
+        return (end - start)
+
+    def positions(self, low: Bound = None, high: Bound = None,
+                  closed: bool = False) -> memoryview:
+        start, end = self.span(low, high, closed)
+        return (self.order[start:end])
+
+
+class NameIndex():
+    __slots__ = ('positions',)
+
+    def __init__(self, data_batch: List[Any]) -> None:
+        self.positions: Dict[Any, array] = {}
+        for position, name in enumerate(data_batch):
+            column = self.positions.get(name)
+            if column is None:
+                column = self.positions[name] = array('q')
+            column.append(position)
+
+    def count(self, name: Any) -> int:
+        return (len(self.positions.get(name, ())))
+
+    def lookup(self, name: Any) -> array:
+        return (self.positions.get(name, array('q')))
+
+
+class IndexedBatch(Sequence):
+    __slots__ = ('batch', 'stream_type', 'parsed', 'index')
+
+    def __init__(self, data_batch: Iterable[Any],
+                 stream_type: Type[Any]) -> None:
+        self.batch = tuple(data_batch)
+        self.stream_type = stream_type
+        self.parsed: Optional[ParsedBatch] = None
+        self.index: Any = None
+
+    def __len__(self) -> int:
+        return (len(self.batch))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        return (self.batch[index])
+
+    def __iter__(self) -> Iterator[Any]:
+        return (iter(self.batch))
+
+    def count(self, value: Any) -> int:
+        return (self.batch.count(value))
+
+    def __repr__(self) -> str:
+        return (f"IndexedBatch({list(self.batch)!r})")
+
+
+class Expr(ABC):
+    uses_value = True
+
+    @abstractmethod
+    def source(self, consts: List[Any]) -> str:
+        pass
+
+    def bounds(self) -> Optional[Tuple[Bound, Bound, bool]]:
+        return (None)
+
+    def names(self) -> Optional[frozenset]:
+        return (None)
+
+    def __and__(self, other: "Expr") -> "Expr":
+        return (And(self, other))
+
+    def __or__(self, other: "Expr") -> "Expr":
+        return (Or(self, other))
+
+    def __invert__(self) -> "Expr":
+        return (Not(self))
+
+    def predicate(self) -> Callable[[Any, Any], bool]:
+        return (compile_predicate(self))
+
+
+def _const(consts: List[Any], value: Any) -> str:
+    consts.append(value)
+    return (f"c{len(consts) - 1}")
+
+
+class Compare(Expr):
+    operators = ('<', '<=', '>', '>=', '==', '!=')
+
+    def __init__(self, op: str, bound: Union[int, float]) -> None:
+        if op not in self.operators:
+            raise ValueError(f"Unknown operator: {op}")
+        if not isinstance(bound, (int, float)):
+            raise TypeError("Bound should be a number!")
+        self.op = op
+        self.bound = bound
+
+    def source(self, consts: List[Any]) -> str:
+        return (f"value {self.op} {_const(consts, self.bound)}")
+
+    def bounds(self) -> Optional[Tuple[Bound, Bound, bool]]:
+        return ({
+            '>=': (self.bound, None, False),
+            '<': (None, self.bound, False),
+            '==': (self.bound, self.bound, True),
+            }.get(self.op))
+
+
+class Range(Expr):
+    def __init__(self, low: Bound = None, high: Bound = None,
+                 closed: bool = False) -> None:
+        for bound in (low, high):
+            if bound is not None and not isinstance(bound, (int, float)):
+                raise TypeError("Bounds should be numbers!")
+        self.low = low
+        self.high = high
+        self.closed = closed
+
+    def source(self, consts: List[Any]) -> str:
+        parts = []
+        if self.low is not None:
+            parts.append(f"{_const(consts, self.low)} <= value")
+        if self.high is not None:
+            op = "<=" if self.closed else "<"
+            parts.append(f"value {op} {_const(consts, self.high)}")
+        if not parts:
+            return ("value == value")
+        return (" and ".join(parts))
+
+    def bounds(self) -> Optional[Tuple[Bound, Bound, bool]]:
+        return ((self.low, self.high, self.closed))
+
+
+class KeyIs(Expr):
+    uses_value = False
+
+    def __init__(self, *keys: Any) -> None:
+        if not keys:
+            raise ValueError("KeyIs needs at least one key!")
+        self.keys = frozenset(keys)
+
+    def source(self, consts: List[Any]) -> str:
+        if len(self.keys) == 1:
+            return (f"key == {_const(consts, next(iter(self.keys)))}")
+        return (f"key in {_const(consts, self.keys)}")
+
+    def names(self) -> Optional[frozenset]:
+        return (self.keys)
+
+
+class And(Expr):
+    def __init__(self, *parts: Expr) -> None:
+        self.parts = parts
+        self.uses_value = any(part.uses_value for part in parts)
+
+    def source(self, consts: List[Any]) -> str:
+        return ("(" + " and ".join(part.source(consts)
+                                   for part in self.parts) + ")")
+
+
+class Or(And):
+    def source(self, consts: List[Any]) -> str:
+        return ("(" + " or ".join(part.source(consts)
+                                  for part in self.parts) + ")")
+
+
+class Not(Expr):
+    def __init__(self, part: Expr) -> None:
+        self.part = part
+        self.uses_value = part.uses_value
+
+    def source(self, consts: List[Any]) -> str:
+        return (f"(not {self.part.source(consts)})")
+
+
+class ValueField():
+    def __lt__(self, bound: Union[int, float]) -> Expr:
+        return (Compare('<', bound))
+
+    def __le__(self, bound: Union[int, float]) -> Expr:
+        return (Compare('<=', bound))
+
+    def __gt__(self, bound: Union[int, float]) -> Expr:
+        return (Compare('>', bound))
+
+    def __ge__(self, bound: Union[int, float]) -> Expr:
+        return (Compare('>=', bound))
+
+    def __eq__(self, bound: Any) -> Expr:  # type: ignore[override]
+        return (Compare('==', bound))
+
+    def __ne__(self, bound: Any) -> Expr:  # type: ignore[override]
+        return (Compare('!=', bound))
+
+    def between(self, low: Bound = None, high: Bound = None,
+                closed: bool = False) -> Expr:
+        return (Range(low, high, closed))
+
+
+class KeyField():
+    def __eq__(self, name: Any) -> Expr:  # type: ignore[override]
+        return (KeyIs(name))
+
+    def __ne__(self, name: Any) -> Expr:  # type: ignore[override]
+        return (Not(KeyIs(name)))
+
+    def isin(self, names: Iterable[Any]) -> Expr:
+        return (KeyIs(*names))
+
+
+record_value = ValueField()
+record_key = KeyField()
+_scanners: Dict[str, Callable[..., Any]] = {}
+
+
+def _factory(body: str, consts: List[Any]) -> Callable[..., Any]:
+    names = ", ".join(f"c{index}" for index in range(len(consts)))
+    factory = _scanners.get(body)
+    if factory is None:
+        if len(_scanners) >= 256:
+            _scanners.clear()
+        namespace: Dict[str, Any] = {}
+        exec(f"def factory({names}):\n{body}\n    return scan\n",
+             namespace)
+        factory = _scanners[body] = namespace["factory"]
+    return (factory(*consts))
+
+
+def compile_predicate(expr: Expr) -> Callable[[Any, Any], bool]:
+    consts: List[Any] = []
+    condition = expr.source(consts)
+    body = (f"    def scan(key, value):\n"
+            f"        return {condition}")
+    return (_factory(body, consts))
+
+
+def compile_scan(exprs: List[Expr]) -> Callable[..., Tuple[List[int], ...]]:
+    consts: List[Any] = []
+    lines = ["    def scan(keys, values):"]
+    results = ", ".join(f"r{index}" for index in range(len(exprs)))
+    for index in range(len(exprs)):
+        lines.append(f"        r{index} = []")
+    lines.append("        for i, (key, value) in "
+                 "enumerate(zip(keys, values)):")
+    for index, expr in enumerate(exprs):
+        lines.append(f"            if {expr.source(consts)}:")
+        lines.append(f"                r{index}.append(i)")
+    lines.append(f"        return ({results},)")
+    return (_factory("\n".join(lines), consts))
+
+
+def read_lines(source: Any) -> Iterator[str]:
+    for line in source:
+        if isinstance(line, (bytes, bytearray)):
+            line = line.decode()
+        line = line.rstrip('\r\n')
+        if line:
+            yield line
+
+
+def chunked(data_batch: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    if isinstance(data_batch, list):
+        for start in range(0, len(data_batch), size):
+            yield data_batch[start:start + size]
+        return
+    if hasattr(data_batch, 'readline'):
+        data_batch = read_lines(data_batch)
+    iterator = iter(data_batch)
+    while True:
+        chunk = list(islice(iterator, size))
+        if len(chunk) == 0:
+            return
+        yield chunk
+
+
+class SlidingWindow():
+    def __init__(self, size: float, slide: Optional[float] = None,
+                 by: str = "count") -> None:
+        if by not in ("count", "time"):
+            raise ValueError("Window should be by count or time!")
+        slide = size if slide is None else slide
+        if size <= 0 or slide <= 0 or slide > size:
+            raise ValueError("Window needs 0 < slide <= size!")
+        if by == "count" and (size != int(size) or slide != int(slide)):
+            raise ValueError("Count windows need integer sizes!")
+        self.size = size
+        self.slide = slide
+        self.by = by
+        self.pane_count = math.ceil(size / slide)
+        self.panes: Deque[Tuple[int, Dict[str, float]]] = deque()
+        self.totals: Dict[str, float] = {}
+        self.index: Optional[int] = None
+        self.position = 0
+        self.late = 0
+
+    def _advance(self, index: int) -> None:
+        self.panes.append((index, {}))
+        self.index = index
+        oldest = index - self.pane_count
+        panes = self.panes
+        totals = self.totals
+        while panes[0][0] <= oldest:
+            for key, amount in panes.popleft()[1].items():
+                left = totals.get(key, 0) - amount
+                if left == 0:
+                    totals.pop(key, None)
+                else:
+                    totals[key] = left
+
+    def _pane(self, index: int) -> Optional[Dict[str, float]]:
+        if self.index is None or index > self.index:
+            self._advance(index)
+            return (self.panes[-1][1])
+        if index <= self.index - self.pane_count:
+            return (None)
+        panes = self.panes
+        for position in range(len(panes) - 1, -1, -1):
+            if panes[position][0] == index:
+                return (panes[position][1])
+            if panes[position][0] < index:
+                panes.insert(position + 1, (index, {}))
+                return (panes[position + 1][1])
+        panes.appendleft((index, {}))
+        return (panes[0][1])
+
+    def _merge(self, index: int, counts: Dict[str, float]) -> None:
+        pane = self._pane(index)
+        if pane is None:
+            self.late += 1
+            return
+        totals = self.totals
+        for key, amount in counts.items():
+            pane[key] = pane.get(key, 0) + amount
+            total = totals.get(key, 0) + amount
+            if total == 0:
+                totals.pop(key, None)
+            else:
+                totals[key] = total
+
+    def add(self, key: str, amount: float = 1,
+            timestamp: Optional[float] = None) -> None:
+        if self.by == "count":
+            timestamp = self.position
+            self.position += 1
+        elif timestamp is None:
+            timestamp = time.time()
+        self._merge(int(timestamp // self.slide), {key: amount})
+
+    def add_batch(self, keys: List[str], amounts: Optional[Iterable] = None,
+                  timestamps: Optional[Iterable[float]] = None) -> None:
+        amounts = repeat(1) if amounts is None else iter(amounts)
+        if self.by == "time" and timestamps is not None:
+            slide = self.slide
+            for key, amount, timestamp in zip(keys, amounts, timestamps):
+                self._merge(int(timestamp // slide), {key: amount})
+            return
+        if self.by == "time":
+            segments = [(int(time.time() // self.slide), len(keys))]
+        else:
+            segments = []
+            position = self.position
+            end = position + len(keys)
+            while position < end:
+                index = position // self.slide
+                stop = min(end, (index + 1) * self.slide)
+                segments.append((index, stop - position))
+                position = stop
+            self.position = end
+        iterator = iter(keys)
+        for index, length in segments:
+            counts: Dict[str, float] = {}
+            get = counts.get
+            for key, amount in zip(islice(iterator, length), amounts):
+                counts[key] = get(key, 0) + amount
+            self._merge(index, counts)
+
+    def values(self, now: Optional[float] = None) -> Dict[str, float]:
+        if now is not None and self.by == "time":
+            index = int(now // self.slide)
+            if self.index is None or index > self.index:
+                self._advance(index)
+        return (dict(self.totals))
+
+    def get(self, key: str, default: float = 0) -> float:
+        return (self.totals.get(key, default))
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.size, self.slide, self.by, self.index, self.position,
+                 self.late,
+                 tuple((index, dict(counts)) for index, counts in self.panes),
+                 dict(self.totals)))
+
+    def load_state(self, state: Tuple[Any, ...]) -> None:
+        self.index, self.position, self.late = state[3:6]
+        self.panes = deque((index, dict(counts))
+                           for index, counts in state[6])
+        self.totals = dict(state[7])
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "SlidingWindow":
+        window = cls(state[0], state[1], state[2])
+        window.load_state(state)
+        return (window)
+
+    def bounds(self) -> Tuple[float, float]:
+        if self.index is None:
+            return ((0, 0))
+        end = (self.index + 1) * self.slide
+        return ((max(0, end - self.pane_count * self.slide), end))
 
 
 class DataStream(ABC):
+    value_typecode = 'd'
+    min_value: Union[int, float] = -math.inf
+    record_type: Type[Any] = SensorReading
+    chunk_size = 65536
+    unit = "records"
+    priority_ranges: Dict[str, Tuple[Bound, Bound, bool]] = {
+        "High": (50, None, False),
+        "Medium": (25, 50, False),
+        "Low": (None, 25, False),
+        }
+
+    def __init__(self, stream_id: str) -> None:
+        self.stream_id = stream_id
+        self.data_length = 0
+        self.total_length = 0
+        self._scratch: Optional[ParsedBatch] = None
+        self.windows: Dict[str, SlidingWindow] = {}
+        self.window_log: Optional[List[Tuple[List[str], Any, Any]]] = None
+        self.sketches: Optional[StreamSketches] = None
+        self.exact = True
+
     @abstractmethod
-    def process_batch(self, data_batch: List[Any]) -> str:
-        if (not isinstance(data_batch, list) or len(data_batch) == 0):
+    def process_batch(self, data_batch: Iterable[Any]) -> str:
+        if (
+            isinstance(data_batch, (str, bytes, bytearray, dict))
+            or not hasattr(data_batch, '__iter__')
+            or (isinstance(data_batch, list) and len(data_batch) == 0)
+        ):
             raise TypeError()
-        self.data_length = len(data_batch)
+        self.data_length = 0
+
+    def iter_chunks(self, data_batch: Iterable[Any]) -> Iterator[List[Any]]:
+        if isinstance(data_batch, (list, IndexedBatch)):
+            yield data_batch
+            return
+        yield from chunked(data_batch, self.chunk_size)
+
+    @classmethod
+    def parse_record(cls, record: Any) -> Tuple[str, Union[int, float]]:
+        if type(record) is str:
+            fields = record.split(':')
+            if len(fields) > 1:
+                try:
+                    if cls.value_typecode == 'd':
+                        return ((fields[0], float(fields[1])))
+                    return ((fields[0], int(fields[1])))
+                except ValueError:
+                    pass
+        raise ValueError(f"Record should be 'key:number', got {record!r}")
+
+    @classmethod
+    def check_record(cls, record: Any) -> Tuple[str, Union[int, float]]:
+        return (cls.parse_record(record))
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str] =
-                    None) -> List[Any]:
+    @classmethod
+    def partition(cls, chunk: List[Any]) -> Tuple[Sequence, Rejected]:
+        cast = float if cls.value_typecode == 'd' else int
+        floor = cls.min_value
+        intern = sys.intern
+        keys: List[str] = []
+        values: List[Union[int, float]] = []
+        good: List[Any] = []
+        rejected: Rejected = []
+        check = cls.check_record
+        for record in chunk:
+            if type(record) is str:
+                key, sep, text = record.partition(':')
+                if sep:
+                    try:
+                        value = cast(text)
+                    except ValueError:
+                        sep = ''
+                if sep and value >= floor:
+                    keys.append(intern(key))
+                    values.append(value)
+                    good.append(record)
+                    continue
+            try:
+                key, value = check(record)
+            except ValueError as error:
+                rejected.append((record, error.with_traceback(None)))
+                continue
+            keys.append(intern(key))
+            values.append(value)
+            good.append(record)
+        batch = IndexedBatch(good, cls)
+        try:
+            batch.parsed = ParsedBatch(keys, array(cls.value_typecode, values))
+        except OverflowError:
+            batch.parsed = ParsedBatch(keys, values)
+        return ((batch, rejected))
+
+    def stage(self, data_batch: Iterable[Any]) -> "DataStream":
+        if isinstance(data_batch, (list, IndexedBatch)):
+            return (self)
+        staged = type(self)(self.stream_id)
+        staged.exact = self.exact
+        if self.sketches is not None:
+            staged.sketches = self.sketches.spawn()
+        staged.windows = {name: SlidingWindow.from_state(window.get_state())
+                          for name, window in self.windows.items()}
+        if self.window_log is not None:
+            staged.window_log = []
+        return (staged)
+
+    def commit(self, staged: "DataStream") -> None:
+        if staged is self:
+            return
+        for name, window in staged.windows.items():
+            self.windows[name].load_state(window.get_state())
+        log = staged.window_log
+        staged.windows = {}
+        staged.window_log = None
+        self.merge(staged)
+        if log:
+            self.window_log.extend(log)
+
+    def summary(self) -> str:
+        return (f"{self.data_length} {self.unit} processed")
+
+    def add_window(self, name: str, size: float,
+                   slide: Optional[float] = None,
+                   by: str = "count") -> SlidingWindow:
+        self.windows[name] = SlidingWindow(size, slide, by)
+        return (self.windows[name])
+
+    @property
+    def windowed(self) -> bool:
+        return (bool(self.windows) or self.window_log is not None)
+
+    def record_windows(self) -> None:
+        self.window_log = []
+
+    def update_windows(self, keys: List[str],
+                       amounts: Optional[Iterable] = None,
+                       timestamps: Optional[Iterator[float]] = None) -> None:
+        if timestamps is not None:
+            timestamps = list(islice(timestamps, len(keys)))
+            if len(timestamps) != len(keys):
+                raise ValueError()
+        for window in self.windows.values():
+            window.add_batch(keys, amounts, timestamps)
+        if self.window_log is not None:
+            self.window_log.append((
+                list(keys), None if amounts is None else list(amounts),
+                timestamps))
+
+    def window_stats(self, name: str, now: Optional[float] = None
+                     ) -> Dict[str, Any]:
+        return (self.windows[name].values(now))
+
+    def all_window_stats(self, now: Optional[float] = None
+                         ) -> Dict[str, Dict[str, Any]]:
+        return ({name: self.window_stats(name, now)
+                 for name in self.windows})
+
+    def merge(self, other: "DataStream") -> None:
+        self.data_length += other.data_length
+        self.total_length += other.total_length
+        if other.window_log:
+            for keys, amounts, timestamps in other.window_log:
+                self.update_windows(keys, amounts, timestamps)
+        if other.sketches is not None:
+            if self.sketches is None:
+                self.sketches = other.sketches
+                self.exact = other.exact
+            else:
+                self.sketches.merge(other.sketches)
+
+    def enable_sketches(self, exact: bool = True,
+                        **options: Any) -> StreamSketches:
+        self.sketches = StreamSketches(**options)
+        self.exact = exact
+        return (self.sketches)
+
+    def update_sketches(self, keys: Iterable[Any], values: Any = None) -> None:
+        if self.sketches is not None:
+            self.sketches.update(keys, values)
+
+    def estimate_count(self, key: Any) -> int:
+        if self.sketches is None:
+            raise ValueError("Sketches are not enabled!")
+        return (self.sketches.frequencies.estimate(key))
+
+    def get_state(self) -> Tuple[Any, ...]:
+        windows = tuple((name, window.get_state())
+                        for name, window in self.windows.items())
+        sketches = None
+        if self.sketches is not None:
+            sketches = (self.exact, self.sketches.get_state())
+        return ((self.total_length, windows, sketches))
+
+    def set_state(self, state: Tuple[Any, ...]) -> None:
+        self.total_length = state[0]
+        self.windows = {name: SlidingWindow.from_state(window)
+                        for name, window in state[1]}
+        if state[2] is not None:
+            self.exact = state[2][0]
+            self.sketches = StreamSketches.from_state(state[2][1])
+
+    def release(self) -> "DataStream":
+        self._scratch = None
+        return (self)
+
+    def freeze(self, data_batch: Iterable[Any]) -> IndexedBatch:
+        if (
+            isinstance(data_batch, IndexedBatch)
+            and data_batch.stream_type is type(self)
+        ):
+            return (data_batch)
+        return (IndexedBatch(data_batch, type(self)))
+
+    def parse_batch(self, data_batch: List[Any],
+                    reuse: bool = False) -> ParsedBatch:
+        if (
+            isinstance(data_batch, IndexedBatch)
+            and data_batch.stream_type is type(self)
+        ):
+            if data_batch.parsed is None:
+                data_batch.parsed = parse_records(data_batch.batch,
+                                                  self.value_typecode)
+            return (data_batch.parsed)
+        if reuse:
+            self._scratch = parse_records(data_batch, self.value_typecode,
+                                          self._scratch)
+            return (self._scratch)
+        return (parse_records(data_batch, self.value_typecode))
+
+    def records(self, data_batch: List[Any]) -> Iterator[Any]:
+        parsed = self.parse_batch(data_batch)
+        record_type = self.record_type
+        for key, value in zip(parsed.keys, parsed.values):
+            yield record_type(key, value)
+
+    def build_index(self, data_batch: List[Any]) -> Any:
+        return (ValueIndex(self.parse_batch(data_batch)))
+
+    def index_batch(self, data_batch: List[Any]) -> Any:
+        batch = self.freeze(data_batch)
+        if batch.index is None:
+            batch.index = self.build_index(batch)
+        return (batch.index)
+
+    def filter_range(self, data_batch: List[Any], low: Bound = None,
+                     high: Bound = None, closed: bool = False
+                     ) -> Sequence:
+        batch = self.freeze(data_batch)
+        positions = self.index_batch(batch).positions(low, high, closed)
+        return (BatchView(batch.batch, positions, ordered=False))
+
+    def count_range(self, data_batch: List[Any], low: Bound = None,
+                    high: Bound = None, closed: bool = False) -> int:
+        return (self.index_batch(data_batch).count(low, high, closed))
+
+    def resolve(self, criteria: Union[str, Expr]) -> Optional[Expr]:
+        if isinstance(criteria, Expr):
+            return (criteria)
+        if not isinstance(criteria, str):
+            raise TypeError()
+        if criteria not in self.priority_ranges:
+            return (None)
+        return (Range(*self.priority_ranges[criteria]))
+
+    def columns(self, data_batch: List[Any]) -> Tuple[Any, Any]:
+        parsed = self.parse_batch(data_batch)
+        return ((parsed.keys, parsed.values))
+
+    def indexed(self, data_batch: List[Any], expr: Expr) -> Optional[Any]:
+        bounds = expr.bounds()
+        if bounds is None:
+            return (None)
+        return (self.index_batch(data_batch).positions(*bounds))
+
+    def filter_many(self, data_batch: List[Any],
+                    criteria: Dict[str, Union[str, Expr]]
+                    ) -> Dict[str, Sequence]:
+        result: Dict[str, Sequence] = {}
+        pending: List[Tuple[str, Expr]] = []
+        batch = self.freeze(data_batch)
+        data_batch = batch.batch
+        for name, item in criteria.items():
+            expr = self.resolve(item)
+            if expr is None:
+                raise ValueError(f"Unknown criteria: {item}")
+            positions = self.indexed(batch, expr)
+            if positions is None:
+                pending.append((name, expr))
+            else:
+                result[name] = BatchView(data_batch, positions,
+                                         ordered=False)
+        if pending:
+            keys, values = self.columns(batch)
+            scan = compile_scan([expr for _, expr in pending])
+            for (name, _), positions in zip(pending, scan(keys, values)):
+                result[name] = BatchView(data_batch, positions)
+        return ({name: result[name] for name in criteria})
+
+    def count_many(self, data_batch: List[Any],
+                   criteria: Dict[str, Union[str, Expr]]) -> Dict[str, int]:
+        return ({name: len(view) for name, view
+                 in self.filter_many(data_batch, criteria).items()})
+
+    def iter_filter(self, data_batch: Iterable[Any],
+                    criteria: Union[str, Expr]) -> Iterator[Any]:
+        expr = self.resolve(criteria)
+        if expr is None:
+            raise ValueError(f"Unknown criteria: {criteria}")
+        test = expr.predicate()
+        for chunk in self.iter_chunks(data_batch):
+            keys, values = self.columns(chunk)
+            for data, key, value in zip(chunk, keys, values):
+                if test(key, value):
+                    yield data
+
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Expr]] = None
+                    ) -> Sequence:
         try:
-            if not isinstance(criteria, str) and criteria is not None:
-                raise TypeError()
             if criteria is None:
                 return data_batch
-            elif criteria == "High":
-                return [
-                    data
-                    for data in data_batch
-                    if float(data.split(":")[1]) >= 50
-                    ]
-            elif criteria == "Medium":
-                return [
-                    data
-                    for data in data_batch
-                    if float(data.split(":")[1]) == 25
-                    ]
-            elif criteria == "Low":
-                return [
-                    data
-                    for data in data_batch
-                    if float(data.split(":")[1]) < 25
-                    ]
+            expr = self.resolve(criteria)
+            if expr is None:
+                return (None)
+            return (self.filter_many(data_batch, {"result": expr})["result"])
         except TypeError:
-            return (["Criteria should be string / None"])
+            return (["Criteria should be string / expression / None"])
         except ValueError:
             return (["Data Is Invalid ! Hint=>['str:number']..."])
 
@@ -44,140 +1372,842 @@ class DataStream(ABC):
 
 
 class SensorStream(DataStream):
-    def __init__(self, stream_id: str) -> None:
-        self.stream_id = stream_id
+    unit = "readings"
+
+    def __init__(self, stream_id: str, quantiles: bool = False) -> None:
+        super().__init__(stream_id)
         self.data_type = "Enviromental Data"
-        self.data_length = 0
-        self.data_splitted = []
+        self.quantiles = quantiles
+        self.stats: Dict[str, RunningStats] = {}
+
+    def running_stats(self, key: str) -> RunningStats:
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = RunningStats(quantiles=self.quantiles)
+        return (stats)
 
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def process_batch(self, data_batch: Iterable[Any]) -> str:
         try:
             super().process_batch(data_batch)
-            for data in data_batch:
-                temp_buffer = data.split(':')
-                if len(temp_buffer) < 2:
-                    raise ValueError()
-            self.data_splitted = [element.split(':') for element in data_batch]
-            for splitted in self.data_splitted:
-                if not isinstance(splitted[0], str):
-                    raise ValueError()
-                float(splitted[1])
-            return (
-                f"{self.data_length} readings processed"
-                )
+            reuse = not isinstance(data_batch, list)
+            staged = self.stage(data_batch)
+            for chunk in self.iter_chunks(data_batch):
+                parsed = self.parse_batch(chunk, reuse)
+                if staged.exact:
+                    for key, values in parsed.group_by_key().items():
+                        staged.running_stats(key).update_batch(values)
+                staged.update_sketches(parsed.keys, parsed.values)
+                staged.data_length += len(chunk)
+            if staged.data_length == 0:
+                raise TypeError()
+            self.commit(staged)
+            return (self.summary())
         except (TypeError, ValueError):
             return ("Data Entered Invalid !\nHint=> ['string1:number1'...]")
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str] =
-                    None) -> List[Any]:
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Expr]] = None) -> List[Any]:
         return (super().filter_data(data_batch, criteria))
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return ({'key': 'avg',
-                 self.data_splitted[0][0]: self.data_splitted[0][1]})
+    def stage(self, data_batch: Iterable[Any]) -> "SensorStream":
+        staged = super().stage(data_batch)
+        staged.quantiles = self.quantiles
+        return (staged)
+
+    def merge(self, other: "SensorStream") -> None:
+        super().merge(other)
+        for key, stats in other.stats.items():
+            self.running_stats(key).merge(stats)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((super().get_state(),
+                 tuple((key, stats.get_state())
+                       for key, stats in self.stats.items()),
+                 self.quantiles))
+
+    def set_state(self, state: Tuple[Any, ...]) -> None:
+        super().set_state(state[0])
+        self.stats = {key: RunningStats.from_state(stats)
+                      for key, stats in state[1]}
+        self.quantiles = state[2]
+
+    def get_stats(self) -> Dict[str, Union[str, int, float, Dict]]:
+        result: Dict[str, Union[str, int, float, Dict]] = {'key': 'avg'}
+        for key, stats in self.stats.items():
+            result[key] = stats.mean
+        result['sensors'] = {
+            key: stats.as_dict() for key, stats in self.stats.items()
+            }
+        if self.sketches is not None:
+            result['sketches'] = self.sketches.as_dict()
+        return (result)
 
 
 class TransactionStream(DataStream):
+    value_typecode = 'q'
+    min_value = 0
+    record_type = Transaction
+    unit = "operations"
+
     def __init__(self, stream_id: str) -> None:
-        self.stream_id = stream_id
+        super().__init__(stream_id)
         self.data_type = "Financial Data"
-        self.data_splitted = {}
         self.data_net = 0
 
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def process_batch(self, data_batch: Iterable[Any],
+                      timestamps: Optional[Iterable[float]] = None) -> str:
         try:
             super().process_batch(data_batch)
-            self.data_splitted = [element.split(":") for element in data_batch]
-            for splitted in self.data_splitted:
-                if isinstance(splitted[0], str) is False:
-                    raise ValueError()
-                temp_buffer = int(splitted[1])
-                if temp_buffer < 0:
+            reuse = not isinstance(data_batch, list)
+            staged = self.stage(data_batch)
+            if timestamps is not None:
+                timestamps = iter(timestamps)
+            for chunk in self.iter_chunks(data_batch):
+                parsed = self.parse_batch(chunk, reuse)
+                if min(parsed.values) < 0:
                     raise ValueError()
-            for element in self.data_splitted:
-                if element[0] == "buy":
-                    self.data_net += int(element[1])
-                elif element[0] == "sell":
-                    self.data_net -= int(element[1])
-            return (f"{self.data_length} operations processed")
+                for key, value in zip(parsed.keys, parsed.values):
+                    if key == "buy":
+                        staged.data_net += value
+                    elif key == "sell":
+                        staged.data_net -= value
+                if staged.windowed:
+                    staged.update_windows(parsed.keys, parsed.values,
+                                          timestamps)
+                staged.update_sketches(parsed.keys, parsed.values)
+                staged.data_length += len(chunk)
+            if staged.data_length == 0:
+                raise TypeError()
+            self.commit(staged)
+            return (self.summary())
         except (TypeError, ValueError):
             return ("Data Invalid\nHint=>['string1:positive number1'...]")
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str] =
-                    None) -> List[Any]:
+    @classmethod
+    def check_record(cls, record: Any) -> Tuple[str, Union[int, float]]:
+        key, amount = cls.parse_record(record)
+        if amount < 0:
+            raise ValueError(f"Amount should be positive, got {record!r}")
+        return ((key, amount))
+
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Expr]] = None) -> List[Any]:
         return (super().filter_data(data_batch, criteria))
 
+    def merge(self, other: "TransactionStream") -> None:
+        super().merge(other)
+        self.data_net += other.data_net
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((super().get_state(), self.data_net))
+
+    def set_state(self, state: Tuple[Any, ...]) -> None:
+        super().set_state(state[0])
+        self.data_net = state[1]
+
+    def window_stats(self, name: str, now: Optional[float] = None
+                     ) -> Dict[str, Any]:
+        values = super().window_stats(name, now)
+        buy = values.get("buy", 0)
+        sell = values.get("sell", 0)
+        return ({"net": buy - sell, "buy": buy, "sell": sell})
+
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
+        stats: Dict[str, Any] = {"net": self.data_net}
         if self.data_net >= 0:
-            return ({"net": f"+{self.data_net}"})
-        else:
-            return ({"net": self.data_net})
+            stats["net"] = f"+{self.data_net}"
+        if self.windows:
+            stats["windows"] = self.all_window_stats()
+        if self.sketches is not None:
+            stats["sketches"] = self.sketches.as_dict()
+        return (stats)
 
 
 class EventStream(DataStream):
+    unit = "events"
+    priority_names = {"High": "error", "Medium": "logout", "Low": "login"}
+
     def __init__(self, stream_id: str) -> None:
-        self.stream_id = stream_id
-        self.data_length = 0
+        super().__init__(stream_id)
         self.data_error = 0
         self.data_type = "System Events"
 
-    def process_batch(self, data_batch: List[Any]) -> str:
+    def process_batch(self, data_batch: Iterable[Any],
+                      timestamps: Optional[Iterable[float]] = None) -> str:
         try:
             super().process_batch(data_batch)
-            for element in data_batch:
-                if not isinstance(element, str):
-                    raise ValueError()
-            for element in data_batch:
-                if element == "error":
-                    self.data_error += 1
-            return (f"{self.data_length} events processed")
+            staged = self.stage(data_batch)
+            if timestamps is not None:
+                timestamps = iter(timestamps)
+            for chunk in self.iter_chunks(data_batch):
+                for element in chunk:
+                    if not isinstance(element, str):
+                        raise ValueError()
+                staged.data_error += chunk.count("error")
+                if staged.windowed:
+                    staged.update_windows(chunk, None, timestamps)
+                staged.update_sketches(chunk)
+                staged.data_length += len(chunk)
+            if staged.data_length == 0:
+                raise TypeError()
+            self.commit(staged)
+            return (self.summary())
         except (TypeError, ValueError):
             return ("Data Entered Invalid!\nHint=> ['str1', 'str2'...]")
 
-    def filter_data(self, data_batch: List[Any], criteria: Optional[str] =
-                    None) -> List[Any]:
+    @classmethod
+    def check_record(cls, record: Any) -> Tuple[str, Union[int, float]]:
+        if not isinstance(record, str):
+            raise ValueError(f"Event should be a string, got {record!r}")
+        return ((record, 1))
+
+    @classmethod
+    def partition(cls, chunk: List[Any]) -> Tuple[Sequence, Rejected]:
+        good: List[Any] = []
+        rejected: Rejected = []
+        check = cls.check_record
+        for record in chunk:
+            if isinstance(record, str):
+                good.append(record)
+                continue
+            try:
+                check(record)
+            except ValueError as error:
+                rejected.append((record, error.with_traceback(None)))
+                continue
+            good.append(record)
+        return ((good, rejected))
+
+    def records(self, data_batch: List[Any]) -> Iterator[Event]:
+        for name in data_batch:
+            if not isinstance(name, str):
+                raise ValueError()
+            yield Event.of(name)
+
+    def build_index(self, data_batch: List[Any]) -> NameIndex:
+        return (NameIndex(data_batch))
+
+    def filter_name(self, data_batch: List[Any], name: Any) -> Sequence:
+        batch = self.freeze(data_batch)
+        positions = self.index_batch(batch).lookup(name)
+        return (BatchView(batch.batch, positions))
+
+    def count_name(self, data_batch: List[Any], name: Any) -> int:
+        return (self.index_batch(data_batch).count(name))
+
+    def resolve(self, criteria: Union[str, Expr]) -> Optional[Expr]:
+        if isinstance(criteria, Expr):
+            if criteria.uses_value:
+                raise ValueError("Event streams only filter on names!")
+            return (criteria)
+        if not isinstance(criteria, str):
+            raise TypeError()
+        if criteria not in self.priority_names:
+            return (None)
+        return (KeyIs(self.priority_names[criteria]))
+
+    def columns(self, data_batch: List[Any]) -> Tuple[Any, Any]:
+        return ((data_batch, repeat(None, len(data_batch))))
+
+    def indexed(self, data_batch: List[Any], expr: Expr) -> Optional[Any]:
+        names = expr.names()
+        if names is None:
+            return (None)
+        index = self.index_batch(data_batch)
+        if len(names) == 1:
+            return (index.lookup(next(iter(names))))
+        positions = array('q')
+        for name in names:
+            positions.extend(index.lookup(name))
+        return (positions)
+
+    def filter_data(self, data_batch: List[Any],
+                    criteria: Optional[Union[str, Expr]] = None
+                    ) -> Sequence:
         try:
-            if not isinstance(criteria, str) and criteria is not None:
-                raise TypeError()
             if criteria is None:
                 return data_batch
-            elif criteria == "High":
-                return [data for data in data_batch if data == "error"]
-            elif criteria == "Medium":
-                return [data for data in data_batch if data == "logout"]
-            elif criteria == "Low":
-                return [data for data in data_batch if data == "login"]
+            expr = self.resolve(criteria)
+            if expr is None:
+                return (None)
+            return (self.filter_many(data_batch, {"result": expr})["result"])
         except TypeError:
-            return (["Criteria should be string / None"])
+            return (["Criteria should be string / expression / None"])
+        except ValueError as error:
+            return ([str(error)])
+
+    def merge(self, other: "EventStream") -> None:
+        super().merge(other)
+        self.data_error += other.data_error
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((super().get_state(), self.data_error))
+
+    def set_state(self, state: Tuple[Any, ...]) -> None:
+        super().set_state(state[0])
+        self.data_error = state[1]
+
+    def window_stats(self, name: str, now: Optional[float] = None
+                     ) -> Dict[str, Any]:
+        counts = super().window_stats(name, now)
+        total = sum(counts.values())
+        return ({"events": counts, "total": total,
+                 "error_rate": counts.get("error", 0) / total if total
+                 else 0.0})
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        return ({'error': self.data_error})
+        stats: Dict[str, Any] = {'error': self.data_error}
+        if self.windows:
+            stats["windows"] = self.all_window_stats()
+        if self.sketches is not None:
+            stats["sketches"] = self.sketches.as_dict()
+        return (stats)
+
+
+def process_chunk(stream_class: Type[DataStream], stream_id: str,
+                  chunk: Iterable[Any],
+                  sketches: Optional[Dict[str, Any]] = None,
+                  isolate: bool = False, windows: bool = False
+                  ) -> Tuple[str, DataStream, Rejected]:
+    def fresh() -> DataStream:
+        stream = stream_class(stream_id)
+        if sketches is not None:
+            stream.enable_sketches(**sketches)
+        if windows:
+            stream.record_windows()
+        return (stream)
+
+    rejected: Rejected = []
+    if isolate and isinstance(chunk, list) and chunk:
+        good, rejected = stream_class.partition(chunk)
+        if good:
+            chunk = good
+    stream = fresh()
+    result = stream.process_batch(chunk)
+    return (result, stream.release(), rejected)
+
+
+class DeadLetter():
+    __slots__ = ('stream', 'stream_type', 'error_type', 'error', 'payload',
+                 'time')
+
+    def __init__(self, stream: str, stream_type: str, error: BaseException,
+                 payload: Any) -> None:
+        self.stream = stream
+        self.stream_type = stream_type
+        self.error_type = type(error).__name__
+        self.error = str(error)
+        self.payload = payload
+        self.time = time.time()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return ({name: getattr(self, name) for name in self.__slots__})
+
+    def __repr__(self) -> str:
+        return (f"DeadLetter({self.stream}, {self.error_type}: {self.error}, "
+                f"{self.payload!r})")
+
+
+class DeadLetterQueue():
+    def __init__(self, capacity: int = 10000) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity should be positive!")
+        self.capacity = capacity
+        self.letters: Deque[DeadLetter] = deque(maxlen=capacity)
+        self.failures = 0
+        self.dropped = 0
+        self.by_stream: Dict[str, int] = {}
+        self.by_error: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return (len(self.letters))
+
+    def __iter__(self) -> Iterator[DeadLetter]:
+        return (iter(self.letters))
+
+    def put(self, letter: DeadLetter) -> None:
+        if len(self.letters) == self.capacity:
+            self.dropped += 1
+        self.letters.append(letter)
+        self.failures += 1
+        self.by_stream[letter.stream_type] = \
+            self.by_stream.get(letter.stream_type, 0) + 1
+        self.by_error[letter.error_type] = \
+            self.by_error.get(letter.error_type, 0) + 1
+
+    def drain(self) -> List[DeadLetter]:
+        letters = list(self.letters)
+        self.letters.clear()
+        return (letters)
+
+    def merge(self, other: "DeadLetterQueue") -> None:
+        self.dropped += other.dropped + max(
+            len(self.letters) + len(other.letters) - self.capacity, 0)
+        self.letters.extend(other.letters)
+        self.failures += other.failures
+        for stream_type, count in other.by_stream.items():
+            self.by_stream[stream_type] = \
+                self.by_stream.get(stream_type, 0) + count
+        for error, count in other.by_error.items():
+            self.by_error[error] = self.by_error.get(error, 0) + count
+
+    def stats(self) -> Dict[str, Any]:
+        return ({
+            'queued': len(self.letters),
+            'failures': self.failures,
+            'dropped': self.dropped,
+            'by_stream': dict(self.by_stream),
+            'by_error': dict(self.by_error),
+            })
+
+
+class StreamRegistry():
+    def __init__(self, capacity: int = 10000,
+                 types: Optional[Dict[str, Type[DataStream]]] = None,
+                 on_evict: Optional[Callable[[Dict[str, Any]], None]] = None,
+                 sketches: Optional[Dict[str, Any]] = None) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity should be positive!")
+        self.capacity = capacity
+        self.types = dict(types or {
+            'sensor': SensorStream,
+            'transaction': TransactionStream,
+            'event': EventStream
+            })
+        self.on_evict = on_evict
+        self.sketches = sketches
+        self.streams: "OrderedDict[str, Tuple[str, DataStream]]" = \
+            OrderedDict()
+        self.retired: Dict[str, DataStream] = {}
+        self.evicted = 0
+        self.dirty: Set[str] = set()
+
+    def __len__(self) -> int:
+        return (len(self.streams))
+
+    def __contains__(self, stream_id: Any) -> bool:
+        return (stream_id in self.streams)
+
+    def get(self, stream_id: str) -> Optional[DataStream]:
+        entry = self.streams.get(stream_id)
+        if entry is None:
+            return (None)
+        self.streams.move_to_end(stream_id)
+        self.dirty.add(stream_id)
+        return (entry[1])
+
+    def stream_type(self, stream_id: str) -> Optional[str]:
+        entry = self.streams.get(stream_id)
+        return (None if entry is None else entry[0])
+
+    def stream(self, stream_id: str, stream_type: Optional[str] = None
+               ) -> DataStream:
+        entry = self.streams.get(stream_id)
+        if entry is not None:
+            if stream_type is not None and entry[0] != stream_type:
+                raise ValueError(
+                    f"Stream {stream_id} is a {entry[0]} stream!")
+            self.streams.move_to_end(stream_id)
+            self.dirty.add(stream_id)
+            return (entry[1])
+        if stream_type not in self.types:
+            raise ValueError(f"Unknown stream type: {stream_type}")
+        stream = self.types[stream_type](stream_id)
+        if self.sketches is not None:
+            stream.enable_sketches(**self.sketches)
+        self.streams[stream_id] = (stream_type, stream)
+        self.dirty.add(stream_id)
+        while len(self.streams) > self.capacity:
+            self.evict(next(iter(self.streams)))
+        return (stream)
+
+    def evict(self, stream_id: str) -> Optional[Dict[str, Any]]:
+        entry = self.streams.pop(stream_id, None)
+        if entry is None:
+            return (None)
+        stream_type, stream = entry
+        self.dirty.discard(stream_id)
+        stream.release()
+        summary = {
+            "stream_id": stream_id,
+            "type": stream_type,
+            "records": stream.total_length,
+            "stats": stream.get_stats(),
+            }
+        retired = self.retired.get(stream_type)
+        if retired is None:
+            retired = self.retired[stream_type] = \
+                self.types[stream_type](f"retired-{stream_type}")
+        retired.merge(stream)
+        self.evicted += 1
+        if self.on_evict is not None:
+            self.on_evict(summary)
+        return (summary)
+
+    def route(self, stream_id: str, data_batch: Iterable[Any],
+              stream_type: Optional[str] = None) -> str:
+        stream = self.stream(stream_id, stream_type)
+        result = stream.process_batch(data_batch)
+        stream.total_length += stream.data_length
+        return (result)
+
+    def absorb(self, stream_id: str, stream_type: str,
+               chunk_stream: DataStream) -> DataStream:
+        stream = self.stream(stream_id, stream_type)
+        stream.data_length = 0
+        chunk_stream.total_length = chunk_stream.data_length
+        stream.merge(chunk_stream)
+        chunk_stream.window_log = None
+        return (stream)
+
+    def windowed(self, stream_id: str) -> bool:
+        entry = self.streams.get(stream_id)
+        return (entry is not None and bool(entry[1].windows))
+
+    def route_records(self, records: Iterable[Tuple[str, Any]],
+                      stream_types: Optional[Dict[str, str]] = None
+                      ) -> Dict[str, str]:
+        groups: Dict[str, List[Any]] = {}
+        for stream_id, record in records:
+            group = groups.get(stream_id)
+            if group is None:
+                group = groups[stream_id] = []
+            group.append(record)
+        stream_types = stream_types or {}
+        return ({
+            stream_id: self.route(stream_id, group,
+                                  stream_types.get(stream_id))
+            for stream_id, group in groups.items()
+            })
+
+    def retired_stats(self) -> Dict[str, Dict[str, Any]]:
+        return ({
+            stream_type: {"records": stream.total_length,
+                          "stats": stream.get_stats()}
+            for stream_type, stream in self.retired.items()
+            })
+
+
+class StateUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(
+            f"Checkpoint states can't reference {module}.{name}!")
+
+
+class StreamCheckpoint():
+    MAGIC = b"NXSC"
+    VERSION = 1
+    HEADER = struct.Struct('<4sHIQ')
+    LENGTH = struct.Struct('<I')
+
+    def __init__(self, registry: StreamRegistry, path: str,
+                 interval: Optional[float] = None) -> None:
+        if interval is not None and interval < 0:
+            raise ValueError("Interval should be positive!")
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self.blobs: Dict[str, bytes] = {}
+        self.last_saved = time.monotonic()
+        self.saves = 0
+        self.size = 0
+
+    @staticmethod
+    def _blob(retired: bool, stream_id: str, stream_type: str,
+              stream: DataStream) -> bytes:
+        return (pickle.dumps((retired, stream_id, stream_type,
+                              stream.get_state()), pickle.HIGHEST_PROTOCOL))
+
+    def save(self) -> int:
+        registry = self.registry
+        blobs = self.blobs
+        dirty = registry.dirty
+        fresh: Dict[str, bytes] = {}
+        for stream_id, (stream_type, stream) in registry.streams.items():
+            blob = blobs.get(stream_id)
+            if blob is None or stream_id in dirty:
+                blob = self._blob(False, stream_id, stream_type, stream)
+            fresh[stream_id] = blob
+        dirty.clear()
+        self.blobs = fresh
+        entries = [self._blob(True, stream.stream_id, stream_type, stream)
+                   for stream_type, stream in registry.retired.items()]
+        entries.extend(fresh.values())
+        pack = self.LENGTH.pack
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.VERSION,
+                                        len(entries), registry.evicted))
+            for blob in entries:
+                file.write(pack(len(blob)))
+                file.write(blob)
+            file.flush()
+            os.fsync(file.fileno())
+            self.size = file.tell()
+        os.replace(temp_path, self.path)
+        self.last_saved = time.monotonic()
+        self.saves += 1
+        return (self.size)
+
+    def maybe_save(self) -> bool:
+        if (
+            self.interval is None
+            or time.monotonic() - self.last_saved < self.interval
+        ):
+            return (False)
+        self.save()
+        return (True)
+
+    def restore(self) -> int:
+        registry = self.registry
+        with open(self.path, "rb") as file:
+            data = file.read()
+        collecting = gc.isenabled()
+        gc.disable()
+        try:
+            magic, version, count, evicted = \
+                self.HEADER.unpack_from(data, 0)
+            if magic != self.MAGIC or version != self.VERSION:
+                raise ValueError()
+            view = memoryview(data)
+            file = io.BytesIO(data)
+            unpickler = StateUnpickler(file)
+            offset = self.HEADER.size
+            unpack = self.LENGTH.unpack_from
+            restored = 0
+            for _ in range(count):
+                (length,) = unpack(data, offset)
+                offset += self.LENGTH.size
+                file.seek(offset)
+                retired, stream_id, stream_type, state = unpickler.load()
+                if file.tell() != offset + length:
+                    raise ValueError()
+                blob = view[offset:offset + length]
+                offset += length
+                stream = registry.types[stream_type](stream_id)
+                stream.set_state(state)
+                if retired:
+                    registry.retired[stream_type] = stream
+                    continue
+                registry.streams[stream_id] = (stream_type, stream)
+                self.blobs[stream_id] = bytes(blob)
+                restored += 1
+        except (struct.error, pickle.UnpicklingError, KeyError,
+                ValueError, EOFError):
+            raise ValueError(f"Invalid stream checkpoint: {self.path}")
+        finally:
+            if collecting:
+                gc.enable()
+        registry.evicted = evicted
+        while len(registry.streams) > registry.capacity:
+            registry.evict(next(iter(registry.streams)))
+        return (restored)
 
 
 class StreamProcessor():
-    def __init__(self, buff_ids: list[str]) -> None:
+    executors = ('serial', 'thread', 'process')
+
+    def __init__(self, buff_ids: list[str], executor: str = 'serial',
+                 workers: Optional[int] = None,
+                 chunk_size: int = DataStream.chunk_size,
+                 capacity: int = 10000,
+                 sketches: Optional[Dict[str, Any]] = None) -> None:
+        if executor not in self.executors:
+            raise ValueError("Executor should be serial, thread or process!")
+        if chunk_size <= 0:
+            raise ValueError("Chunk size should be positive!")
         self.s_types = {
             'sensor': SensorStream,
             'transaction': TransactionStream,
             'event': EventStream
             }
         self.ids = buff_ids
+        self.executor = executor
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self._pool: Optional[Executor] = None
+        self.sketches = sketches
+        self.registry = StreamRegistry(capacity, self.s_types,
+                                       sketches=sketches)
+        self.checkpoint: Optional[StreamCheckpoint] = None
+        self.dead_letters: Optional[DeadLetterQueue] = None
+
+    def _get_pool(self) -> Optional[Executor]:
+        if self.executor == 'serial':
+            return (None)
+        if self._pool is None:
+            if self.executor == 'thread':
+                self._pool = ThreadPoolExecutor(self.workers)
+            else:
+                self._pool = ProcessPoolExecutor(self.workers)
+        return (self._pool)
+
+    def enable_checkpoint(self, path: str, interval: Optional[float] = None
+                          ) -> StreamCheckpoint:
+        self.checkpoint = StreamCheckpoint(self.registry, path, interval)
+        return (self.checkpoint)
+
+    def restore(self, path: str, interval: Optional[float] = None) -> int:
+        return (self.enable_checkpoint(path, interval).restore())
+
+    def enable_dead_letters(self, capacity: int = 10000) -> DeadLetterQueue:
+        self.dead_letters = DeadLetterQueue(capacity)
+        return (self.dead_letters)
+
+    def disable_dead_letters(self) -> None:
+        self.dead_letters = None
+
+    def _maybe_checkpoint(self) -> None:
+        if self.checkpoint is not None:
+            self.checkpoint.maybe_save()
 
-    def process_all(self, stream_data: List[List[Any]]) -> None:
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _jobs(self, streams: Iterable[Tuple[str, str, str, Any]]
+              ) -> Iterator[Tuple[str, Type[DataStream], str, Any, bool]]:
+        for (key, stream_type, id, data) in streams:
+            cls = self.s_types[stream_type]
+            windows = self.registry.windowed(id)
+            if (
+                isinstance(data, (str, bytes, bytearray, dict))
+                or not hasattr(data, '__iter__')
+            ):
+                yield (key, cls, id, data, windows)
+                continue
+            empty = True
+            for chunk in chunked(data, self.chunk_size):
+                empty = False
+                yield (key, cls, id, chunk, windows)
+            if empty:
+                yield (key, cls, id, data, windows)
+
+    def _run(self, streams: Iterable[Tuple[str, str, str, Any]]
+             ) -> Iterator[Tuple[str, str, DataStream, Rejected]]:
+        pool = self._get_pool()
+        isolate = self.dead_letters is not None
+        if pool is None:
+            for (key, cls, id, chunk, windows) in self._jobs(streams):
+                yield (key, *process_chunk(cls, id, chunk, self.sketches,
+                                           isolate, windows))
+            return
+        pending: Deque[Tuple[str, Future]] = deque()
+        for (key, cls, id, chunk, windows) in self._jobs(streams):
+            pending.append((key, pool.submit(process_chunk, cls, id, chunk,
+                                             self.sketches, isolate,
+                                             windows)))
+            if len(pending) >= self.workers * 2:
+                key, future = pending.popleft()
+                yield (key, *future.result())
+        while pending:
+            key, future = pending.popleft()
+            yield (key, *future.result())
+
+    def _merge_chunks(self, streams: Iterable[Tuple[str, str, str, Any]]
+                      ) -> Tuple[Dict[str, DataStream], Dict[str, str],
+                                 Dict[str, int]]:
+        merged: Dict[str, DataStream] = {}
+        errors: Dict[str, str] = {}
+        rejected_only: Dict[str, str] = {}
+        counts: Dict[str, int] = {}
+        for (key, result, chunk_stream, rejected) in self._run(streams):
+            if rejected:
+                counts[key] = counts.get(key, 0) + len(rejected)
+                put = self.dead_letters.put
+                for record, error in rejected:
+                    put(DeadLetter(chunk_stream.stream_id, key, error,
+                                   record))
+            if key in errors:
+                continue
+            if chunk_stream.data_length == 0:
+                if rejected:
+                    rejected_only.setdefault(key, result)
+                    continue
+                errors[key] = result
+                merged.pop(key, None)
+            elif key in merged:
+                merged[key].merge(chunk_stream)
+            else:
+                merged[key] = chunk_stream
+        for key, result in rejected_only.items():
+            if key not in merged and key not in errors:
+                errors[key] = result
+        return (merged, errors, counts)
+
+    def process_streams(self, batches: Dict[str, Iterable[Any]],
+                        stream_types: Optional[Dict[str, str]] = None
+                        ) -> Dict[str, str]:
+        stream_types = stream_types or {}
+        jobs = []
+        for stream_id, data in batches.items():
+            stream_type = (stream_types.get(stream_id)
+                           or self.registry.stream_type(stream_id))
+            if stream_type not in self.s_types:
+                raise ValueError(f"Unknown stream type for {stream_id}")
+            jobs.append((stream_id, stream_type, stream_id, data))
+        merged, errors, _ = self._merge_chunks(jobs)
+        results: Dict[str, str] = {}
+        for (stream_id, stream_type, _, _) in jobs:
+            if stream_id in errors:
+                results[stream_id] = errors[stream_id]
+            elif stream_id in merged:
+                stream = self.registry.absorb(stream_id, stream_type,
+                                              merged[stream_id])
+                results[stream_id] = stream.summary()
+        self._maybe_checkpoint()
+        return (results)
+
+    def route(self, stream_id: str, data_batch: Iterable[Any],
+              stream_type: Optional[str] = None) -> str:
+        result = self.registry.route(stream_id, data_batch, stream_type)
+        self._maybe_checkpoint()
+        return (result)
+
+    def process_all(self, stream_data: List[Iterable[Any]]
+                    ) -> Dict[str, DataStream]:
+        merged: Dict[str, DataStream] = {}
         try:
             if not isinstance(stream_data, list) or len(stream_data) == 0:
                 raise TypeError()
-            for (stream_type, id, data) in zip(
-                self.s_types, self.ids, stream_data
-            ):
-                temp_buff = self.s_types[stream_type](id)
-                result = temp_buff.process_batch(data)
-                print(f"{stream_type} data: {result}")
+            merged, errors, rejected = self._merge_chunks(
+                (stream_type, stream_type, id, data)
+                for (stream_type, id, data) in zip(self.s_types, self.ids,
+                                                   stream_data)
+                )
+            for stream_type, id in zip(self.s_types, self.ids):
+                if stream_type in merged:
+                    self.registry.absorb(id, stream_type,
+                                         merged[stream_type])
+            self._maybe_checkpoint()
+            for stream_type in self.s_types:
+                if stream_type in errors:
+                    print(f"{stream_type} data: {errors[stream_type]}")
+                elif stream_type in merged:
+                    result = merged[stream_type].summary()
+                    if stream_type in rejected:
+                        result += f" ({rejected[stream_type]} rejected)"
+                    print(f"{stream_type} data: {result}")
         except TypeError:
             print("Data Invalide\nHint=>[[data],...]")
+        return (merged)
+
+    def evaluate_all(self, stream_data: List[List[Any]],
+                     criteria: List[Dict[str, Union[str, Expr]]]
+                     ) -> Dict[str, Dict[str, int]]:
+        if not isinstance(stream_data, list) or len(stream_data) == 0:
+            raise TypeError("Data should be a non-empty list of batches!")
+        result = {}
+        for (stream_type, id, data, crit) in zip(self.s_types, self.ids,
+                                                 stream_data, criteria):
+            stream = self.registry.stream(id, stream_type)
+            result[stream_type] = stream.count_many(data, crit)
+        return (result)
 
     def filter_all(
-            self, stream_data: List[List[Any]], criteria: list[str]
+            self, stream_data: List[List[Any]],
+            criteria: List[Union[str, Expr]]
             ) -> None:
         try:
             result = {}
@@ -187,7 +2217,7 @@ class StreamProcessor():
                                                      self.ids,
                                                      stream_data,
                                                      criteria):
-                temp_buff = self.s_types[stream_type](id)
+                temp_buff = self.registry.stream(id, stream_type)
                 result_buff = temp_buff.filter_data(data, crit)
                 result.update({stream_type: len(result_buff)})
             result = {res: result[res] for res in result if result[res] > 0}
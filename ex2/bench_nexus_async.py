@@ -0,0 +1,139 @@
+import asyncio
+import socket
+import sys
+import time
+from typing import Any, List, Tuple
+
+from nexus_pipeline import (
+    InputStage, JSONAdapter, NexusManager, OutputStage, TransformStage
+)
+
+
+class TaggedOutput():
+    def __init__(self) -> None:
+        self.output = OutputStage()
+
+    def process(self, data: Any) -> Tuple[int, str]:
+        return (int(data['value']), self.output.process(data))
+
+
+def make_manager() -> NexusManager:
+    manager = NexusManager()
+    pipeline = manager.add_pipeline(JSONAdapter("bench"))
+    for stage in (InputStage(), TransformStage(), TaggedOutput()):
+        pipeline.add_stage(stage)
+    return (manager)
+
+
+def record(index: int) -> bytes:
+    return (
+        f'{{"sensor": "temp", "value": {index}, "unit": "C"}}\n'.encode()
+        )
+
+
+async def start_servers(count: int, delay: float) -> Tuple[Any, Any]:
+    async def source(reader: Any, writer: Any) -> None:
+        for index in range(count):
+            writer.write(record(index))
+        await writer.drain()
+        writer.close()
+
+    async def sink(reader: Any, writer: Any) -> None:
+        while await reader.readline():
+            await asyncio.sleep(delay)
+            writer.write(b"ok\n")
+            await writer.drain()
+        writer.close()
+
+    return (await asyncio.start_server(source, "127.0.0.1", 0),
+            await asyncio.start_server(sink, "127.0.0.1", 0))
+
+
+def percentiles(latencies: List[float]) -> str:
+    ordered = sorted(latencies)
+    picks = [ordered[int(q * (len(ordered) - 1))] * 1000
+             for q in (0.5, 0.9, 0.99)]
+    return ("p50 {:.2f}ms p90 {:.2f}ms p99 {:.2f}ms".format(*picks))
+
+
+def run_sync(source_port: int, sink_port: int, count: int) -> None:
+    started: List[float] = [0.0] * count
+    latencies: List[float] = []
+    pipeline = make_manager().pipelines[0]
+    begin = time.perf_counter()
+    with socket.create_connection(("127.0.0.1", source_port)) as src, \
+            socket.create_connection(("127.0.0.1", sink_port)) as dst:
+        lines = src.makefile("rb")
+        acks = dst.makefile("rb")
+        for index, line in enumerate(lines):
+            started[index] = time.perf_counter()
+            tag, result = pipeline.process(line.decode())
+            dst.sendall(result.encode() + b"\n")
+            acks.readline()
+            latencies.append(time.perf_counter() - started[tag])
+    elapsed = time.perf_counter() - begin
+    print(f"sync  : {count / elapsed:10.0f} records/s  "
+          f"{percentiles(latencies)}")
+
+
+async def run_async(source_port: int, sink_port: int, count: int,
+                    workers: int) -> None:
+    started: List[float] = [0.0] * count
+    latencies: List[float] = []
+    manager = make_manager()
+    pool: asyncio.Queue = asyncio.Queue()
+    for _ in range(workers):
+        pool.put_nowait(await asyncio.open_connection("127.0.0.1", sink_port))
+    reader, writer = await asyncio.open_connection("127.0.0.1", source_port)
+
+    async def source() -> Any:
+        index = 0
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            started[index] = time.perf_counter()
+            index += 1
+            yield line.decode()
+
+    async def sink(tagged: Tuple[int, str]) -> None:
+        conn_reader, conn_writer = await pool.get()
+        conn_writer.write(tagged[1].encode() + b"\n")
+        await conn_writer.drain()
+        await conn_reader.readline()
+        latencies.append(time.perf_counter() - started[tagged[0]])
+        pool.put_nowait((conn_reader, conn_writer))
+
+    begin = time.perf_counter()
+    await manager.arun(source(), sink, queue_size=workers * 2,
+                       workers=workers)
+    elapsed = time.perf_counter() - begin
+    writer.close()
+    while not pool.empty():
+        conn_writer = pool.get_nowait()[1]
+        conn_writer.close()
+        await conn_writer.wait_closed()
+    print(f"async x{workers:<3}: {count / elapsed:10.0f} records/s  "
+          f"{percentiles(latencies)}")
+
+
+async def main(count: int, delay: float) -> None:
+    source_server, sink_server = await start_servers(count, delay)
+    source_port = source_server.sockets[0].getsockname()[1]
+    sink_port = sink_server.sockets[0].getsockname()[1]
+    print(f"=== Nexus async engine over loopback ({count} records, "
+          f"{delay * 1000:.1f}ms sink delay) ===")
+    await asyncio.to_thread(run_sync, source_port, sink_port, count)
+    for workers in (1, 8, 64):
+        await run_async(source_port, sink_port, count, workers)
+    await asyncio.sleep(0.1)
+    source_server.close()
+    sink_server.close()
+    await source_server.wait_closed()
+    await sink_server.wait_closed()
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    delay = float(sys.argv[2]) if len(sys.argv) > 2 else 0.001
+    asyncio.run(main(count, delay))
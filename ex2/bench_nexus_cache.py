@@ -0,0 +1,68 @@
+import random
+import sys
+import time
+from typing import Any, Callable, List
+
+from nexus_pipeline import (
+    CSVAdapter, InputStage, JSONAdapter, OutputStage, ProcessingPipeline,
+    TransformStage
+)
+
+
+def make_pipeline(adapter: Any) -> ProcessingPipeline:
+    pipeline = adapter("bench")
+    for stage in (InputStage(), TransformStage(), OutputStage()):
+        pipeline.add_stage(stage)
+    return (pipeline)
+
+
+def workloads(size: int, distinct: int) -> List[Any]:
+    randint = random.randint
+    json_records = [
+        f'{{"sensor": "temp{randint(0, distinct)}", '
+        f'"value": {randint(0, 50)}.5, "unit": "C"}}'
+        for _ in range(size)
+        ]
+    csv_records = [f"user{randint(0, distinct)},action,timestamp,action"
+                   for _ in range(size)]
+    return ([("json", JSONAdapter, json_records),
+             ("csv", CSVAdapter, csv_records)])
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return (best)
+
+
+def per_record(pipeline: ProcessingPipeline, records: List[Any]) -> None:
+    process = pipeline.process
+    for data in records:
+        process(data)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    random.seed(42)
+    print(f"=== Pipeline result cache ({size} records) ===")
+    for distinct in (100, size * 10):
+        for name, adapter, records in workloads(size, distinct):
+            plain = make_pipeline(adapter)
+            cached = make_pipeline(adapter)
+            cache = cached.enable_cache(max_entries=4096)
+            if plain.process_batch(records[:100]) != \
+                    cached.process_batch(records[:100]):
+                raise SystemExit(f"{name}: cached results differ!")
+            base = timed(lambda: per_record(plain, records))
+            fast = timed(lambda: per_record(cached, records))
+            batch = timed(lambda: plain.process_batch(records))
+            batch_fast = timed(lambda: cached.process_batch(records))
+            stats = cache.stats()
+            print(f"{name:4} ~{distinct:<8} keys  "
+                  f"process x{base / fast:5.2f}  "
+                  f"process_batch x{batch / batch_fast:5.2f}  "
+                  f"hit rate {stats['hit_rate']:.1%}  "
+                  f"bypassed {stats['bypassed']}")
@@ -0,0 +1,91 @@
+import sys
+import time
+from typing import Any, Callable, List, Tuple
+
+from nexus_pipeline import (
+    CSVAdapter, InputStage, JSONAdapter, NexusManager, OutputStage,
+    StreamAdapter, TransformStage
+)
+
+
+def single_pipeline(adapter: Any) -> NexusManager:
+    manager = NexusManager()
+    pipeline = manager.add_pipeline(adapter("bench"))
+    for stage in (InputStage(), TransformStage(), OutputStage()):
+        pipeline.add_stage(stage)
+    return (manager)
+
+
+def chained_pipelines() -> NexusManager:
+    manager = NexusManager()
+    for index, stage in enumerate(
+            (InputStage(), TransformStage(), OutputStage())):
+        manager.add_pipeline(JSONAdapter(f"pip_0{index + 1}")).add_stage(
+            stage)
+    return (manager)
+
+
+def workloads(size: int) -> List[Tuple[str, NexusManager, List[Any]]]:
+    json_records = [
+        f'{{"sensor": "temp", "value": {index % 50}.5, "unit": "C"}}'
+        for index in range(size)
+        ]
+    csv_records = ["user,action,timestamp,action"] * size
+    stream_records = [[5, 100, 948, 35, 20, 23]] * size
+    return ([
+        ("json", single_pipeline(JSONAdapter), json_records),
+        ("csv", single_pipeline(CSVAdapter), csv_records),
+        ("stream", single_pipeline(StreamAdapter), stream_records),
+        ("chain", chained_pipelines(), json_records),
+        ])
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return (best)
+
+
+def interpreted(manager: NexusManager, records: List[Any]) -> List[Any]:
+    results = []
+    for data in records:
+        for pipeline in manager.pipelines:
+            data = pipeline.process(data)
+        results.append(data)
+    return (results)
+
+
+def check_bypass() -> None:
+    for enable in ("enable_dead_letters", "enable_metrics"):
+        manager = single_pipeline(JSONAdapter)
+        getattr(manager, enable)()
+        try:
+            manager.compile()
+        except ValueError:
+            continue
+        raise SystemExit(f"compile() accepted a manager after {enable}!")
+    manager = single_pipeline(JSONAdapter)
+    manager.pipelines[0].enable_cache()
+    try:
+        manager.compile()
+    except ValueError:
+        return
+    raise SystemExit("compile() accepted a cached pipeline!")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"=== Compiled vs interpreted pipelines ({size} records) ===")
+    check_bypass()
+    for name, manager, records in workloads(size):
+        compiled = manager.compile()
+        if interpreted(manager, records[:10]) != \
+                compiled.process_many(records[:10]):
+            raise SystemExit(f"{name}: compiled results differ!")
+        base = timed(lambda: interpreted(manager, records))
+        fast = timed(lambda: compiled.process_many(records))
+        print(f"{name:7} interpreted {size / base:10.0f} rec/s  "
+              f"compiled {size / fast:10.0f} rec/s  x{base / fast:.2f}")
@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from nexus_pipeline import (
+    CSVAdapter, InputStage, OutputStage, TransformStage, scan_csv
+)
+
+
+def write_csv(path: str, size: int, blank: int = 1000) -> int:
+    rows = 0
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(size):
+            if index % blank == 0:
+                file.write("\n")
+            else:
+                file.write(f"user{index % 256},action,timestamp,action\n")
+                rows += 1
+        file.write("\n")
+    return (rows)
+
+
+def make_pipeline() -> CSVAdapter:
+    pipeline = CSVAdapter("csv")
+    for stage in (InputStage(), TransformStage(), OutputStage()):
+        pipeline.add_stage(stage)
+    return (pipeline)
+
+
+def per_line(path: str) -> int:
+    pipeline = make_pipeline()
+    count = 0
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                pipeline.process(line)
+                count += 1
+    return (count)
+
+
+def streamed(source: Any) -> int:
+    count = 0
+    for _ in make_pipeline().process_file(source):
+        count += 1
+    return (count)
+
+
+def check_sources(path: str, rows: int) -> None:
+    with open(path, "rb") as file:
+        if streamed(file) != rows or file.closed:
+            raise SystemExit("binary file source was not streamed intact!")
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if streamed(line for line in file) != rows:
+            raise SystemExit("iterable of lines was not streamed!")
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "activity.csv")
+        rows = write_csv(path, size)
+        print(f"=== CSV file ingestion ({rows} rows, "
+              f"{size - rows + 1} blank lines) ===")
+        count = streamed(path)
+        scanned = scan_csv(path)
+        if count != rows or scanned['rows'] != rows:
+            raise SystemExit(f"expected {rows} rows, got {count} streamed "
+                             f"/ {scanned['rows']} scanned!")
+        check_sources(path, rows)
+        base = timed(lambda: per_line(path))
+        print(f"per-line process     : {rows / base:10.0f} rec/s")
+        elapsed = timed(lambda: streamed(path))
+        print(f"process_file batched : {rows / elapsed:10.0f} rec/s "
+              f"x{base / elapsed:.2f}")
@@ -0,0 +1,108 @@
+import random
+import sys
+import time
+from typing import Any, Callable, List, Tuple
+
+from nexus_pipeline import (
+    InputStage, JSONAdapter, NexusManager, OutputStage, TransformStage
+)
+
+GOOD = '{{"sensor": "temp", "value": {}.5, "unit": "C"}}'
+BAD = ['{"sensor": "temp", "value": ', '{"sensor": "temp", "value": "x"}']
+
+
+def make_manager(dead_letters: bool) -> NexusManager:
+    manager = NexusManager()
+    pipeline = manager.add_pipeline(JSONAdapter("bench"))
+    for stage in (InputStage(), TransformStage(), OutputStage()):
+        pipeline.add_stage(stage)
+    if dead_letters:
+        manager.enable_dead_letters()
+    return (manager)
+
+
+def make_records(size: int, rate: float) -> Tuple[List[str], int]:
+    rng = random.Random(42)
+    records = []
+    good = 0
+    for index in range(size):
+        if rng.random() < rate:
+            records.append(BAD[index % len(BAD)])
+        else:
+            records.append(GOOD.format(index % 50))
+            good += 1
+    return (records, good)
+
+
+def batched(manager: NexusManager, records: List[str],
+            batch_size: int) -> int:
+    process_batch = manager.pipelines[0].process_batch
+    count = 0
+    for start in range(0, len(records), batch_size):
+        count += len(process_batch(records[start:start + batch_size]))
+    return (count)
+
+
+def per_record(manager: NexusManager, records: List[str]) -> int:
+    process = manager.pipelines[0].process
+    count = 0
+    for data in records:
+        if process(data) is not None:
+            count += 1
+    return (count)
+
+
+def sharded(records: List[str], batch_size: int,
+            workers: int = 2) -> Tuple[float, List[Any], int]:
+    manager = make_manager(True)
+    queue = manager.enable_dead_letters()
+    with manager.shard(workers) as nexus:
+        start = time.perf_counter()
+        results = list(nexus.process_stream(iter(records), batch_size))
+        elapsed = time.perf_counter() - start
+    return (elapsed, results, queue.failures)
+
+
+def timed(func: Callable[[], Any], repeat: int = 3) -> Tuple[float, Any]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return (best, result)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 1024
+    print(f"=== Dead-letter isolation ({size} records, "
+          f"batches of {batch_size}) ===")
+    clean, _ = make_records(size, 0.0)
+    base, _ = timed(lambda: batched(make_manager(False), clean, batch_size))
+    print(f"no isolation, 0% bad  : batch {size / base:10.0f} rec/s")
+    for rate in (0.0, 0.01, 0.10):
+        records, good = make_records(size, rate)
+        manager = make_manager(True)
+        elapsed, count = timed(lambda: batched(manager, records, batch_size))
+        queue = manager.enable_dead_letters()
+        single, single_count = timed(lambda: per_record(manager, records), 1)
+        if count != good or single_count != good:
+            raise SystemExit(f"{rate:.0%}: expected {good} good records, "
+                             f"got {count} / {single_count}!")
+        if queue.failures != size - good:
+            raise SystemExit(f"{rate:.0%}: {queue.failures} dead letters "
+                             f"for {size - good} bad records!")
+        print(f"isolated, {rate:4.0%} bad : batch {size / elapsed:10.0f} "
+              f"rec/s (x{base / elapsed:.2f})  per-record "
+              f"{size / single:10.0f} rec/s  {queue.stats()['by_error']}")
+    records, good = make_records(size, 0.10)
+    expected = list(make_manager(True).process_stream(iter(records),
+                                                      batch_size))
+    elapsed, results, failures = sharded(records, batch_size)
+    if results != expected or failures != size - good:
+        raise SystemExit(f"sharded: {len(results)} results / {failures} "
+                         f"dead letters, expected {len(expected)} / "
+                         f"{size - good}!")
+    print(f"sharded x2, 10% bad  : batch {size / elapsed:10.0f} rec/s "
+          f"(x{base / elapsed:.2f})")
@@ -0,0 +1,74 @@
+import os
+import sys
+import tempfile
+import time
+from typing import Any, Callable
+
+from nexus_pipeline import (
+    InputStage, JSONAdapter, OutputStage, SensorRecord, TransformStage,
+    orjson
+)
+
+
+def write_ndjson(path: str, size: int) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(size):
+            file.write(
+                f'{{"sensor": "temp", "value": {index % 47}.5, '
+                f'"unit": "C"}}\n'
+                )
+
+
+def make_pipeline(decoder: str = "json",
+                  schema: bool = False) -> JSONAdapter:
+    input_stage = InputStage(decoder=decoder)
+    if schema:
+        input_stage.register_schema(SensorRecord.fields, SensorRecord)
+    pipeline = JSONAdapter("ndjson")
+    for stage in (input_stage, TransformStage(), OutputStage()):
+        pipeline.add_stage(stage)
+    return (pipeline)
+
+
+def per_line(path: str) -> int:
+    pipeline = make_pipeline()
+    count = 0
+    with open(path, "r", encoding="utf-8") as file:
+        for line in file:
+            pipeline.process(line.strip())
+            count += 1
+    return (count)
+
+
+def streamed(path: str, decoder: str, schema: bool) -> int:
+    pipeline = make_pipeline(decoder, schema)
+    count = 0
+    for _ in pipeline.process_ndjson(path):
+        count += 1
+    return (count)
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sensors.ndjson")
+        write_ndjson(path, size)
+        print(f"=== NDJSON ingestion ({size} lines) ===")
+        base = timed(lambda: per_line(path))
+        print(f"per-line json.loads + dict  : {size / base:10.0f} rec/s")
+        variants = [("json", False), ("json", True)]
+        if orjson is not None:
+            variants += [("fast", False), ("fast", True)]
+        else:
+            print("fast decoder skipped (orjson is not installed)")
+        for decoder, schema in variants:
+            elapsed = timed(lambda: streamed(path, decoder, schema))
+            label = f"batched {decoder:4} {'+ schema' if schema else ''}"
+            print(f"{label:28}: {size / elapsed:10.0f} rec/s "
+                  f"x{base / elapsed:.2f}")
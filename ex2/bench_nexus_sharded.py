@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+from typing import Any, Callable, List, Tuple
+
+from nexus_pipeline import (
+    CSVAdapter, InputStage, JSONAdapter, NexusManager, OutputStage,
+    StreamAdapter, TransformStage
+)
+
+
+def make_manager(adapter: Any, dead_letters: bool = False) -> NexusManager:
+    manager = NexusManager()
+    pipeline = manager.add_pipeline(adapter("bench"))
+    for stage in (InputStage(), TransformStage(), OutputStage()):
+        pipeline.add_stage(stage)
+    if dead_letters:
+        manager.enable_dead_letters()
+    return (manager)
+
+
+def workloads(size: int) -> List[Tuple[str, NexusManager, List[Any]]]:
+    json_records = [
+        f'{{"sensor": "temp{index % 256}", "value": {index % 50}.5, '
+        f'"unit": "C"}}' for index in range(size)
+        ]
+    csv_records = [f"user{index % 256},action,timestamp,action"
+                   for index in range(size)]
+    stream_records = [[index % 9, 100, 948, 35, 20, 23]
+                      for index in range(size)]
+    mixed_records = [
+        '{"sensor": "temp", "value": "x"}' if index % 50 == 0 else data
+        for index, data in enumerate(json_records)
+        ]
+    return ([
+        ("json", make_manager(JSONAdapter), json_records),
+        ("csv", make_manager(CSVAdapter), csv_records),
+        ("stream", make_manager(StreamAdapter), stream_records),
+        ("json-dl", make_manager(JSONAdapter, True), mixed_records),
+        ])
+
+
+def timed(func: Callable[[], Any]) -> float:
+    start = time.perf_counter()
+    func()
+    return (time.perf_counter() - start)
+
+
+def in_process(manager: NexusManager, records: List[Any],
+               batch_size: int) -> List[Any]:
+    return (list(manager.process_stream(iter(records), batch_size)))
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    batch_size = int(sys.argv[2]) if len(sys.argv) > 2 else 2048
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cores})
+    print(f"=== Sharded NexusManager ({size} records, batches of "
+          f"{batch_size}, {cores} cores) ===")
+    for name, manager, records in workloads(size):
+        expected = in_process(manager, records, batch_size)
+        base = timed(lambda: in_process(manager, records, batch_size))
+        print(f"{name:7} in-process  : {size / base:10.0f} rec/s")
+        for workers in counts:
+            with manager.shard(workers) as sharded:
+                if list(sharded.process_stream(
+                        iter(records), batch_size)) != expected:
+                    raise SystemExit(f"{name}: sharded results differ!")
+                elapsed = timed(lambda: list(sharded.process_stream(
+                    iter(records), batch_size)))
+            print(f"{name:7} x{workers:<3} shards : {size / elapsed:10.0f} "
+                  f"rec/s (x{base / elapsed:.2f})")
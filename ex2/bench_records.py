@@ -0,0 +1,53 @@
+import sys
+import tracemalloc
+from collections.abc import Mapping
+from typing import Any, Callable, List, Tuple
+
+from nexus_pipeline import PipelineRecord, TransformStage
+
+
+def measure(func: Callable[[], Any]) -> Tuple[int, Any]:
+    tracemalloc.start()
+    try:
+        kept = func()
+        return (tracemalloc.get_traced_memory()[1], kept)
+    finally:
+        tracemalloc.stop()
+
+
+def transformed_dicts(batches: List[List[int]]) -> List[Any]:
+    stage = TransformStage()
+    return ([stage.process({"msg": "Real-time sensor stream", "data": data})
+             for data in batches])
+
+
+def transformed_records(batches: List[List[int]]) -> List[Any]:
+    stage = TransformStage()
+    return ([stage.process(PipelineRecord(msg="Real-time sensor stream",
+                                          data=data))
+             for data in batches])
+
+
+def check_mapping(dicts: List[Any], records: List[Any]) -> None:
+    for expected, record in zip(dicts, records):
+        if (
+            not isinstance(record, Mapping) or dict(record) != expected
+            or record != expected or len(record) != len(expected)
+            or record.get("avg") != expected.get("avg")
+            or record.get("csv", "missing") != "missing"
+        ):
+            raise SystemExit(f"{record!r} doesn't behave like {expected!r}!")
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    batches = [[index % 7, 3, 11] for index in range(size)]
+    print(f"=== Pipeline record footprint ({size} records) ===")
+    base = measure(lambda: transformed_dicts(batches))[0]
+    slots = measure(lambda: transformed_records(batches))[0]
+    for label, peak in (("dict records", base),
+                        ("PipelineRecord", slots)):
+        print(f"{label:16}: peak {peak / 1e6:8.2f} MB  "
+              f"{peak / size:7.1f} B/record  x{base / max(peak, 1):.2f}")
+    check_mapping(transformed_dicts(batches[:1000]),
+                  transformed_records(batches[:1000]))
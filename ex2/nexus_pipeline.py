@@ -1,6 +1,31 @@
-from typing import Any, Protocol, Dict, Union
+from typing import (
+    Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Deque,
+    Iterable, Iterator, List, Optional, Protocol, Dict, Tuple, Type, Union
+)
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import Mapping
+import asyncio
+import copy
+import csv
+import inspect
+import io
+import itertools
 import json
+import multiprocessing
+import os
+import pickle
+import struct
+import sys
+import threading
+import time
+from multiprocessing import shared_memory
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class ProcessingStage(Protocol):
@@ -8,49 +33,1214 @@ class ProcessingStage(Protocol):
         pass
 
 
+class AsyncProcessingStage(Protocol):
+    async def process(self, data: Any) -> Any:
+        pass
+
+
+Stage = Union[ProcessingStage, AsyncProcessingStage]
+
+
+async def call_stage(stage: Any, data: Any) -> Any:
+    result = stage.process(data)
+    if inspect.isawaitable(result):
+        result = await result
+    return (result)
+
+
+class OutputSink(Protocol):
+    def write(self, message: str) -> None:
+        pass
+
+    def write_many(self, messages: List[str]) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class NullSink():
+    def write(self, message: str) -> None:
+        pass
+
+    def write_many(self, messages: List[str]) -> None:
+        pass
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class RingBufferSink(NullSink):
+    def __init__(self, capacity: int = 1024) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity should be positive!")
+        self.messages: deque = deque(maxlen=capacity)
+
+    def write(self, message: str) -> None:
+        self.messages.append(message)
+
+    def write_many(self, messages: List[str]) -> None:
+        self.messages.extend(messages)
+
+
+class BufferedSink(ABC):
+    def __init__(self, max_records: int = 1024,
+                 max_interval: Optional[float] = 1.0) -> None:
+        if max_records <= 0:
+            raise ValueError("Max records should be positive!")
+        self.max_records = max_records
+        self.max_interval = max_interval
+        self.buffer: List[str] = []
+        self.last_flush = time.monotonic()
+
+    @abstractmethod
+    def emit(self, messages: List[str]) -> None:
+        pass
+
+    def _should_flush(self) -> bool:
+        return (
+            len(self.buffer) >= self.max_records
+            or (self.max_interval is not None
+                and time.monotonic() - self.last_flush >= self.max_interval)
+        )
+
+    def write(self, message: str) -> None:
+        self.buffer.append(message)
+        if self._should_flush():
+            self.flush()
+
+    def write_many(self, messages: List[str]) -> None:
+        self.buffer.extend(messages)
+        if self._should_flush():
+            self.flush()
+
+    def flush(self) -> None:
+        if self.buffer:
+            messages, self.buffer = self.buffer, []
+            self.emit(messages)
+        self.last_flush = time.monotonic()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "BufferedSink":
+        return (self)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class StreamSink(BufferedSink):
+    def __init__(self, stream: Any = None, max_records: int = 1,
+                 max_interval: Optional[float] = None) -> None:
+        super().__init__(max_records, max_interval)
+        self.stream = stream
+
+    def emit(self, messages: List[str]) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.write("\n".join(messages) + "\n")
+
+
+class CallbackSink(BufferedSink):
+    def __init__(self, callback: Callable[[List[str]], Any],
+                 max_records: int = 1,
+                 max_interval: Optional[float] = None) -> None:
+        super().__init__(max_records, max_interval)
+        self.callback = callback
+
+    def emit(self, messages: List[str]) -> None:
+        self.callback(messages)
+
+
+class FileSink(BufferedSink):
+    def __init__(self, path: str, max_records: int = 1024,
+                 max_interval: Optional[float] = 1.0) -> None:
+        super().__init__(max_records, max_interval)
+        self.path = path
+        self.file = open(path, "a", encoding="utf-8")
+
+    def emit(self, messages: List[str]) -> None:
+        self.file.write("\n".join(messages) + "\n")
+        self.file.flush()
+
+    def close(self) -> None:
+        super().close()
+        self.file.close()
+
+
+class RotatingFileSink(FileSink):
+    def __init__(self, path: str, max_bytes: int = 10 * 1024 * 1024,
+                 backups: int = 3, max_records: int = 1024,
+                 max_interval: Optional[float] = 1.0) -> None:
+        if max_bytes <= 0 or backups < 0:
+            raise ValueError("Rotation limits are invalid!")
+        super().__init__(path, max_records, max_interval)
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def rotate(self) -> None:
+        self.file.close()
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, "a", encoding="utf-8")
+
+    def emit(self, messages: List[str]) -> None:
+        chunk = "\n".join(messages) + "\n"
+        if (
+            self.file.tell() > 0
+            and self.file.tell() + len(chunk.encode()) > self.max_bytes
+        ):
+            self.rotate()
+        self.file.write(chunk)
+        self.file.flush()
+
+
+class LatencyHistogram():
+    SUB_BITS = 5
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        exponent = value.bit_length() - self.SUB_BITS
+        if exponent <= 0:
+            return (value)
+        return ((exponent << (self.SUB_BITS - 1)) + (value >> exponent))
+
+    def _value(self, index: int) -> float:
+        if index < (1 << self.SUB_BITS):
+            return (float(index))
+        exponent = (index >> (self.SUB_BITS - 1)) - 1
+        low = (index - (exponent << (self.SUB_BITS - 1))) << exponent
+        return (low + ((1 << exponent) - 1) / 2)
+
+    def record(self, value: int) -> None:
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+        return (self)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.count, self.total, self.max,
+                 tuple(self.buckets.items())))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.count, histogram.total, histogram.max = state[:3]
+        histogram.buckets = dict(state[3])
+        return (histogram)
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return (0.0)
+        rank = q * self.count
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return (min(self._value(index), float(self.max)))
+        return (float(self.max))
+
+
+class StageMetrics():
+    __slots__ = ('calls', 'records', 'errors', 'histogram')
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.records = 0
+        self.errors = 0
+        self.histogram = LatencyHistogram()
+
+    def record(self, elapsed_ns: int, records: int = 1) -> None:
+        self.calls += 1
+        self.records += records
+        self.histogram.record(elapsed_ns)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((self.calls, self.records, self.errors,
+                 self.histogram.get_state()))
+
+    @classmethod
+    def from_state(cls, state: Tuple[Any, ...]) -> "StageMetrics":
+        stats = cls()
+        stats.calls, stats.records, stats.errors = state[:3]
+        stats.histogram = LatencyHistogram.from_state(state[3])
+        return (stats)
+
+    def as_dict(self, uptime: float) -> Dict[str, Union[int, float]]:
+        histogram = self.histogram
+        return ({
+            'calls': self.calls,
+            'records': self.records,
+            'errors': self.errors,
+            'total_seconds': histogram.total / 1e9,
+            'p50_seconds': histogram.quantile(0.5) / 1e9,
+            'p90_seconds': histogram.quantile(0.9) / 1e9,
+            'p99_seconds': histogram.quantile(0.99) / 1e9,
+            'max_seconds': histogram.max / 1e9,
+            'records_per_second': self.records / uptime if uptime else 0.0,
+            })
+
+
+class Metrics():
+    def __init__(self) -> None:
+        self.stages: Dict[str, StageMetrics] = {}
+        self.gauges: Dict[str, float] = {}
+        self.started = time.monotonic()
+
+    def stage(self, name: str) -> StageMetrics:
+        stats = self.stages.get(name)
+        if stats is None:
+            stats = self.stages[name] = StageMetrics()
+        return (stats)
+
+    def set_gauge(self, name: str, value: float) -> None:
+        self.gauges[name] = value
+
+    def reset(self) -> None:
+        self.stages = {}
+        self.gauges = {}
+        self.started = time.monotonic()
+
+    def get_state(self) -> Tuple[Any, ...]:
+        return ((tuple((name, stats.get_state())
+                       for name, stats in list(self.stages.items())),
+                 tuple(self.gauges.items())))
+
+    def set_state(self, state: Tuple[Any, ...]) -> None:
+        self.stages = {name: StageMetrics.from_state(stats)
+                       for name, stats in state[0]}
+        self.gauges = dict(state[1])
+
+    def snapshot(self) -> Dict[str, Any]:
+        uptime = time.monotonic() - self.started
+        return ({
+            'uptime_seconds': uptime,
+            'stages': {
+                name: stats.as_dict(uptime)
+                for name, stats in list(self.stages.items())
+                },
+            'gauges': dict(self.gauges),
+            })
+
+    def to_json(self) -> str:
+        return (json.dumps(self.snapshot(), indent=2, sort_keys=True))
+
+    def to_prometheus(self) -> str:
+        snapshot = self.snapshot()
+        lines = []
+        for metric, kind, key in (
+            ('nexus_stage_calls_total', 'counter', 'calls'),
+            ('nexus_stage_records_total', 'counter', 'records'),
+            ('nexus_stage_errors_total', 'counter', 'errors'),
+            ('nexus_stage_records_per_second', 'gauge',
+             'records_per_second'),
+        ):
+            lines.append(f"# TYPE {metric} {kind}")
+            for name, stats in snapshot['stages'].items():
+                lines.append(f'{metric}{{stage="{name}"}} {stats[key]}')
+        lines.append("# TYPE nexus_stage_latency_seconds summary")
+        for name, stats in snapshot['stages'].items():
+            for quantile, key in (('0.5', 'p50_seconds'),
+                                  ('0.9', 'p90_seconds'),
+                                  ('0.99', 'p99_seconds')):
+                value = stats[key]
+                lines.append(
+                    f'nexus_stage_latency_seconds{{stage="{name}",'
+                    f'quantile="{quantile}"}} {value}'
+                    )
+            lines.append(
+                f'nexus_stage_latency_seconds_sum{{stage="{name}"}} '
+                f"{stats['total_seconds']}"
+                )
+            lines.append(
+                f'nexus_stage_latency_seconds_count{{stage="{name}"}} '
+                f"{stats['calls']}"
+                )
+        lines.append("# TYPE nexus_gauge gauge")
+        for name, value in snapshot['gauges'].items():
+            lines.append(f'nexus_gauge{{name="{name}"}} {value}')
+        return ("\n".join(lines) + "\n")
+
+    def dump(self, path: str, fmt: str = "json") -> None:
+        if fmt not in ("json", "prometheus"):
+            raise ValueError("Format should be json or prometheus!")
+        text = self.to_json() if fmt == "json" else self.to_prometheus()
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            file.write(text)
+        os.replace(temp_path, path)
+
+
+class MetricsReporter():
+    def __init__(self, metrics: Metrics, outputs: Dict[str, str],
+                 interval: float = 10.0) -> None:
+        if interval <= 0:
+            raise ValueError("Interval should be positive!")
+        self.metrics = metrics
+        self.outputs = outputs
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def dump(self) -> None:
+        for fmt, path in self.outputs.items():
+            self.metrics.dump(path, fmt)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.dump()
+
+    def start(self) -> "MetricsReporter":
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, daemon=True)
+            self._thread.start()
+        return (self)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        self.dump()
+
+
+def is_flat_object(text: Any) -> bool:
+    return (
+        type(text) is str
+        and text[:1] == '{'
+        and text[-1:] == '}'
+        and text.count('{') == 1
+        and text.count('}') == 1
+        and '[' not in text
+    )
+
+
+def decode_json_batch(texts: List[Any]) -> List[Any]:
+    if len(texts) > 1 and all(is_flat_object(text) for text in texts):
+        try:
+            decoded = json.loads('[' + ',\n'.join(texts) + ']')
+            if len(decoded) == len(texts):
+                return (decoded)
+        except ValueError:
+            pass
+    return ([json.loads(text) for text in texts])
+
+
+def read_ndjson_lines(source: Any) -> Iterator[Union[str, bytes]]:
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, "rb") as file:
+            for line in file:
+                line = line.strip()
+                if line:
+                    yield line
+        return
+    for line in source:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def open_csv(source: Any, buffer_size: int = 1 << 20) -> Any:
+    if isinstance(source, (str, os.PathLike)):
+        return (open(source, "r", encoding="utf-8", newline="",
+                     buffering=buffer_size))
+    if isinstance(source, io.TextIOBase) or not hasattr(source, "read"):
+        return (source)
+    return (io.TextIOWrapper(source, encoding="utf-8", newline=""))
+
+
+def iter_csv_rows(source: Any, buffer_size: int = 1 << 20,
+                  delimiter: str = ',') -> Iterator[List[str]]:
+    file = open_csv(source, buffer_size)
+    try:
+        yield from filter(None, csv.reader(file, delimiter=delimiter))
+    finally:
+        if isinstance(source, (str, os.PathLike)):
+            file.close()
+        elif file is not source:
+            file.detach()
+
+
+def scan_csv(source: Any, tokens: Iterable[str] = ('action',),
+             buffer_size: int = 1 << 20,
+             delimiter: str = ',') -> Dict[str, Any]:
+    counts = {token: 0 for token in tokens}
+    rows = 0
+    fields = 0
+    for row in iter_csv_rows(source, buffer_size, delimiter):
+        rows += 1
+        fields += len(row)
+        for token in counts:
+            counts[token] += row.count(token)
+    return ({'rows': rows, 'fields': fields, 'counts': counts})
+
+
+def csv_text(data: Any) -> str:
+    return (data if type(data) is str else ",".join(data))
+
+
+def micro_batches(source: Iterable[Any], size: int = 256,
+                  linger: Optional[float] = None) -> Iterator[List[Any]]:
+    if size <= 0:
+        raise ValueError("Batch size should be positive!")
+    batch: List[Any] = []
+    deadline = 0.0
+    for data in source:
+        if len(batch) == 0 and linger is not None:
+            deadline = time.monotonic() + linger
+        batch.append(data)
+        if len(batch) >= size or (
+            linger is not None and time.monotonic() >= deadline
+        ):
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def amicro_batches(source: AsyncIterable[Any], size: int = 256,
+                         linger: Optional[float] = None
+                         ) -> AsyncIterator[List[Any]]:
+    if size <= 0:
+        raise ValueError("Batch size should be positive!")
+    iterator = source.__aiter__()
+    batch: List[Any] = []
+    pending: Optional[asyncio.Future] = None
+    deadline = 0.0
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            timeout = None
+            if batch and linger is not None:
+                timeout = max(0.0, deadline - loop.time())
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+            if not done:
+                yield batch
+                batch = []
+                continue
+            finished, pending = pending, None
+            try:
+                data = finished.result()
+            except StopAsyncIteration:
+                break
+            if len(batch) == 0 and linger is not None:
+                deadline = loop.time() + linger
+            batch.append(data)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def process_stage_batch(stage: Any, records: List[Any]) -> List[Any]:
+    if hasattr(stage, 'process_batch'):
+        return (stage.process_batch(records))
+    process = stage.process
+    return ([process(data) for data in records])
+
+
+class SensorRecord():
+    __slots__ = ('sensor', 'value', 'unit', 'range')
+    fields = ('sensor', 'value', 'unit')
+
+    def __init__(self, sensor: Any, value: Any, unit: Any,
+                 range: Optional[str] = None) -> None:
+        self.sensor = sensor
+        self.value = value
+        self.unit = unit
+        self.range = range
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return (getattr(self, key))
+
+    def __contains__(self, key: Any) -> bool:
+        return (key in self.fields or (key == 'range'
+                                       and self.range is not None))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (dict, SensorRecord)):
+            return (self.as_dict() == dict(other.items()))
+        return (NotImplemented)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return (list(self.as_dict().items()))
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = {field: getattr(self, field) for field in self.fields}
+        if self.range is not None:
+            data['range'] = self.range
+        return (data)
+
+    def __repr__(self) -> str:
+        return (repr(self.as_dict()))
+
+
+class PipelineRecord(Mapping):
+    __slots__ = ('csv', 'msg', 'data', 'action', 'len', 'avg')
+    fields = __slots__
+
+    def __init__(self, csv: Any = None, msg: Optional[str] = None,
+                 data: Any = None) -> None:
+        self.csv = csv
+        self.msg = msg
+        self.data = data
+        self.action = None
+        self.len = None
+        self.avg = None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self:
+            raise KeyError(key)
+        return (getattr(self, key))
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self.fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key: Any) -> bool:
+        return (key in self.fields and getattr(self, key) is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        return (iter(self.as_dict()))
+
+    def __len__(self) -> int:
+        return (len(self.as_dict()))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Mapping):
+            return (self.as_dict() == dict(other.items()))
+        return (NotImplemented)
+
+    def update(self, values: Dict[str, Any]) -> None:
+        for key, value in values.items():
+            self[key] = value
+
+    def as_dict(self) -> Dict[str, Any]:
+        return ({field: getattr(self, field) for field in self.fields
+                 if getattr(self, field) is not None})
+
+    def __repr__(self) -> str:
+        return (repr(self.as_dict()))
+
+
+_MISSING = object()
+
+
+class ResultCache():
+    policies = ("lru", "lfu")
+
+    def __init__(self, max_entries: int = 1024, ttl: Optional[float] = None,
+                 policy: str = "lru", max_key_length: int = 4096,
+                 min_hit_rate: float = 0.05, probe: int = 4096,
+                 sample: int = 8) -> None:
+        if policy not in self.policies:
+            raise ValueError("Policy should be lru or lfu!")
+        if max_entries <= 0 or probe <= 0 or sample <= 0:
+            raise ValueError("Cache sizes should be positive!")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("TTL should be positive!")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.policy = policy
+        self.max_key_length = max_key_length
+        self.min_hit_rate = min_hit_rate
+        self.probe = probe
+        self.sample = sample
+        self.entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self.counts: Dict[Any, int] = {}
+        self.checked = 0
+        self.skip = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expired = 0
+        self.bypassed = 0
+
+    def __len__(self) -> int:
+        return (len(self.entries))
+
+    def cacheable(self, key: Any) -> bool:
+        if type(key) in (str, bytes):
+            return (len(key) <= self.max_key_length)
+        try:
+            hash(key)
+        except TypeError:
+            return (False)
+        return (True)
+
+    def _remove(self, key: Any) -> None:
+        del self.entries[key]
+        self.counts.pop(key, None)
+
+    def _evict(self) -> None:
+        entries = self.entries
+        if self.policy == "lru":
+            entries.popitem(last=False)
+        else:
+            counts = self.counts
+            oldest = list(itertools.islice(entries, self.sample))
+            victim = min(oldest, key=counts.__getitem__)
+            for key in oldest:
+                if key is not victim:
+                    entries.move_to_end(key)
+                    counts[key] >>= 1
+            self._remove(victim)
+        self.evictions += 1
+
+    def _missed(self) -> None:
+        self.misses += 1
+        if not self.misses % self.probe:
+            hits = self.hits - self.checked
+            if hits < (hits + self.probe) * self.min_hit_rate:
+                self.skip = self.probe * 64
+                self.bypassed += self.skip
+            self.checked = self.hits
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        entry = self.entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self._missed()
+            return (default)
+        if self.ttl is not None:
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                self.expired += 1
+                self._missed()
+                return (default)
+            entry = entry[0]
+        if self.policy == "lru":
+            self.entries.move_to_end(key)
+        else:
+            self.counts[key] += 1
+        self.hits += 1
+        return (entry)
+
+    def put(self, key: Any, value: Any) -> None:
+        if key in self.entries:
+            self._remove(key)
+        elif len(self.entries) >= self.max_entries:
+            self._evict()
+        if self.ttl is not None:
+            value = (value, time.monotonic() + self.ttl)
+        self.entries[key] = value
+        if self.policy == "lfu":
+            self.counts[key] = 1
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.counts.clear()
+        self.checked = self.hits
+        self.bypassed -= self.skip
+        self.skip = 0
+
+    def wrap(self, func: Callable[[Any], Any],
+             copier: Optional[Callable[[Any], Any]] = None
+             ) -> Callable[[Any], Any]:
+        if self.ttl is None:
+            return (self._wrap_fast(func, copier))
+        get = self.get
+        put = self.put
+        cacheable = self.cacheable
+
+        def cached(data: Any) -> Any:
+            if self.skip:
+                self.skip -= 1
+                return (func(data))
+            if not cacheable(data):
+                self.bypassed += 1
+                return (func(data))
+            result = get(data, _MISSING)
+            if result is _MISSING:
+                result = func(data)
+                put(data, result)
+            elif copier is not None:
+                result = copier(result)
+            return (result)
+        cached.cache = self
+        return (cached)
+
+    def _wrap_fast(self, func: Callable[[Any], Any],
+                   copier: Optional[Callable[[Any], Any]]
+                   ) -> Callable[[Any], Any]:
+        entries = self.entries
+        counts = self.counts
+        lookup = entries.get
+        move_to_end = entries.move_to_end
+        missed = self._missed
+        evict = self._evict
+        lru = self.policy == "lru"
+        limit = self.max_key_length
+
+        def cached(data: Any) -> Any:
+            if self.skip:
+                self.skip -= 1
+                return (func(data))
+            try:
+                kind = type(data)
+                if (kind is str or kind is bytes) and len(data) > limit:
+                    raise TypeError
+                result = lookup(data, _MISSING)
+            except TypeError:
+                self.bypassed += 1
+                return (func(data))
+            if result is not _MISSING:
+                if lru:
+                    move_to_end(data)
+                else:
+                    counts[data] += 1
+                self.hits += 1
+                return (result if copier is None else copier(result))
+            missed()
+            result = func(data)
+            if len(entries) >= self.max_entries:
+                evict()
+            entries[data] = result
+            if not lru:
+                counts[data] = 1
+            return (result)
+        cached.cache = self
+        return (cached)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        lookups = self.hits + self.misses
+        return ({
+            'entries': len(self.entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expired': self.expired,
+            'bypassed': self.bypassed - self.skip,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            })
+
+
+def cached_copy(value: Any) -> Any:
+    if type(value) in (str, bytes, int, float, bool, tuple, type(None)):
+        return (value)
+    return (copy.copy(value))
+
+
+_DROPPED = object()
+ErrorHandler = Callable[[int, Exception], None]
+
+
+def isolate(func: Callable[[Any], Any], records: List[Any],
+            on_error: ErrorHandler) -> List[Any]:
+    results = []
+    append = results.append
+    for index, data in enumerate(records):
+        try:
+            append(func(data))
+        except Exception as error:
+            on_error(index, error)
+            append(_DROPPED)
+    return (results)
+
+
+def drop_failed(batch: List[Any], origin: List[int]
+                ) -> Tuple[List[Any], List[int]]:
+    kept = [index for index, data in enumerate(batch) if data is not _DROPPED]
+    return ([batch[index] for index in kept],
+            [origin[index] for index in kept])
+
+
+def decode_json_isolated(texts: List[Any], on_error: ErrorHandler
+                         ) -> List[Any]:
+    results: List[Any] = [_DROPPED] * len(texts)
+    flat: List[int] = []
+    loads = json.loads
+    for index, text in enumerate(texts):
+        try:
+            if isinstance(text, (bytes, bytearray)):
+                text = texts[index] = text.decode()
+            if is_flat_object(text):
+                flat.append(index)
+            else:
+                results[index] = loads(text)
+        except Exception as error:
+            on_error(index, error)
+    segments = [flat]
+    while segments:
+        segment = segments.pop()
+        if len(segment) < 2:
+            isolated = isolate(loads, [texts[index] for index in segment],
+                               lambda at, error: on_error(segment[at], error))
+            for index, value in zip(segment, isolated):
+                results[index] = value
+            continue
+        parts = [texts[index] for index in segment]
+        try:
+            decoded = loads('[' + ',\n'.join(parts) + ']')
+        except ValueError as error:
+            starts = list(itertools.accumulate(
+                (len(part) + 2 for part in parts), initial=1))
+            at = min(max(bisect_right(starts, getattr(error, 'pos', 0)) - 1,
+                         0), len(segment) - 1)
+            segments.append(segment[at + 1:])
+            segments.append(segment[:at])
+            segments.append(segment[at:at + 1])
+            continue
+        if len(decoded) != len(segment):
+            decoded = isolate(loads, parts,
+                              lambda at, error: on_error(segment[at], error))
+        for index, value in zip(segment, decoded):
+            results[index] = value
+    return (results)
+
+
+class DeadLetter():
+    __slots__ = ('pipeline', 'stage', 'error_type', 'error', 'payload',
+                 'attempts', 'time')
+
+    def __init__(self, pipeline: str, stage: str, error: BaseException,
+                 payload: Any, attempts: int = 1) -> None:
+        self.pipeline = pipeline
+        self.stage = stage
+        self.error_type = type(error).__name__
+        self.error = str(error)
+        self.payload = payload
+        self.attempts = attempts
+        self.time = time.time()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return ({name: getattr(self, name) for name in self.__slots__})
+
+    def __repr__(self) -> str:
+        return (f"DeadLetter({self.stage}, {self.error_type}: {self.error}, "
+                f"{self.payload!r})")
+
+
+class DeadLetterQueue():
+    def __init__(self, capacity: int = 10000) -> None:
+        if capacity <= 0:
+            raise ValueError("Capacity should be positive!")
+        self.capacity = capacity
+        self.letters: Deque[DeadLetter] = deque(maxlen=capacity)
+        self.failures = 0
+        self.dropped = 0
+        self.retries = 0
+        self.recovered = 0
+        self.by_stage: Dict[str, int] = {}
+        self.by_error: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return (len(self.letters))
+
+    def __iter__(self) -> Iterator[DeadLetter]:
+        return (iter(self.letters))
+
+    def put(self, letter: DeadLetter) -> None:
+        if len(self.letters) == self.capacity:
+            self.dropped += 1
+        self.letters.append(letter)
+        self.failures += 1
+        self.by_stage[letter.stage] = self.by_stage.get(letter.stage, 0) + 1
+        self.by_error[letter.error_type] = \
+            self.by_error.get(letter.error_type, 0) + 1
+
+    def drain(self) -> List[DeadLetter]:
+        letters = list(self.letters)
+        self.letters.clear()
+        return (letters)
+
+    def merge(self, other: "DeadLetterQueue") -> None:
+        self.dropped += other.dropped + max(
+            len(self.letters) + len(other.letters) - self.capacity, 0)
+        self.letters.extend(other.letters)
+        self.failures += other.failures
+        self.retries += other.retries
+        self.recovered += other.recovered
+        for stage, count in other.by_stage.items():
+            self.by_stage[stage] = self.by_stage.get(stage, 0) + count
+        for error, count in other.by_error.items():
+            self.by_error[error] = self.by_error.get(error, 0) + count
+
+    def stats(self) -> Dict[str, Any]:
+        return ({
+            'queued': len(self.letters),
+            'failures': self.failures,
+            'dropped': self.dropped,
+            'retries': self.retries,
+            'recovered': self.recovered,
+            'by_stage': dict(self.by_stage),
+            'by_error': dict(self.by_error),
+            })
+
+
+class RetryPolicy():
+    def __init__(self, attempts: int = 3, backoff: float = 0.01,
+                 factor: float = 2.0, max_backoff: float = 1.0,
+                 retry_on: Tuple[Type[BaseException], ...] = (
+                     OSError, TimeoutError)) -> None:
+        if attempts <= 0:
+            raise ValueError("Attempts should be positive!")
+        if backoff < 0 or factor < 1:
+            raise ValueError("Backoff should grow from a positive delay!")
+        self.attempts = attempts
+        self.backoff = backoff
+        self.factor = factor
+        self.max_backoff = max_backoff
+        self.retry_on = retry_on
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        return (attempt < self.attempts and isinstance(error, self.retry_on))
+
+    def delay(self, attempt: int) -> float:
+        return (min(self.backoff * self.factor ** (attempt - 1),
+                    self.max_backoff))
+
+
 class InputStage():
-    def process(self, data: Any) -> Dict:
+    stateless = True
+    isolates = True
+
+    def __init__(self, sink: Optional[OutputSink] = None,
+                 decoder: str = "json") -> None:
+        if decoder not in ("json", "fast"):
+            raise ValueError("Decoder should be json or fast!")
+        self.sink = sink
+        self.loads = json.loads
+        if decoder == "fast" and orjson is not None:
+            self.loads = orjson.loads
+        self.schemas: Dict[frozenset, Tuple[Tuple[str, ...], Callable]] = {}
+        self._layouts: Dict[Tuple[str, ...], Tuple[Callable, bool]] = {}
+
+    @property
+    def cacheable(self) -> bool:
+        return (self.sink is None)
+
+    @property
+    def builds_records(self) -> bool:
+        return (bool(self.schemas) and self.loads is not json.loads)
+
+    def register_schema(self, fields: Iterable[str],
+                        factory: Callable[..., Any]) -> None:
+        fields = tuple(fields)
+        self.schemas[frozenset(fields)] = (fields, factory)
+        self._layouts = {}
+
+    def _build(self, value: Any) -> Any:
+        if type(value) is not dict:
+            return (value)
+        layout = tuple(value)
+        known = self._layouts.get(layout)
+        if known is None:
+            schema = self.schemas.get(frozenset(layout))
+            if schema is None:
+                return (value)
+            known = self._layouts[layout] = (schema[1], layout == schema[0])
+        factory, positional = known
+        if positional:
+            return (factory(*value.values()))
+        return (factory(**value))
+
+    def decode(self, data: Any) -> Any:
+        value = self.loads(data)
+        if self.builds_records:
+            return (self._build(value))
+        return (value)
+
+    def decode_many(self, texts: List[Any]) -> List[Any]:
+        if self.loads is json.loads:
+            values = decode_json_batch([
+                text.decode() if isinstance(text, (bytes, bytearray))
+                else text for text in texts
+                ])
+        else:
+            loads = self.loads
+            values = [loads(text) for text in texts]
+        if not self.builds_records:
+            return (values)
+        layouts = self._layouts
+        build = self._build
+        records = []
+        append = records.append
+        for value in values:
+            if type(value) is dict:
+                known = layouts.get(tuple(value))
+                if known is not None and known[1]:
+                    append(known[0](*value.values()))
+                    continue
+            append(build(value))
+        return (records)
+
+    def _process_batch_isolated(self, records: List[Any],
+                                on_error: ErrorHandler) -> List[Any]:
+        results: List[Any] = list(records)
+        pending: List[int] = []
+        for index, data in enumerate(records):
+            try:
+                if (
+                    isinstance(data, (bytes, bytearray))
+                    or ("msg" not in data and "csv" not in data)
+                ):
+                    pending.append(index)
+            except Exception as error:
+                on_error(index, error)
+                results[index] = _DROPPED
+        if self.sink is not None:
+            self.sink.write_many([self.message(data) for data in results
+                                  if data is not _DROPPED])
+        texts = [records[index] for index in pending]
+
+        def failed(position: int, error: Exception) -> None:
+            on_error(pending[position], error)
+        if self.loads is json.loads:
+            decoded = decode_json_isolated(texts, failed)
+        else:
+            try:
+                decoded = self.decode_many(texts)
+            except Exception:
+                decoded = isolate(self.decode, texts, failed)
+        for index, value in zip(pending, decoded):
+            results[index] = value
+        return (results)
+
+    def process_batch(self, records: List[Any],
+                      on_error: Optional[ErrorHandler] = None) -> List[Any]:
+        if on_error is not None:
+            return (self._process_batch_isolated(records, on_error))
+        results: List[Any] = list(records)
+        pending: List[int] = []
+        try:
+            for index, data in enumerate(records):
+                if (
+                    isinstance(data, (bytes, bytearray))
+                    or ("msg" not in data and "csv" not in data)
+                ):
+                    pending.append(index)
+        except Exception:
+            for index in pending:
+                self.decode(records[index])
+            raise
+        if self.sink is not None:
+            self.sink.write_many([self.message(data) for data in records])
+        decoded = self.decode_many([records[index] for index in pending])
+        for index, value in zip(pending, decoded):
+            results[index] = value
+        return (results)
+
+    def message(self, data: Any) -> str:
+        if isinstance(data, (bytes, bytearray)):
+            return (f"Input: {data.decode()}")
         if "msg" in data:
-            print(f"Input: {data['msg']}")
-            return (data)
+            return (f"Input: {data['msg']}")
         if "csv" in data:
-            print("Input: ", end="")
-            temp_buffer = data["csv"]
-            print(f'"{temp_buffer}"')
-            return (data)
-        else:
-            print(f"Input: {data}")
-            return (json.loads(data))
+            return (f'Input: "{csv_text(data["csv"])}"')
+        return (f"Input: {data}")
+
+    def process(self, data: Any) -> Dict:
+        if self.sink is not None:
+            self.sink.write(self.message(data))
+        if (
+            isinstance(data, (bytes, bytearray))
+            or ("msg" not in data and "csv" not in data)
+        ):
+            return (self.decode(data))
+        return (data)
 
 
 class TransformStage():
+    stateless = True
+    isolates = True
+
+    def __init__(self, sink: Optional[OutputSink] = None) -> None:
+        self.sink = sink
+
+    @property
+    def cacheable(self) -> bool:
+        return (self.sink is None)
+
+    def process_batch(self, records: List[Any],
+                      on_error: Optional[ErrorHandler] = None) -> List[Any]:
+        process = self.process
+        if on_error is not None:
+            return (isolate(process, records, on_error))
+        return ([process(data) for data in records])
+
+    def transform_sensor(self, data: SensorRecord) -> SensorRecord:
+        value = float(data.value)
+        if value > 23:
+            data.range = 'High range'
+        elif value == 23:
+            data.range = 'Normal range'
+        elif value < 23:
+            data.range = 'Low range'
+        if self.sink is not None:
+            self.sink.write(
+                "Transform: Enriched with metadata and validation"
+                )
+        return (data)
+
     def process(self, data: Any) -> Dict:
+        if type(data) is SensorRecord:
+            return (self.transform_sensor(data))
         if 'csv' in data:
-            action_cte = 0
-            data['csv'] = data['csv'].split(',')
+            if type(data['csv']) is str:
+                data['csv'] = data['csv'].split(',')
             if len(data['csv']) == 0:
                 raise ValueError("Error detected in Stage 2: Data is empty!")
-            for d in data['csv']:
-                if d == 'action':
-                    action_cte += 1
-            data = {'action': action_cte, 'data': data['csv']}
-            print("Transform: Parsed and structured data")
+            action_cte = data['csv'].count('action')
+            if type(data) is PipelineRecord:
+                data.data, data.csv = data.csv, None
+                data.action = action_cte
+            else:
+                data = {'action': action_cte, 'data': data['csv']}
+            if self.sink is not None:
+                self.sink.write("Transform: Parsed and structured data")
             return (data)
         elif 'msg' in data:
             data_length = len(data['data'])
             if data_length == 0:
                 raise ValueError("Error detected in Stage 2: Data is empty!")
-            for d in data['data']:
-                if type(d) is not float and type(d) is not int:
-                    raise TypeError(
-                        "Error detected in Stage 2: Invalid Data format"
-                        )
+            if not {type(d) for d in data['data']} <= {float, int}:
+                raise TypeError(
+                    "Error detected in Stage 2: Invalid Data format"
+                    )
             data['data'] = [d for d in data['data'] if d >= 0]
             data_sum = sum(data['data'])
             data.update(
                 {'len': len(data['data']), 'avg': data_sum / len(data['data'])}
                 )
-            print("Transform: Aggregated and filtered")
+            if self.sink is not None:
+                self.sink.write("Transform: Aggregated and filtered")
             return (data)
         else:
             if (
@@ -59,112 +1249,1294 @@ class TransformStage():
                 and 'value' in data
                 and 'unit' in data
             ):
-                float(data['value'])
-                if float(data['value']) > 23:
+                value = float(data['value'])
+                if value > 23:
                     data.update({'range': 'High range'})
-                if float(data['value']) == 23:
+                if value == 23:
                     data.update({'range': 'Normal range'})
-                if float(data['value']) < 23:
+                if value < 23:
                     data.update({'range': 'Low range'})
-                print("Transform: Enriched with metadata and validation")
+                if self.sink is not None:
+                    self.sink.write(
+                        "Transform: Enriched with metadata and validation"
+                        )
                 return (data)
             raise ValueError(
                 "Error detected in Stage 2: Invalid data format")
 
 
 class OutputStage():
+    stateless = True
+    isolates = True
+
+    def __init__(self, sink: Optional[OutputSink] = None) -> None:
+        self.sink = sink
+
+    @property
+    def cacheable(self) -> bool:
+        return (self.sink is None)
+
+    def process_batch(self, records: List[Any],
+                      on_error: Optional[ErrorHandler] = None) -> List[str]:
+        format_result = self.format_result
+        if on_error is not None:
+            results = isolate(format_result, records, on_error)
+            if self.sink is not None:
+                self.sink.write_many([result for result in results
+                                      if result is not _DROPPED])
+            return (results)
+        results = [format_result(data) for data in records]
+        if self.sink is not None:
+            self.sink.write_many(results)
+        return (results)
+
     def process(self, data: Any) -> str:
+        result = self.format_result(data)
+        if self.sink is not None:
+            self.sink.write(result)
+        return result
+
+    def format_result(self, data: Any) -> str:
+        if type(data) is SensorRecord:
+            return (
+                "Output: Processed temp reading: "
+                f"{data.value}{data.unit} ({data.range})"
+                )
+        if type(data) is PipelineRecord:
+            if data.action is not None:
+                return (
+                    "Output: User activity logged:"
+                    f"{data.action} actions processed"
+                    )
+            if data.len is not None:
+                return (
+                    "Output: Stream summary:"
+                    f"{data.len} readings, avg: {data.avg}C"
+                    )
         if 'action' in data:
             action = data['action']
-            result = f"Output: User activity logged:{action} actions processed"
-            print(result)
-            return result
+            return f"Output: User activity logged:{action} actions processed"
         elif 'len' in data:
             length = data['len']
             avg = data['avg']
-            result = f"Output: Stream summary:{length} readings, avg: {avg}C"
-            print(result)
-            return result
+            return f"Output: Stream summary:{length} readings, avg: {avg}C"
         else:
             value = data['value']
             unit = data['unit']
             rang = data['range']
-            result = f"Output: Processed temp reading: {value}{unit} ({rang})"
-            print(result)
-            return result
+            return f"Output: Processed temp reading: {value}{unit} ({rang})"
 
 
 class ProcessingPipeline(ABC):
     def __init__(self, pipeline_id: str) -> None:
         self.stages = []
+        self.stage_names: List[str] = []
         self.id = pipeline_id
+        self.metrics: Optional[Metrics] = None
+        self.cache: Optional[ResultCache] = None
+        self.dead_letters: Optional[DeadLetterQueue] = None
+        self.retry: Optional[RetryPolicy] = None
+        self.position = 0
 
-    def add_stage(self, stage: ProcessingStage) -> None:
+    def add_stage(self, stage: Stage) -> None:
         self.stages.append(stage)
+        self.stage_names.append(
+            f"{self.id}.{len(self.stages) - 1}:{type(stage).__name__}"
+            )
+
+    def run_stages(self, data: Any) -> Any:
+        if self.metrics is not None:
+            return (self._run_stages_timed(data))
+        for stage in self.stages:
+            data = stage.process(data)
+        return data
+
+    def _run_stages_timed(self, data: Any) -> Any:
+        metrics = self.metrics
+        for name, stage in zip(self.stage_names, self.stages):
+            stats = metrics.stage(name)
+            start = time.perf_counter_ns()
+            try:
+                data = stage.process(data)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.record(time.perf_counter_ns() - start)
+        return data
+
+    def prepare(self, data: Any) -> Any:
+        if len(self.stages) == 0:
+            raise ValueError("No Stages Added yet !")
+        return (data)
+
+    @property
+    def cacheable(self) -> bool:
+        return (len(self.stages) > 0 and all(
+            getattr(stage, "cacheable", False) for stage in self.stages
+            ))
+
+    def enable_cache(self, **options: Any) -> ResultCache:
+        if not self.cacheable:
+            raise ValueError(f"Pipeline {self.id} has uncacheable stages!")
+        self.cache = ResultCache(**options)
+        self.run = self.cache.wrap(type(self).run.__get__(self),
+                                   cached_copy)
+        return (self.cache)
+
+    def disable_cache(self) -> None:
+        self.cache = None
+        self.__dict__.pop("run", None)
+
+    def _process_batch_cached(self, records: List[Any]) -> List[Any]:
+        cache = self.cache
+        results: List[Any] = [_MISSING] * len(records)
+        pending: Dict[Any, List[int]] = {}
+        uncached: List[int] = []
+        for index, data in enumerate(records):
+            if cache.skip:
+                cache.skip -= 1
+                uncached.append(index)
+                continue
+            if not cache.cacheable(data):
+                cache.bypassed += 1
+                uncached.append(index)
+                continue
+            if data in pending:
+                pending[data].append(index)
+                cache.hits += 1
+                continue
+            result = cache.get(data, _MISSING)
+            if result is _MISSING:
+                pending[data] = [index]
+            else:
+                results[index] = cached_copy(result)
+        keys = list(pending)
+        computed = self._run_batch(
+            keys + [records[index] for index in uncached])
+        for data, result in zip(keys, computed):
+            if result is _DROPPED:
+                for index in pending[data]:
+                    results[index] = _DROPPED
+                continue
+            cache.put(data, result)
+            for index in pending[data]:
+                results[index] = cached_copy(result)
+        for index, result in zip(uncached, computed[len(keys):]):
+            results[index] = result
+        return (results)
+
+    def enable_dead_letters(self, queue: Optional[DeadLetterQueue] = None,
+                            capacity: int = 10000,
+                            retry: Optional[RetryPolicy] = None
+                            ) -> DeadLetterQueue:
+        self.dead_letters = queue if queue is not None \
+            else DeadLetterQueue(capacity)
+        self.retry = retry
+        return (self.dead_letters)
+
+    def disable_dead_letters(self) -> None:
+        self.dead_letters = None
+        self.retry = None
+
+    def failed_stage(self, error: BaseException) -> str:
+        names = {id(stage): name
+                 for name, stage in zip(self.stage_names, self.stages)}
+        trace = error.__traceback__
+        while trace is not None:
+            name = names.get(id(trace.tb_frame.f_locals.get("self")))
+            if name is not None:
+                return (name)
+            trace = trace.tb_next
+        return (f"{self.id}.prepare")
+
+    def recover(self, data: Any, error: Exception,
+                stage: Optional[str] = None) -> Any:
+        policy = self.retry
+        attempt = 1
+        while policy is not None and policy.should_retry(error, attempt):
+            delay = policy.delay(attempt)
+            if delay > 0:
+                time.sleep(delay)
+            attempt += 1
+            self.dead_letters.retries += 1
+            try:
+                result = self.run(data)
+            except Exception as retry_error:
+                error = retry_error
+                stage = None
+                continue
+            self.dead_letters.recovered += 1
+            return (result)
+        if stage is None:
+            stage = self.failed_stage(error)
+        self.dead_letters.put(DeadLetter(self.id, stage, error, data, attempt))
+        return (_DROPPED)
 
     @abstractmethod
-    def process(self, data: Any) -> Union[str, Any]:
+    def run(self, data: Any) -> Union[str, Any]:
         pass
 
+    def process(self, data: Any) -> Union[str, Any]:
+        try:
+            return (self.run(data))
+        except Exception as error:
+            if self.dead_letters is None:
+                raise
+            result = self.recover(data, error)
+        return (None if result is _DROPPED else result)
+
+    async def aprocess(self, data: Any) -> Union[str, Any]:
+        data = self.prepare(data)
+        for name, stage in zip(self.stage_names, self.stages):
+            if self.metrics is None:
+                data = await call_stage(stage, data)
+                continue
+            stats = self.metrics.stage(name)
+            start = time.perf_counter_ns()
+            try:
+                data = await call_stage(stage, data)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.record(time.perf_counter_ns() - start)
+        return data
+
+    def process_batch(self, records: Iterable[Any]) -> List[Any]:
+        if self.cache is None and self.dead_letters is None:
+            return (self._process_batch(records))
+        results = self._process_batch_slots(list(records))
+        if self.dead_letters is None:
+            return (results)
+        return ([result for result in results if result is not _DROPPED])
+
+    def _process_batch_slots(self, records: List[Any]) -> List[Any]:
+        if self.cache is not None:
+            return (self._process_batch_cached(records))
+        return (self._run_batch(records))
+
+    def _run_batch(self, records: List[Any]) -> List[Any]:
+        if self.dead_letters is not None:
+            return (self._process_batch_isolated(records))
+        return (self._process_batch(records))
+
+    def _process_batch_isolated(self, records: List[Any]) -> List[Any]:
+        results: List[Any] = [_DROPPED] * len(records)
+        origin = list(range(len(records)))
+        failed: List[Tuple[int, str, Exception]] = []
+        name = f"{self.id}.prepare"
+
+        def on_error(index: int, error: Exception) -> None:
+            failed.append((origin[index], name, error))
+
+        batch = isolate(self.prepare, records, on_error)
+        errors = 0
+        for name, stage in zip(self.stage_names, self.stages):
+            if len(failed) > errors:
+                batch, origin = drop_failed(batch, origin)
+                errors = len(failed)
+            if not batch:
+                break
+            batch = self._isolated_stage(name, stage, batch, on_error)
+        if len(failed) > errors:
+            batch, origin = drop_failed(batch, origin)
+        for index, result in zip(origin, batch):
+            results[index] = result
+        failed.sort(key=lambda failure: failure[0])
+        for index, stage_name, error in failed:
+            results[index] = self.recover(records[index], error, stage_name)
+        return (results)
+
+    def _isolated_stage(self, name: str, stage: Any, batch: List[Any],
+                        on_error: ErrorHandler) -> List[Any]:
+        start = time.perf_counter_ns()
+        errors = 0
+
+        def counted(index: int, error: Exception) -> None:
+            nonlocal errors
+            errors += 1
+            on_error(index, error)
+
+        if getattr(stage, "isolates", False):
+            results = stage.process_batch(batch, counted)
+        else:
+            results = isolate(stage.process, batch, counted)
+        if self.metrics is not None:
+            stats = self.metrics.stage(name)
+            stats.errors += errors
+            stats.record(time.perf_counter_ns() - start, len(batch))
+        return (results)
+
+    def _process_batch(self, records: Iterable[Any]) -> List[Any]:
+        prepare = self.prepare
+        batch = [prepare(data) for data in records]
+        for name, stage in zip(self.stage_names, self.stages):
+            if self.metrics is None:
+                batch = process_stage_batch(stage, batch)
+                continue
+            stats = self.metrics.stage(name)
+            size = len(batch)
+            start = time.perf_counter_ns()
+            try:
+                batch = process_stage_batch(stage, batch)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.record(time.perf_counter_ns() - start, size)
+        return (batch)
+
+    def process_stream(self, source: Iterable[Any], batch_size: int = 256,
+                       linger: Optional[float] = None,
+                       resume: bool = False) -> Iterator[Any]:
+        if resume:
+            source = itertools.islice(source, self.position, None)
+        else:
+            self.position = 0
+        for batch in micro_batches(source, batch_size, linger):
+            yield from self.process_batch(batch)
+            self.position += len(batch)
+
+    def get_state(self) -> Tuple[Any, ...]:
+        stages = tuple(
+            stage.get_state() if hasattr(stage, "get_state") else None
+            for stage in self.stages
+            )
+        return ((self.id, self.position, stages))
+
+    def set_state(self, state: Tuple[Any, ...]) -> None:
+        if state[0] != self.id or len(state[2]) != len(self.stages):
+            raise ValueError(f"State doesn't match pipeline {self.id}!")
+        self.position = state[1]
+        for stage, stage_state in zip(self.stages, state[2]):
+            if stage_state is not None and hasattr(stage, "set_state"):
+                stage.set_state(stage_state)
+
 
 class JSONAdapter(ProcessingPipeline):
     def __init__(self, pipeline_id: str) -> None:
         super().__init__(pipeline_id)
 
-    def process(self, data: Any) -> Union[str, Any]:
-        if len(self.stages) == 0:
-            raise ValueError("No Stages Added yet !")
-        for stage in self.stages:
-            data = stage.process(data)
-        return data
+    def run(self, data: Any) -> Union[str, Any]:
+        return (self.run_stages(self.prepare(data)))
+
+    def process_ndjson(self, source: Any, batch_size: int = 1024,
+                       resume: bool = False) -> Iterator[Any]:
+        return (self.process_stream(read_ndjson_lines(source), batch_size,
+                                    resume=resume))
 
 
 class CSVAdapter(ProcessingPipeline):
     def __init__(self, pipeline_id: str) -> None:
         super().__init__(pipeline_id)
 
-    def process(self, data: Any) -> Union[str, Any]:
-        if type(data) is not str:
+    def prepare(self, data: Any) -> Any:
+        if type(data) is not str and type(data) is not list:
             raise ValueError("Error: Data should be a string!")
-        data = ({'csv': data})
-        if len(self.stages) == 0:
-            raise ValueError("No Stages Added yet !")
-        for stage in self.stages:
-            data = stage.process(data)
-        return data
+        return (super().prepare(PipelineRecord(csv=data)))
+
+    def run(self, data: Any) -> Union[str, Any]:
+        return (self.run_stages(self.prepare(data)))
+
+    def process_file(self, source: Any, batch_size: int = 256,
+                     buffer_size: int = 1 << 20,
+                     delimiter: str = ',',
+                     resume: bool = False) -> Iterator[Any]:
+        rows = iter_csv_rows(source, buffer_size, delimiter)
+        return (self.process_stream(rows, batch_size, resume=resume))
 
 
 class StreamAdapter(ProcessingPipeline):
     def __init__(self, pipeline_id: str) -> None:
         super().__init__(pipeline_id)
 
-    def process(self, data: Any) -> Union[str, Any]:
+    def prepare(self, data: Any) -> Any:
         if not isinstance(data, list):
             raise TypeError("Error: Data should be a list!")
-        data = {
-            "msg": "Real-time sensor stream",
-            'data': data
-        }
-        if len(self.stages) == 0:
+        return (super().prepare(PipelineRecord(
+            msg="Real-time sensor stream",
+            data=data
+        )))
+
+    def run(self, data: Any) -> Union[str, Any]:
+        return (self.run_stages(self.prepare(data)))
+
+
+class PrepareStage():
+    stateless = True
+
+    def __init__(self, pipeline: ProcessingPipeline) -> None:
+        self.pipeline = pipeline
+
+    def process(self, data: Any) -> Any:
+        return (self.pipeline.prepare(data))
+
+
+def fuse_stages(funcs: List[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    if len(funcs) == 1:
+        return (funcs[0])
+    chain = tuple(funcs)
+
+    def fused(data: Any) -> Any:
+        for func in chain:
+            data = func(data)
+        return (data)
+    return (fused)
+
+
+class CompiledNode():
+    __slots__ = ('name', 'func', 'successors')
+
+    def __init__(self, name: str, func: Callable[[Any], Any]) -> None:
+        self.name = name
+        self.func = func
+        self.successors: Tuple[int, ...] = ()
+
+
+class CompiledGraph():
+    def __init__(self, nodes: List[CompiledNode], sources: List[int]) -> None:
+        self.nodes = nodes
+        self.sources = tuple(sources)
+        self.linear = (
+            len(nodes) == 1
+            or (len(sources) == 1
+                and all(len(node.successors) <= 1 for node in nodes))
+        )
+        self._chain = fuse_stages([node.func for node in nodes]) \
+            if self.linear else None
+
+    def run(self, data: Any) -> List[Any]:
+        if self._chain is not None:
+            return ([self._chain(data)])
+        nodes = self.nodes
+        pending: Dict[int, List[Any]] = {
+            index: [data if i == 0 else copy.copy(data)]
+            for i, index in enumerate(self.sources)
+            }
+        outputs: List[Any] = []
+        for index, node in enumerate(nodes):
+            inputs = pending.pop(index, None)
+            if inputs is None:
+                continue
+            func = node.func
+            successors = node.successors
+            for value in inputs:
+                result = func(value)
+                if not successors:
+                    outputs.append(result)
+                    continue
+                pending.setdefault(successors[0], []).append(result)
+                for successor in successors[1:]:
+                    pending.setdefault(successor, []).append(
+                        copy.copy(result))
+        return (outputs)
+
+    def process(self, data: Any) -> Any:
+        if self._chain is not None:
+            return (self._chain(data))
+        outputs = self.run(data)
+        return (outputs[0] if len(outputs) == 1 else outputs)
+
+    def process_many(self, records: Iterable[Any]) -> List[Any]:
+        process = self.process
+        return ([process(data) for data in records])
+
+
+class StageGraph():
+    def __init__(self) -> None:
+        self.nodes: Dict[str, Any] = {}
+        self.edges: Dict[str, List[str]] = {}
+
+    def add_node(self, name: str, stage: Stage) -> str:
+        if name in self.nodes:
+            raise ValueError(f"Stage {name} already exists!")
+        if not callable(getattr(stage, 'process', None)):
+            raise TypeError(f"Stage {name} has no process method!")
+        if inspect.iscoroutinefunction(stage.process):
+            raise TypeError(f"Stage {name} is async and can't be compiled!")
+        self.nodes[name] = stage
+        self.edges[name] = []
+        return (name)
+
+    def connect(self, source: str, target: str) -> None:
+        if source not in self.nodes or target not in self.nodes:
+            raise ValueError(f"Unknown stage in edge {source} -> {target}!")
+        if target not in self.edges[source]:
+            self.edges[source].append(target)
+
+    @classmethod
+    def from_pipelines(cls, pipelines: List[ProcessingPipeline]
+                       ) -> "StageGraph":
+        graph = cls()
+        previous: Optional[str] = None
+        for pipeline in pipelines:
+            if len(pipeline.stages) == 0:
+                raise ValueError("No Stages Added yet !")
+            if (
+                pipeline.dead_letters is not None
+                or pipeline.metrics is not None
+                or pipeline.cache is not None
+            ):
+                raise ValueError(
+                    f"Pipeline {pipeline.id} uses dead letters, metrics or "
+                    "a cache, which a compiled graph would bypass!")
+            names = [f"{pipeline.id}.prepare"] + pipeline.stage_names
+            stages = [PrepareStage(pipeline)] + pipeline.stages
+            for name, stage in zip(names, stages):
+                while name in graph.nodes:
+                    name = f"{name}'"
+                graph.add_node(name, stage)
+                if previous is not None:
+                    graph.connect(previous, name)
+                previous = name
+        return (graph)
+
+    def _topological_order(self) -> List[str]:
+        indegree = {name: 0 for name in self.nodes}
+        for targets in self.edges.values():
+            for target in targets:
+                indegree[target] += 1
+        ready = deque(name for name in self.nodes if indegree[name] == 0)
+        order = []
+        while ready:
+            name = ready.popleft()
+            order.append(name)
+            for target in self.edges[name]:
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    ready.append(target)
+        if len(order) != len(self.nodes):
+            raise ValueError("Stage graph has a cycle!")
+        return (order)
+
+    def compile(self) -> CompiledGraph:
+        if len(self.nodes) == 0:
             raise ValueError("No Stages Added yet !")
-        for stage in self.stages:
-            data = stage.process(data)
-        return data
+        order = self._topological_order()
+        predecessors = {name: 0 for name in self.nodes}
+        for targets in self.edges.values():
+            for target in targets:
+                predecessors[target] += 1
+        groups: List[List[str]] = []
+        group_of: Dict[str, int] = {}
+        for name in order:
+            if name in group_of:
+                continue
+            group = [name]
+            while True:
+                last = group[-1]
+                targets = self.edges[last]
+                if (
+                    len(targets) != 1
+                    or predecessors[targets[0]] != 1
+                    or not getattr(self.nodes[last], 'stateless', False)
+                    or not getattr(self.nodes[targets[0]], 'stateless',
+                                   False)
+                ):
+                    break
+                group.append(targets[0])
+            for member in group:
+                group_of[member] = len(groups)
+            groups.append(group)
+        nodes = [
+            CompiledNode("+".join(group), fuse_stages(
+                [self.nodes[name].process for name in group]))
+            for group in groups
+            ]
+        for index, group in enumerate(groups):
+            nodes[index].successors = tuple(
+                group_of[target] for target in self.edges[group[-1]]
+                )
+        sources = [
+            group_of[name] for name in order if predecessors[name] == 0
+            ]
+        return (CompiledGraph(nodes, sources))
+
+
+_DONE = object()
+
+
+class AsyncEngine():
+    def __init__(self, pipelines: List[ProcessingPipeline],
+                 queue_size: int = 128, workers: int = 16,
+                 metrics: Optional[Metrics] = None,
+                 dead_letters: Optional[DeadLetterQueue] = None,
+                 retry: Optional[RetryPolicy] = None) -> None:
+        if queue_size <= 0 or workers <= 0:
+            raise ValueError("Queue size and workers should be positive!")
+        self.steps: List[Any] = []
+        self.step_names: List[str] = []
+        self.step_pipelines: List[str] = []
+        for pipeline in pipelines:
+            self.steps.append(PrepareStage(pipeline))
+            self.step_names.append(f"{pipeline.id}.prepare")
+            self.steps.extend(pipeline.stages)
+            self.step_names.extend(pipeline.stage_names)
+            self.step_pipelines.extend(
+                [pipeline.id] * (len(pipeline.stages) + 1))
+        if len(self.steps) == 0:
+            raise ValueError("No Pipelines Added yet !")
+        self.queue_size = queue_size
+        self.workers = workers
+        self.metrics = metrics
+        self.dead_letters = dead_letters
+        self.retry = retry
+        self.processed = 0
+
+    async def _feed(self, source: Union[Iterable, AsyncIterable],
+                    queue: asyncio.Queue) -> None:
+        if hasattr(source, '__aiter__'):
+            async for data in source:
+                await queue.put(data)
+        else:
+            for data in source:
+                await queue.put(data)
+        for _ in range(self.workers):
+            await queue.put(_DONE)
+
+    async def _call_timed(self, step: int, stage: Any, data: Any,
+                          inbox: asyncio.Queue) -> Any:
+        name = self.step_names[step]
+        self.metrics.set_gauge(f"queue.{name}", inbox.qsize())
+        stats = self.metrics.stage(name)
+        start = time.perf_counter_ns()
+        try:
+            return (await call_stage(stage, data))
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.record(time.perf_counter_ns() - start)
+
+    async def _call(self, step: int, stage: Any, data: Any,
+                    inbox: asyncio.Queue) -> Any:
+        if self.metrics is None:
+            return (await call_stage(stage, data))
+        return (await self._call_timed(step, stage, data, inbox))
+
+    async def _recover(self, step: int, stage: Any, data: Any,
+                       inbox: asyncio.Queue, error: Exception) -> Any:
+        policy = self.retry
+        attempt = 1
+        while policy is not None and policy.should_retry(error, attempt):
+            await asyncio.sleep(policy.delay(attempt))
+            attempt += 1
+            self.dead_letters.retries += 1
+            try:
+                result = await self._call(step, stage, data, inbox)
+            except Exception as retry_error:
+                error = retry_error
+                continue
+            self.dead_letters.recovered += 1
+            return (result)
+        self.dead_letters.put(DeadLetter(
+            self.step_pipelines[step], self.step_names[step], error, data,
+            attempt))
+        return (_DROPPED)
+
+    async def _work(self, step: int, inbox: asyncio.Queue,
+                    outbox: Optional[asyncio.Queue],
+                    sink: Optional[Callable[[Any], Any]]) -> None:
+        stage = self.steps[step]
+        while True:
+            data = await inbox.get()
+            if data is _DONE:
+                return
+            try:
+                data = await self._call(step, stage, data, inbox)
+            except Exception as error:
+                if self.dead_letters is None:
+                    raise
+                data = await self._recover(step, stage, data, inbox, error)
+                if data is _DROPPED:
+                    continue
+            if outbox is not None:
+                await outbox.put(data)
+                continue
+            self.processed += 1
+            if sink is not None:
+                result = sink(data)
+                if inspect.isawaitable(result):
+                    await result
+
+    async def _run_step(self, step: int, inbox: asyncio.Queue,
+                        outbox: Optional[asyncio.Queue],
+                        sink: Optional[Callable[[Any], Any]]) -> None:
+        await asyncio.gather(*(
+            self._work(step, inbox, outbox, sink)
+            for _ in range(self.workers)
+            ))
+        if outbox is not None:
+            for _ in range(self.workers):
+                await outbox.put(_DONE)
+
+    async def run(self, source: Union[Iterable, AsyncIterable],
+                  sink: Optional[Callable[[Any], Union[Any, Awaitable]]]
+                  = None) -> int:
+        self.processed = 0
+        queues = [asyncio.Queue(self.queue_size) for _ in self.steps]
+        tasks = [
+            asyncio.ensure_future(self._run_step(
+                i, queues[i],
+                queues[i + 1] if i + 1 < len(queues) else None, sink))
+            for i in range(len(self.steps))
+            ]
+        tasks.append(asyncio.ensure_future(self._feed(source, queues[0])))
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return (self.processed)
+
+
+class StateUnpickler(pickle.Unpickler):
+    def find_class(self, module: str, name: str) -> Any:
+        raise pickle.UnpicklingError(
+            f"Checkpoint states can't reference {module}.{name}!")
+
+
+class PipelineCheckpoint():
+    MAGIC = b"NXPC"
+    VERSION = 1
+    HEADER = struct.Struct('<4sHI')
+
+    def __init__(self, manager: "NexusManager", path: str,
+                 interval: Optional[float] = None) -> None:
+        if interval is not None and interval < 0:
+            raise ValueError("Interval should be positive!")
+        self.manager = manager
+        self.path = path
+        self.interval = interval
+        self.last_saved = time.monotonic()
+        self.saves = 0
+        self.size = 0
+
+    def save(self) -> int:
+        manager = self.manager
+        metrics = manager.metrics
+        state = (
+            manager.position,
+            tuple(pipeline.get_state() for pipeline in manager.pipelines),
+            None if metrics is None else metrics.get_state(),
+            )
+        body = pickle.dumps(state, pickle.HIGHEST_PROTOCOL)
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(self.HEADER.pack(self.MAGIC, self.VERSION, len(body)))
+            file.write(body)
+            file.flush()
+            os.fsync(file.fileno())
+            self.size = file.tell()
+        os.replace(temp_path, self.path)
+        self.last_saved = time.monotonic()
+        self.saves += 1
+        return (self.size)
+
+    def maybe_save(self) -> bool:
+        if (
+            self.interval is None
+            or time.monotonic() - self.last_saved < self.interval
+        ):
+            return (False)
+        self.save()
+        return (True)
+
+    def restore(self) -> None:
+        manager = self.manager
+        with open(self.path, "rb") as file:
+            data = file.read()
+        try:
+            magic, version, length = self.HEADER.unpack_from(data, 0)
+            if (
+                magic != self.MAGIC
+                or version != self.VERSION
+                or len(data) != self.HEADER.size + length
+            ):
+                raise ValueError()
+            file = io.BytesIO(data)
+            file.seek(self.HEADER.size)
+            position, pipelines, metrics = StateUnpickler(file).load()
+        except (struct.error, pickle.UnpicklingError, ValueError, EOFError):
+            raise ValueError(f"Invalid pipeline checkpoint: {self.path}")
+        if len(pipelines) != len(manager.pipelines):
+            raise ValueError("Checkpoint doesn't match the pipelines!")
+        for pipeline, state in zip(manager.pipelines, pipelines):
+            pipeline.set_state(state)
+        if metrics is not None and manager.metrics is not None:
+            manager.metrics.set_state(metrics)
+        manager.position = position
+
+
+class SharedRing():
+    HEADER = struct.Struct('<QQQ')
+    FRAME = struct.Struct('<I')
+    WRAP = 0xFFFFFFFF
+    OFFSET = 64
+
+    def __init__(self, size: int = 1 << 23, name: Optional[str] = None,
+                 items: Any = None) -> None:
+        self.owner = name is None
+        self.items = items
+        if self.owner:
+            if size < 1024:
+                raise ValueError("Ring size should be at least 1024 bytes!")
+            self.shm = shared_memory.SharedMemory(create=True,
+                                                  size=size + self.OFFSET)
+            self.HEADER.pack_into(self.shm.buf, 0, 0, 0, size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.capacity = self.HEADER.unpack_from(self.shm.buf, 0)[2]
+        self.name = self.shm.name
+
+    def check(self, data: bytes) -> int:
+        frame = self.FRAME.size + len(data)
+        if frame > self.capacity // 2:
+            raise ValueError("Message is larger than half the ring buffer!")
+        return (frame)
+
+    def put(self, data: bytes, idle: Optional[Callable[[], Any]] = None
+            ) -> None:
+        capacity = self.capacity
+        frame = self.check(data)
+        buf = self.shm.buf
+        delay = 0.00005
+        while True:
+            write, read, _ = self.HEADER.unpack_from(buf, 0)
+            offset = write % capacity
+            tail = capacity - offset
+            need = frame if frame <= tail else tail + frame
+            if capacity - (write - read) >= need:
+                break
+            if idle is not None:
+                idle()
+            time.sleep(delay)
+            delay = min(delay * 2, 0.002)
+        base = self.OFFSET
+        if frame > tail:
+            if tail >= self.FRAME.size:
+                self.FRAME.pack_into(buf, base + offset, self.WRAP)
+            write += tail
+            offset = 0
+        start = base + offset + self.FRAME.size
+        self.FRAME.pack_into(buf, base + offset, len(data))
+        buf[start:start + len(data)] = data
+        struct.pack_into('<Q', buf, 0, write + frame)
+        self.items.release()
+
+    def get(self, timeout: Optional[float] = None) -> Optional[bytes]:
+        if not self.items.acquire(timeout=timeout):
+            return (None)
+        return (self._read())
+
+    def poll(self) -> Optional[bytes]:
+        if not self.items.acquire(False):
+            return (None)
+        return (self._read())
+
+    def _read(self) -> bytes:
+        buf = self.shm.buf
+        capacity = self.capacity
+        read = struct.unpack_from('<Q', buf, 8)[0]
+        offset = read % capacity
+        tail = capacity - offset
+        base = self.OFFSET
+        if (
+            tail < self.FRAME.size
+            or self.FRAME.unpack_from(buf, base + offset)[0] == self.WRAP
+        ):
+            read += tail
+            offset = 0
+        (length,) = self.FRAME.unpack_from(buf, base + offset)
+        start = base + offset + self.FRAME.size
+        data = bytes(buf[start:start + length])
+        struct.pack_into('<Q', buf, 8, read + self.FRAME.size + length)
+        return (data)
+
+    def close(self) -> None:
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def pack_records(records: List[Any]) -> bytes:
+    if all(type(data) is str for data in records):
+        text = "\x00".join(records)
+        if text.count("\x00") == max(len(records) - 1, 0):
+            return (b"S" + struct.pack('<I', len(records)) + text.encode())
+    return (b"P" + pickle.dumps(records, pickle.HIGHEST_PROTOCOL))
+
+
+def pack_error(error: BaseException) -> bytes:
+    try:
+        return (b"E" + pickle.dumps(error, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return (b"E" + pickle.dumps(RuntimeError(repr(error))))
+
+
+def pack_slots(results: List[Any], letters: DeadLetterQueue) -> bytes:
+    kept = [index for index, result in enumerate(results)
+            if result is not _DROPPED]
+    return (b"D" + pickle.dumps((kept, [results[index] for index in kept],
+                                 letters), pickle.HIGHEST_PROTOCOL))
+
+
+def unpack_slots(data: bytes) -> Tuple[List[int], List[Any],
+                                       DeadLetterQueue]:
+    if data[:1] == b"D":
+        return (pickle.loads(memoryview(data)[1:]))
+    unpack_records(data)
+    raise ValueError("Unknown shard message!")
+
+
+def unpack_records(data: bytes) -> List[Any]:
+    tag = data[:1]
+    if tag == b"S":
+        if struct.unpack_from('<I', data, 1)[0] == 0:
+            return ([])
+        return (data[5:].decode().split("\x00"))
+    if tag == b"P":
+        return (pickle.loads(memoryview(data)[1:]))
+    if tag == b"E":
+        raise pickle.loads(memoryview(data)[1:])
+    raise ValueError("Unknown shard message!")
+
+
+def shard_key(data: Any) -> Any:
+    if isinstance(data, str):
+        if data.startswith('{'):
+            start = data.find('"sensor"')
+            if start < 0:
+                return (None)
+            start = data.find(':', start) + 1
+            end = data.find(',', start)
+            if end < 0:
+                end = data.find('}', start)
+            return (data[start:end].strip())
+        return (data.split(',', 1)[0])
+    if isinstance(data, (dict, SensorRecord)) and 'sensor' in data:
+        return (data['sensor'])
+    return (None)
+
+
+def shard_worker(manager: "NexusManager", inbox_name: str, inbox_items: Any,
+                 outbox_name: str, outbox_items: Any) -> None:
+    inbox = SharedRing(name=inbox_name, items=inbox_items)
+    outbox = SharedRing(name=outbox_name, items=outbox_items)
+    try:
+        while True:
+            data = inbox.get()
+            if not data:
+                break
+            try:
+                letters = manager.dead_letters
+                if letters is None:
+                    reply = pack_records(
+                        manager.process_batch(unpack_records(data)))
+                else:
+                    manager.enable_dead_letters(letters.capacity,
+                                                manager.retry)
+                    reply = pack_slots(
+                        manager._process_batch_slots(unpack_records(data)),
+                        manager.dead_letters)
+                outbox.put(reply)
+            except Exception as error:
+                outbox.put(pack_error(error))
+    finally:
+        inbox.close()
+        outbox.close()
+
+
+class ShardedNexus():
+    def __init__(self, manager: "NexusManager",
+                 workers: Optional[int] = None,
+                 key: Callable[[Any], Any] = shard_key,
+                 ring_size: int = 1 << 23, depth: int = 4) -> None:
+        if depth <= 0:
+            raise ValueError("Depth should be positive!")
+        self.manager = manager
+        self.workers = workers or os.cpu_count() or 1
+        self.key = key
+        self.ring_size = ring_size
+        self.depth = depth
+        self.processes: List[Any] = []
+        self.inputs: List[SharedRing] = []
+        self.outputs: List[SharedRing] = []
+        self.pending: List[Deque[bytes]] = []
+        self.letters: Optional[DeadLetterQueue] = None
+        self._next = 0
+
+    def start(self) -> "ShardedNexus":
+        if self.processes:
+            return (self)
+        letters = self.manager.dead_letters
+        if any(pipeline.dead_letters is not letters
+               for pipeline in self.manager.pipelines):
+            raise ValueError("Dead letters should be enabled on the manager "
+                             "to shard it!")
+        self.letters = letters
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context(
+            "fork" if "fork" in methods else "spawn")
+        for _ in range(self.workers):
+            inbox = SharedRing(self.ring_size, items=context.Semaphore(0))
+            outbox = SharedRing(self.ring_size, items=context.Semaphore(0))
+            process = context.Process(
+                target=shard_worker,
+                args=(self.manager, inbox.name, inbox.items,
+                      outbox.name, outbox.items),
+                daemon=True)
+            process.start()
+            self.processes.append(process)
+            self.inputs.append(inbox)
+            self.outputs.append(outbox)
+            self.pending.append(deque())
+        return (self)
+
+    def close(self) -> None:
+        for inbox, process in zip(self.inputs, self.processes):
+            if process.is_alive():
+                inbox.put(b"", self._drain)
+        for process in self.processes:
+            process.join()
+        for ring in self.inputs + self.outputs:
+            ring.close()
+        self.processes = []
+        self.inputs = []
+        self.outputs = []
+        self.pending = []
+
+    def __enter__(self) -> "ShardedNexus":
+        return (self.start())
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        for pending, outbox in zip(self.pending, self.outputs):
+            data = outbox.poll()
+            while data is not None:
+                pending.append(data)
+                data = outbox.poll()
+
+    def _send(self, records: List[Any]) -> List[Tuple[int, List[int]]]:
+        workers = self.workers
+        key = self.key
+        shards: List[List[int]] = [[] for _ in range(workers)]
+        for position, data in enumerate(records):
+            value = key(data)
+            if value is None:
+                index = self._next
+                self._next = (index + 1) % workers
+            else:
+                index = hash(value) % workers
+            shards[index].append(position)
+        payloads = [
+            (worker, positions, pack_records([records[p] for p in positions]))
+            for worker, positions in enumerate(shards) if positions
+            ]
+        for worker, _, payload in payloads:
+            self.inputs[worker].check(payload)
+        layout: List[Tuple[int, List[int]]] = []
+        try:
+            for worker, positions, payload in payloads:
+                self.inputs[worker].put(payload, self._drain)
+                layout.append((worker, positions))
+        except BaseException:
+            self._discard(layout)
+            raise
+        return (layout)
+
+    def _discard(self, layout: List[Tuple[int, List[int]]]) -> None:
+        for worker, _ in layout:
+            try:
+                self._receive(worker)
+            except Exception:
+                pass
+
+    def _receive(self, worker: int) -> bytes:
+        pending = self.pending[worker]
+        if pending:
+            return (pending.popleft())
+        while True:
+            data = self.outputs[worker].get(timeout=0.5)
+            if data is not None:
+                return (data)
+            if not self.processes[worker].is_alive():
+                raise RuntimeError(f"Shard worker {worker} died!")
+
+    def _collect(self, size: int, layout: List[Tuple[int, List[int]]]
+                 ) -> List[Any]:
+        letters = self.letters
+        results: List[Any] = [_DROPPED] * size
+        failure: Optional[BaseException] = None
+        for worker, positions in layout:
+            try:
+                if letters is None:
+                    replies = unpack_records(self._receive(worker))
+                else:
+                    kept, replies, shard_letters = unpack_slots(
+                        self._receive(worker))
+                    letters.merge(shard_letters)
+                    positions = [positions[index] for index in kept]
+            except Exception as error:
+                failure = failure or error
+                continue
+            for position, result in zip(positions, replies):
+                results[position] = result
+        if failure is not None:
+            raise failure
+        if letters is None:
+            return (results)
+        return ([result for result in results if result is not _DROPPED])
+
+    def process_batch(self, records: Iterable[Any]) -> List[Any]:
+        records = list(records)
+        self.start()
+        return (self._collect(len(records), self._send(records)))
+
+    def process_stream(self, source: Iterable[Any], batch_size: int = 1024,
+                       linger: Optional[float] = None) -> Iterator[Any]:
+        self.start()
+        inflight: Deque[Tuple[int, List[Tuple[int, List[int]]]]] = deque()
+        try:
+            for batch in micro_batches(source, batch_size, linger):
+                inflight.append((len(batch), self._send(batch)))
+                if len(inflight) >= self.depth:
+                    yield from self._collect(*inflight.popleft())
+            while inflight:
+                yield from self._collect(*inflight.popleft())
+        finally:
+            while inflight:
+                try:
+                    self._collect(*inflight.popleft())
+                except Exception:
+                    pass
 
 
 class NexusManager():
     def __init__(self):
         self.pipelines = []
+        self.metrics: Optional[Metrics] = None
+        self.checkpoint: Optional[PipelineCheckpoint] = None
+        self.dead_letters: Optional[DeadLetterQueue] = None
+        self.retry: Optional[RetryPolicy] = None
+        self.position = 0
 
     def add_pipeline(self, pipeline: ProcessingPipeline) -> ProcessingPipeline:
         if not isinstance(pipeline, ProcessingPipeline):
             raise TypeError("Pipeline Entered Is Invalid!")
         self.pipelines.append(pipeline)
+        if self.metrics is not None:
+            pipeline.metrics = self.metrics
+        if self.dead_letters is not None:
+            pipeline.enable_dead_letters(self.dead_letters, retry=self.retry)
         return (pipeline)
 
+    def enable_metrics(self, metrics: Optional[Metrics] = None) -> Metrics:
+        self.metrics = metrics if metrics is not None else Metrics()
+        for pipeline in self.pipelines:
+            pipeline.metrics = self.metrics
+        return (self.metrics)
+
+    def disable_metrics(self) -> None:
+        self.metrics = None
+        for pipeline in self.pipelines:
+            pipeline.metrics = None
+
+    def enable_dead_letters(self, capacity: int = 10000,
+                            retry: Optional[RetryPolicy] = None
+                            ) -> DeadLetterQueue:
+        self.dead_letters = DeadLetterQueue(capacity)
+        self.retry = retry
+        for pipeline in self.pipelines:
+            pipeline.enable_dead_letters(self.dead_letters, retry=retry)
+        return (self.dead_letters)
+
+    def disable_dead_letters(self) -> None:
+        self.dead_letters = None
+        self.retry = None
+        for pipeline in self.pipelines:
+            pipeline.disable_dead_letters()
+
+    def compile(self) -> CompiledGraph:
+        return (StageGraph.from_pipelines(self.pipelines).compile())
+
+    def enable_checkpoint(self, path: str, interval: Optional[float] = None
+                          ) -> PipelineCheckpoint:
+        self.checkpoint = PipelineCheckpoint(self, path, interval)
+        return (self.checkpoint)
+
+    def restore(self, path: str, interval: Optional[float] = None) -> None:
+        self.enable_checkpoint(path, interval).restore()
+
+    def shard(self, workers: Optional[int] = None,
+              **options: Any) -> ShardedNexus:
+        return (ShardedNexus(self, workers, **options).start())
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = {} if self.metrics is None else self.metrics.snapshot()
+        if self.dead_letters is not None:
+            stats["dead_letters"] = self.dead_letters.stats()
+        return (stats)
+
     def process_data(self, data: Any) -> None:
         for pipeline in self.pipelines:
             data = pipeline.process(data)
+            if data is None and pipeline.dead_letters is not None:
+                return
+
+    def process_batch(self, records: Iterable[Any]) -> List[Any]:
+        batch = list(records)
+        for pipeline in self.pipelines:
+            batch = pipeline.process_batch(batch)
+        return (batch)
+
+    def _process_batch_slots(self, records: List[Any]) -> List[Any]:
+        results: List[Any] = [_DROPPED] * len(records)
+        origin = list(range(len(records)))
+        batch = records
+        for pipeline in self.pipelines:
+            batch = pipeline._process_batch_slots(batch)
+            if pipeline.dead_letters is not None:
+                batch, origin = drop_failed(batch, origin)
+        for index, result in zip(origin, batch):
+            results[index] = result
+        return (results)
+
+    def process_stream(self, source: Iterable[Any], batch_size: int = 256,
+                       linger: Optional[float] = None,
+                       resume: bool = False) -> Iterator[Any]:
+        if resume:
+            source = itertools.islice(source, self.position, None)
+        else:
+            self.position = 0
+        for batch in micro_batches(source, batch_size, linger):
+            yield from self.process_batch(batch)
+            self.position += len(batch)
+            if self.checkpoint is not None:
+                self.checkpoint.maybe_save()
+
+    async def aprocess_stream(self, source: AsyncIterable[Any],
+                              batch_size: int = 256,
+                              linger: Optional[float] = None
+                              ) -> AsyncIterator[Any]:
+        async for batch in amicro_batches(source, batch_size, linger):
+            for result in self.process_batch(batch):
+                yield result
+
+    async def aprocess_data(self, data: Any) -> Any:
+        for pipeline in self.pipelines:
+            data = await pipeline.aprocess(data)
+        return (data)
+
+    async def arun(self, source: Union[Iterable, AsyncIterable],
+                   sink: Optional[Callable[[Any], Any]] = None,
+                   queue_size: int = 128, workers: int = 16) -> int:
+        engine = AsyncEngine(self.pipelines, queue_size, workers,
+                             self.metrics, self.dead_letters, self.retry)
+        return (await engine.run(source, sink))
 
 
 if __name__ == "__main__":
@@ -176,9 +2548,10 @@ if __name__ == "__main__":
         manager = NexusManager()
         print()
         print("Creating Data Processing Pipeline...")
-        stage_1 = InputStage()
-        stage_2 = TransformStage()
-        stage_3 = OutputStage()
+        console = StreamSink()
+        stage_1 = InputStage(console)
+        stage_2 = TransformStage(console)
+        stage_3 = OutputStage(console)
         pipeline_1 = manager.add_pipeline(JSONAdapter("pip_01"))
         pipeline_2 = manager.add_pipeline(CSVAdapter("pip_02"))
         pipeline_3 = manager.add_pipeline(StreamAdapter("pip_03"))